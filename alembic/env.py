@@ -1,7 +1,8 @@
 """Alembic environment configuration for Vote Match."""
 
+from functools import lru_cache
 from logging.config import fileConfig
-from sqlalchemy import engine_from_config, pool
+from sqlalchemy import Connection, engine_from_config, pool
 from alembic import context
 
 # Import Vote Match components
@@ -22,35 +23,35 @@ target_metadata = Base.metadata
 settings = get_settings()
 config.set_main_option("sqlalchemy.url", settings.database_url)
 
+# Table prefixes that belong to other applications sharing the database
+IGNORE_PREFIXES = (
+    "auth_",
+    "django_",
+    "wagtail",
+    "taggit_",
+    "world_",
+    "checkin_",
+    "public",  # Ignore 'public' table if it exists
+)
+
+
+@lru_cache(maxsize=4096)
+def _should_include(type_: str, name: str | None) -> bool:
+    """Decide whether an object is managed by Vote Match (memoized per name)."""
+    # Ignore tables with non-project prefixes and the alembic_version table
+    # (managed by Alembic itself)
+    if type_ == "table" and (name == "alembic_version" or name.startswith(IGNORE_PREFIXES)):
+        return False
+
+    return True
+
 
 def include_object(_object, name, type_, _reflected, _compare_to):
     """Filter out Django/Wagtail tables and other non-project tables.
 
     Only include tables that are defined in our Vote Match models.
     """
-    # List of table prefixes to ignore
-    ignore_prefixes = [
-        "auth_",
-        "django_",
-        "wagtail",
-        "taggit_",
-        "world_",
-        "checkin_",
-        "public",  # Ignore 'public' table if it exists
-    ]
-
-    # For tables, check if they should be included
-    if type_ == "table":
-        # Ignore tables with specific prefixes
-        for prefix in ignore_prefixes:
-            if name.startswith(prefix):
-                return False
-
-        # Ignore alembic_version table (managed by Alembic itself)
-        if name == "alembic_version":
-            return False
-
-    return True
+    return _should_include(type_, name)
 
 
 def run_migrations_offline() -> None:
@@ -64,7 +65,22 @@ def run_migrations_offline() -> None:
         include_schemas=False,
         include_object=include_object,
         compare_type=True,
-        compare_server_default=True,
+        compare_server_default=settings.alembic_compare_server_default,
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def _run_with_connection(connection: Connection) -> None:
+    """Configure the migration context on an open connection and run migrations."""
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        include_schemas=False,
+        include_object=include_object,
+        compare_type=True,
+        compare_server_default=settings.alembic_compare_server_default,
     )
 
     with context.begin_transaction():
@@ -72,7 +88,17 @@ def run_migrations_offline() -> None:
 
 
 def run_migrations_online() -> None:
-    """Run migrations in 'online' mode."""
+    """Run migrations in 'online' mode.
+
+    If the caller put an open connection in ``config.attributes["connection"]``
+    it is reused, so the application's pool serves migrations too. Otherwise a
+    single unpooled connection is opened for the run.
+    """
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        _run_with_connection(connection)
+        return
+
     connectable = engine_from_config(
         config.get_section(config.config_ini_section, {}),
         prefix="sqlalchemy.",
@@ -80,17 +106,7 @@ def run_migrations_online() -> None:
     )
 
     with connectable.connect() as connection:
-        context.configure(
-            connection=connection,
-            target_metadata=target_metadata,
-            include_schemas=False,
-            include_object=include_object,
-            compare_type=True,
-            compare_server_default=True,
-        )
-
-        with context.begin_transaction():
-            context.run_migrations()
+        _run_with_connection(connection)
 
 
 if context.is_offline_mode():
@@ -0,0 +1,35 @@
+"""fix: remove redundant single-column voter_district_assignments indexes
+
+Revision ID: d4e5f6a7b8c9
+Revises: b53ae1b6eba4
+Create Date: 2026-02-10 13:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from vote_match.migration_ops import create_index_concurrently, drop_index_concurrently
+
+# revision identifiers, used by Alembic.
+revision: str = "d4e5f6a7b8c9"
+down_revision: Union[str, Sequence[str], None] = "b53ae1b6eba4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Remove single-column indexes covered by the composite indexes.
+
+    - idx_vda_voter (voter_id) is covered by idx_vda_voter_mismatch (voter_id, is_mismatch)
+    - idx_vda_type (district_type) is covered by idx_vda_type_mismatch (district_type, is_mismatch)
+
+    Dropping them saves two index updates per row written to voter_district_assignments.
+    """
+    drop_index_concurrently("idx_vda_voter", "voter_district_assignments")
+    drop_index_concurrently("idx_vda_type", "voter_district_assignments")
+
+
+def downgrade() -> None:
+    """Restore the single-column indexes."""
+    create_index_concurrently("idx_vda_type", "voter_district_assignments", ["district_type"])
+    create_index_concurrently("idx_vda_voter", "voter_district_assignments", ["voter_id"])
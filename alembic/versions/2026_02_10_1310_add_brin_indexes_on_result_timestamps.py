@@ -0,0 +1,46 @@
+"""Add BRIN indexes on geocode_results.geocoded_at and voter_district_assignments.compared_at
+
+Revision ID: e5f6a7b8c9d0
+Revises: d4e5f6a7b8c9
+Create Date: 2026-02-10 13:10:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from vote_match.migration_ops import create_index_concurrently, drop_index_concurrently
+
+# revision identifiers, used by Alembic.
+revision: str = "e5f6a7b8c9d0"
+down_revision: Union[str, Sequence[str], None] = "d4e5f6a7b8c9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add BRIN indexes for timestamp range queries.
+
+    Both tables are written in bulk in timestamp order, so a BRIN index (min/max
+    per block range) serves range filters at a tiny fraction of a B-tree's size
+    and maintenance cost.
+    """
+    create_index_concurrently(
+        "idx_geocode_results_geocoded_at_brin",
+        "geocode_results",
+        ["geocoded_at"],
+        postgresql_using="brin",
+        postgresql_with={"pages_per_range": 32},
+    )
+    create_index_concurrently(
+        "idx_vda_compared_at_brin",
+        "voter_district_assignments",
+        ["compared_at"],
+        postgresql_using="brin",
+        postgresql_with={"pages_per_range": 32},
+    )
+
+
+def downgrade() -> None:
+    """Remove the BRIN timestamp indexes."""
+    drop_index_concurrently("idx_vda_compared_at_brin", "voter_district_assignments")
+    drop_index_concurrently("idx_geocode_results_geocoded_at_brin", "geocode_results")
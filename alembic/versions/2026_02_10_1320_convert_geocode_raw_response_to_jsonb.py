@@ -0,0 +1,57 @@
+"""Convert geocode_results.raw_response to JSONB
+
+Revision ID: f6a7b8c9d0e1
+Revises: e5f6a7b8c9d0
+Create Date: 2026-02-10 13:20:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from vote_match.migration_ops import create_index_concurrently, drop_index_concurrently
+
+# revision identifiers, used by Alembic.
+revision: str = "f6a7b8c9d0e1"
+down_revision: Union[str, Sequence[str], None] = "e5f6a7b8c9d0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Store raw_response as JSONB and index it for containment queries.
+
+    JSONB is stored pre-parsed, so field extraction (raw_response->>'...')
+    no longer reparses the document, and it supports GIN indexing.
+    """
+    op.alter_column(
+        "geocode_results",
+        "raw_response",
+        existing_type=postgresql.JSON(astext_type=sa.Text()),
+        type_=postgresql.JSONB(astext_type=sa.Text()),
+        existing_nullable=True,
+        postgresql_using="raw_response::jsonb",
+    )
+    create_index_concurrently(
+        "idx_geocode_results_raw_response_gin",
+        "geocode_results",
+        ["raw_response"],
+        postgresql_using="gin",
+        postgresql_ops={"raw_response": "jsonb_path_ops"},
+    )
+
+
+def downgrade() -> None:
+    """Revert raw_response to plain JSON."""
+    drop_index_concurrently("idx_geocode_results_raw_response_gin", "geocode_results")
+    op.alter_column(
+        "geocode_results",
+        "raw_response",
+        existing_type=postgresql.JSONB(astext_type=sa.Text()),
+        type_=postgresql.JSON(astext_type=sa.Text()),
+        existing_nullable=True,
+        postgresql_using="raw_response::json",
+    )
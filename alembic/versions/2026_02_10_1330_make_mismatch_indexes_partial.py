@@ -0,0 +1,46 @@
+"""Make district mismatch indexes partial on TRUE rows
+
+Revision ID: a7b8c9d0e1f2
+Revises: f6a7b8c9d0e1
+Create Date: 2026-02-10 13:30:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from vote_match.migration_ops import create_index_concurrently, drop_index_concurrently
+
+# revision identifiers, used by Alembic.
+revision: str = "a7b8c9d0e1f2"
+down_revision: Union[str, Sequence[str], None] = "f6a7b8c9d0e1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index name, table, column)
+MISMATCH_INDEXES = [
+    ("ix_voters_district_mismatch", "voters", "district_mismatch"),
+    ("idx_vda_mismatch", "voter_district_assignments", "is_mismatch"),
+]
+
+
+def upgrade() -> None:
+    """Rebuild the boolean mismatch indexes as partial indexes on TRUE rows.
+
+    The flags are only ever filtered for mismatches, so indexing NULL/False
+    rows is wasted space and write cost. The composite idx_vda_*_mismatch
+    indexes stay full because they also serve voter_id / district_type lookups.
+    """
+    for index_name, table_name, column in MISMATCH_INDEXES:
+        drop_index_concurrently(index_name, table_name)
+        create_index_concurrently(
+            index_name, table_name, [column], postgresql_where=sa.text(f"{column} = true")
+        )
+
+
+def downgrade() -> None:
+    """Restore the full boolean mismatch indexes."""
+    for index_name, table_name, column in MISMATCH_INDEXES:
+        drop_index_concurrently(index_name, table_name)
+        create_index_concurrently(index_name, table_name, [column])
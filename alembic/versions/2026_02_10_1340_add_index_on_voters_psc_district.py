@@ -0,0 +1,29 @@
+"""Add index on voters.psc_district
+
+Revision ID: b8c9d0e1f2a3
+Revises: a7b8c9d0e1f2
+Create Date: 2026-02-10 13:40:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+from vote_match.migration_ops import create_index_concurrently, drop_index_concurrently
+
+# revision identifiers, used by Alembic.
+revision: str = "b8c9d0e1f2a3"
+down_revision: Union[str, Sequence[str], None] = "a7b8c9d0e1f2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index psc_district so filtering voters by PSC district avoids a seq scan."""
+    create_index_concurrently(op.f("ix_voters_psc_district"), "voters", ["psc_district"])
+
+
+def downgrade() -> None:
+    """Remove the psc_district index."""
+    drop_index_concurrently(op.f("ix_voters_psc_district"), "voters")
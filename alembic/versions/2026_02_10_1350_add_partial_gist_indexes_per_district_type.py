@@ -0,0 +1,49 @@
+"""Add per-district-type partial GiST indexes on district_boundaries.geom
+
+Revision ID: c9d0e1f2a3b4
+Revises: b8c9d0e1f2a3
+Create Date: 2026-02-10 13:50:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from vote_match.migration_ops import create_index_concurrently, drop_index_concurrently
+
+# revision identifiers, used by Alembic.
+revision: str = "c9d0e1f2a3b4"
+down_revision: Union[str, Sequence[str], None] = "b8c9d0e1f2a3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Kept in sync with vote_match.models.PARTIAL_GEOM_INDEX_TYPES at the time of writing
+DISTRICT_TYPES = ("county", "county_precinct", "state_senate", "state_house", "psc")
+
+
+def upgrade() -> None:
+    """Add partial GiST indexes so type-scoped ST_Within lookups search a smaller tree.
+
+    The full idx_district_boundary_geom index is kept for the remaining types.
+    """
+    for district_type in DISTRICT_TYPES:
+        create_index_concurrently(
+            f"idx_district_boundary_geom_{district_type}",
+            "district_boundaries",
+            ["geom"],
+            postgresql_using="gist",
+            postgresql_with={"fillfactor": 90},
+            postgresql_where=sa.text(f"district_type = '{district_type}'"),
+        )
+    # Refresh statistics so the planner costs the new partial indexes correctly
+    op.execute("ANALYZE district_boundaries")
+
+
+def downgrade() -> None:
+    """Remove the per-type partial GiST indexes."""
+    for district_type in reversed(DISTRICT_TYPES):
+        drop_index_concurrently(
+            f"idx_district_boundary_geom_{district_type}", "district_boundaries"
+        )
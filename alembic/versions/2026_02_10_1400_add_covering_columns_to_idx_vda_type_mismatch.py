@@ -0,0 +1,55 @@
+"""Add covering INCLUDE columns to idx_vda_type_mismatch
+
+Revision ID: d0e1f2a3b4c5
+Revises: c9d0e1f2a3b4
+Create Date: 2026-02-10 14:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d0e1f2a3b4c5"
+down_revision: Union[str, Sequence[str], None] = "c9d0e1f2a3b4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _rebuild_index(create_sql: str) -> None:
+    """Build the replacement index under a temporary name, then swap it in.
+
+    Keeps idx_vda_type_mismatch available for queries for the whole rebuild.
+    """
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_vda_type_mismatch_new")
+        op.execute(create_sql)
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_vda_type_mismatch")
+        op.execute("ALTER INDEX idx_vda_type_mismatch_new RENAME TO idx_vda_type_mismatch")
+
+
+def upgrade() -> None:
+    """Cover voter_id and spatial_district_id in idx_vda_type_mismatch.
+
+    The per-district map query filters on district_type/is_mismatch and only
+    reads voter_id and spatial_district_id from the assignments table, so it
+    can be answered without heap fetches.
+    """
+    _rebuild_index(
+        """
+        CREATE INDEX CONCURRENTLY idx_vda_type_mismatch_new
+        ON voter_district_assignments (district_type, is_mismatch)
+        INCLUDE (voter_id, spatial_district_id)
+        """
+    )
+
+
+def downgrade() -> None:
+    """Restore the plain composite index."""
+    _rebuild_index(
+        """
+        CREATE INDEX CONCURRENTLY idx_vda_type_mismatch_new
+        ON voter_district_assignments (district_type, is_mismatch)
+        """
+    )
@@ -0,0 +1,31 @@
+"""fix: remove redundant index on geocode_results.voter_id
+
+Revision ID: e1f2a3b4c5d6
+Revises: d0e1f2a3b4c5
+Create Date: 2026-02-10 14:10:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from vote_match.migration_ops import create_index_concurrently, drop_index_concurrently
+
+# revision identifiers, used by Alembic.
+revision: str = "e1f2a3b4c5d6"
+down_revision: Union[str, Sequence[str], None] = "d0e1f2a3b4c5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Remove idx_geocode_results_voter_id if a previous 0b5f9c2d8e41 created it.
+
+    voter_id lookups are served by the leading column of
+    idx_geocode_results_voter_service (voter_id, service_name).
+    """
+    drop_index_concurrently("idx_geocode_results_voter_id", "geocode_results")
+
+
+def downgrade() -> None:
+    """Restore the single-column voter_id index (for rollback purposes only)."""
+    create_index_concurrently("idx_geocode_results_voter_id", "geocode_results", ["voter_id"])
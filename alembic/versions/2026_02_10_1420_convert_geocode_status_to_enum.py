@@ -0,0 +1,59 @@
+"""Convert geocode_results.status to a native enum
+
+Revision ID: f2a3b4c5d6e7
+Revises: e1f2a3b4c5d6
+Create Date: 2026-02-10 14:20:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "f2a3b4c5d6e7"
+down_revision: Union[str, Sequence[str], None] = "e1f2a3b4c5d6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Values of vote_match.geocoding.base.GeocodeQuality at the time of writing
+geocode_quality = postgresql.ENUM(
+    "exact",
+    "interpolated",
+    "approximate",
+    "no_match",
+    "failed",
+    name="geocode_quality",
+)
+
+
+def upgrade() -> None:
+    """Store status as a 4-byte enum instead of VARCHAR(20).
+
+    Shrinks geocode_results rows and idx_geocode_results_status, and makes
+    status comparisons integer comparisons.
+    """
+    geocode_quality.create(op.get_bind(), checkfirst=True)
+    op.alter_column(
+        "geocode_results",
+        "status",
+        existing_type=sa.String(length=20),
+        type_=geocode_quality,
+        existing_nullable=False,
+        postgresql_using="status::geocode_quality",
+    )
+
+
+def downgrade() -> None:
+    """Revert status to VARCHAR(20)."""
+    op.alter_column(
+        "geocode_results",
+        "status",
+        existing_type=geocode_quality,
+        type_=sa.String(length=20),
+        existing_nullable=False,
+        postgresql_using="status::text",
+    )
+    geocode_quality.drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,38 @@
+"""Add partial index on voters.county for matched voters
+
+Revision ID: b4c5d6e7f8a9
+Revises: a3b4c5d6e7f8
+Create Date: 2026-02-10 14:40:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from vote_match.migration_ops import create_index_concurrently, drop_index_concurrently
+
+# revision identifiers, used by Alembic.
+revision: str = "b4c5d6e7f8a9"
+down_revision: Union[str, Sequence[str], None] = "a3b4c5d6e7f8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index county for matched voters only.
+
+    Per-county matched counts read this small index instead of scanning every
+    voter; idx_voter_county still covers the per-county totals.
+    """
+    create_index_concurrently(
+        "idx_voter_county_matched",
+        "voters",
+        ["county"],
+        postgresql_where=sa.text("geocode_status = 'matched'"),
+    )
+
+
+def downgrade() -> None:
+    """Remove the partial county index."""
+    drop_index_concurrently("idx_voter_county_matched", "voters")
@@ -0,0 +1,50 @@
+"""Add covering index for the voter status summary
+
+Revision ID: c5d6e7f8a9b0
+Revises: b4c5d6e7f8a9
+Create Date: 2026-02-10 14:50:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from vote_match.migration_ops import create_index_concurrently, drop_index_concurrently
+
+# revision identifiers, used by Alembic.
+revision: str = "c5d6e7f8a9b0"
+down_revision: Union[str, Sequence[str], None] = "b4c5d6e7f8a9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index (county, geocode_status) including usps_validation_status.
+
+    The status command groups voters by exactly these columns, so with the
+    visibility map current (autovacuum) it reads this index instead of the
+    voters heap. The index leads with county, which makes idx_voter_county
+    and the matched-only idx_voter_county_matched redundant; both are
+    dropped so loads and syncs maintain one county index instead of three.
+    """
+    create_index_concurrently(
+        "idx_voter_status_summary",
+        "voters",
+        ["county", "geocode_status"],
+        postgresql_include=["usps_validation_status"],
+    )
+    drop_index_concurrently("idx_voter_county_matched", "voters")
+    drop_index_concurrently("idx_voter_county", "voters")
+
+
+def downgrade() -> None:
+    """Restore the single-column county indexes and remove the covering index."""
+    create_index_concurrently("idx_voter_county", "voters", ["county"])
+    create_index_concurrently(
+        "idx_voter_county_matched",
+        "voters",
+        ["county"],
+        postgresql_where=sa.text("geocode_status = 'matched'"),
+    )
+    drop_index_concurrently("idx_voter_status_summary", "voters")
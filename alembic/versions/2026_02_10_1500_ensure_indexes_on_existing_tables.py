@@ -0,0 +1,41 @@
+"""Ensure indexes on pre-existing tables, built concurrently
+
+Revision ID: d6e7f8a9b0c1
+Revises: c5d6e7f8a9b0
+Create Date: 2026-02-10 15:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from vote_match.migration_ops import create_index_concurrently
+
+# revision identifiers, used by Alembic.
+revision: str = "d6e7f8a9b0c1"
+down_revision: Union[str, Sequence[str], None] = "c5d6e7f8a9b0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Indexes that 2bfc8bbdadbb, cc180756961f and b53ae1b6eba4 added to tables that
+# already held data, and that later revisions have not redefined
+EXISTING_TABLE_INDEXES = [
+    ("ix_voters_spatial_district_id", "voters", ["spatial_district_id"]),
+    ("idx_district_boundary_county", "district_boundaries", ["county_name"]),
+    ("idx_vda_voter_mismatch", "voter_district_assignments", ["voter_id", "is_mismatch"]),
+]
+
+
+def upgrade() -> None:
+    """Create any of the indexes that are missing, without blocking writes.
+
+    The original revisions built these with a plain CREATE INDEX and are left
+    as released. Databases that went through them already have the indexes,
+    so IF NOT EXISTS makes this a no-op there; a database missing one (e.g. it
+    was dropped by hand, or a build failed) gets it back CONCURRENTLY.
+    """
+    for index_name, table_name, columns in EXISTING_TABLE_INDEXES:
+        create_index_concurrently(index_name, table_name, columns)
+
+
+def downgrade() -> None:
+    """Leave the indexes in place; they belong to the revisions that created them."""
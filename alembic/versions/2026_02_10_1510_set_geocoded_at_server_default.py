@@ -0,0 +1,39 @@
+"""Set the geocode_results.geocoded_at server default
+
+Revision ID: e7f8a9b0c1d2
+Revises: d6e7f8a9b0c1
+Create Date: 2026-02-10 15:10:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "e7f8a9b0c1d2"
+down_revision: Union[str, Sequence[str], None] = "d6e7f8a9b0c1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Make sure geocoded_at defaults to now() in the database.
+
+    Geocode results are written with COPY, which leaves geocoded_at to the
+    server default. 0b5f9c2d8e41 declares it, but a database whose table was
+    created some other way may not have it. SET DEFAULT only touches the
+    catalog, so this is safe to repeat.
+    """
+    op.alter_column(
+        "geocode_results",
+        "geocoded_at",
+        existing_type=sa.DateTime(),
+        existing_nullable=False,
+        server_default=sa.text("now()"),
+    )
+
+
+def downgrade() -> None:
+    """Keep the default; 0b5f9c2d8e41 already declares it."""
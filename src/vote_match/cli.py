@@ -1,39 +1,49 @@
 """Command-line interface for Vote Match using Typer."""
 
+from collections.abc import Generator, Iterable, Sequence
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import typer
 from loguru import logger
-from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, MofNCompleteColumn
-from rich.table import Table
-from sqlalchemy import delete, select, func
-from sqlalchemy.dialects.postgresql import insert as pg_insert
-from sqlalchemy.orm import Session
-from alembic import command as alembic_command
+from rich.console import Console, Group
 
 from vote_match.config import Settings, get_settings
-from vote_match.database import init_database, get_engine, get_session
 from vote_match.logging import setup_logging
-from vote_match.csv_reader import read_voter_csv, dataframe_to_dicts
-from vote_match.models import (
-    DISTRICT_TYPES,
-    CountyCommissionDistrict,
-    DistrictBoundary,
-    GeocodeResult,
-    Voter,
-)
-from vote_match.migrations import (
-    create_migration,
-    upgrade_database,
-    downgrade_database,
-    show_current_revision,
-    show_history,
-    get_alembic_config,
-)
+
+# SQLAlchemy, Alembic, pandas, the models and the rich progress/table widgets
+# are imported inside the commands that use them, so --help, completion and
+# non-database commands start fast.
+if TYPE_CHECKING:
+    from rich.progress import Progress
+    from sqlalchemy import Select
+    from sqlalchemy.orm import Session
 
 console = Console()
 
+# Geocode result statuses in quality order, with their table labels
+GEOCODE_STATUS_LABELS = (
+    ("exact", "Exact"),
+    ("interpolated", "Interpolated"),
+    ("approximate", "Approximate"),
+    ("no_match", "No Match"),
+    ("failed", "Failed"),
+)
+
+
+def _progress(*columns, **kwargs) -> "Progress":
+    """
+    Create a progress display on the shared console.
+
+    The display is disabled when output is not a terminal (e.g. redirected to
+    a log file), so batch runs skip the live refreshes entirely.
+    """
+    from rich.progress import Progress
+
+    return Progress(*columns, console=console, disable=not console.is_terminal, **kwargs)
+
+
 app = typer.Typer(
     name="vote-match",
     help="Vote Match: Process voter registration records for GIS applications",
@@ -82,6 +92,8 @@ def init_db(
     ),
 ) -> None:
     """Initialize the PostGIS database schema."""
+    from vote_match.database import init_database
+
     logger.info("init-db command called with drop={}, skip_migrations={}", drop, skip_migrations)
 
     settings = get_settings()
@@ -148,10 +160,13 @@ def db_migrate(
     ),
 ) -> None:
     """Create a new database migration from model changes."""
+    from rich.progress import SpinnerColumn, TextColumn
+    from vote_match.migrations import create_migration
+
     logger.info("db-migrate command called with message: {}", message)
 
     try:
-        with Progress(
+        with _progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
             transient=False,
@@ -189,28 +204,30 @@ def db_upgrade(
     revision: str = typer.Argument("head", help="Target revision (default: head)"),
 ) -> None:
     """Apply database migrations."""
+    from rich.progress import SpinnerColumn, TextColumn
+    from vote_match.migrations import upgrade_database, show_current_revision
+
     logger.info("db-upgrade command called with revision: {}", revision)
 
     try:
-        # Show current revision before upgrade
-        current = show_current_revision()
-        if current:
-            typer.echo(f"Current revision: {current}")
-        else:
-            typer.echo("Current revision: None (no migrations applied)")
+        # Show current revision before upgrade (an extra query, so verbose only)
+        if _verbose:
+            current = show_current_revision()
+            if current:
+                typer.echo(f"Current revision: {current}")
+            else:
+                typer.echo("Current revision: None (no migrations applied)")
 
         # Apply migrations
-        with Progress(
+        with _progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
             transient=False,
         ) as progress:
             task = progress.add_task("Applying migrations...", total=None)
-            upgrade_database(revision)
+            new_current = upgrade_database(revision)
             progress.update(task, completed=True)
 
-        # Show new revision
-        new_current = show_current_revision()
         typer.secho(
             f"✓ Database upgraded successfully to: {new_current}",
             fg=typer.colors.GREEN,
@@ -232,6 +249,9 @@ def db_downgrade(
     revision: str = typer.Argument(..., help="Target revision to downgrade to"),
 ) -> None:
     """Rollback database migrations."""
+    from rich.progress import SpinnerColumn, TextColumn
+    from vote_match.migrations import downgrade_database, show_current_revision
+
     logger.info("db-downgrade command called with revision: {}", revision)
 
     try:
@@ -254,17 +274,15 @@ def db_downgrade(
             raise typer.Abort()
 
         # Perform downgrade
-        with Progress(
+        with _progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
             transient=False,
         ) as progress:
             task = progress.add_task("Rolling back migrations...", total=None)
-            downgrade_database(revision)
+            new_current = downgrade_database(revision)
             progress.update(task, completed=True)
 
-        # Show new revision
-        new_current = show_current_revision()
         if new_current:
             typer.secho(
                 f"✓ Database downgraded successfully to: {new_current}",
@@ -291,6 +309,8 @@ def db_downgrade(
 @app.command()
 def db_current() -> None:
     """Show current database migration revision."""
+    from vote_match.migrations import show_current_revision
+
     logger.info("db-current command called")
 
     try:
@@ -325,17 +345,12 @@ def db_current() -> None:
 @app.command()
 def db_history() -> None:
     """Show database migration history."""
+    from rich.table import Table
+    from vote_match.migrations import show_history
+
     logger.info("db-history command called")
 
     try:
-        from rich.table import Table
-        from rich.console import Console
-
-        console = Console()
-
-        # Get migration history
-        history = show_history()
-
         # Create table
         table = Table(
             title="Migration History",
@@ -343,11 +358,13 @@ def db_history() -> None:
             header_style="bold magenta",
         )
         table.add_column("Revision", style="cyan")
-        table.add_column("Description", style="white")
+        table.add_column(
+            "Description", style="white", no_wrap=True, overflow="ellipsis", max_width=80
+        )
         table.add_column("Status", style="green")
 
-        # Add rows (newest first)
-        for revision, description, is_current in reversed(history):
+        # Add rows (show_history yields newest first)
+        for revision, description, is_current in show_history():
             status = "✓ current" if is_current else ""
             table.add_row(revision[:12], description, status)
 
@@ -368,6 +385,9 @@ def db_stamp(
     revision: str = typer.Argument("head", help="Revision to stamp (default: head)"),
 ) -> None:
     """Stamp the database with a specific migration revision without running migrations."""
+    from alembic import command as alembic_command
+    from vote_match.migrations import get_alembic_config
+
     logger.info("db-stamp command called with revision: {}", revision)
 
     try:
@@ -410,57 +430,238 @@ def db_stamp(
         raise typer.Exit(code=1)
 
 
+@app.command()
+def db_geocode_logging(
+    unlogged: bool = typer.Option(
+        False,
+        "--unlogged",
+        help="Switch geocode_results to UNLOGGED for a bulk backfill",
+    ),
+) -> None:
+    """Toggle WAL logging on the geocode_results table.
+
+    Geocoding results can be regenerated from the voter addresses, so during a
+    large initial backfill the table can be made UNLOGGED to skip WAL writes.
+    UNLOGGED tables are truncated after a crash and are not replicated; run
+    this command again without --unlogged once the backfill is complete.
+
+    Examples:
+        vote-match db-geocode-logging --unlogged  # before the backfill
+        vote-match db-geocode-logging             # afterwards (SET LOGGED)
+    """
+    from sqlalchemy import text
+    from vote_match.database import db_session
+
+    mode = "UNLOGGED" if unlogged else "LOGGED"
+    logger.info("db-geocode-logging command called with mode: {}", mode)
+
+    if unlogged:
+        typer.secho(
+            "WARNING: geocode_results will be emptied if PostgreSQL crashes while UNLOGGED!",
+            fg=typer.colors.RED,
+            bold=True,
+        )
+        confirm = typer.confirm("Are you sure you want to continue?")
+        if not confirm:
+            typer.secho("Operation cancelled", fg=typer.colors.YELLOW)
+            raise typer.Abort()
+
+    settings = get_settings()
+
+    try:
+        with db_session(settings) as session:
+            # SET LOGGED rewrites the table into WAL, which can take a while
+            session.execute(text(f"ALTER TABLE geocode_results SET {mode}"))
+            session.commit()
+
+        typer.secho(
+            f"✓ geocode_results is now {mode}",
+            fg=typer.colors.GREEN,
+            bold=True,
+        )
+
+    except Exception as e:
+        logger.error("Failed to set geocode_results {}: {}", mode, str(e))
+        typer.secho(
+            f"✗ Failed to set geocode_results {mode}: {str(e)}",
+            fg=typer.colors.RED,
+            bold=True,
+        )
+        raise typer.Exit(code=1)
+
+
+@app.command()
+def db_cluster_geocode_results() -> None:
+    """Physically reorder geocode_results by (voter_id, service_name).
+
+    Results for one voter are written by separate geocoding runs, so they end
+    up scattered across the heap. CLUSTER packs each voter's rows together so
+    best-result lookups read one page instead of one per service. Run it after
+    a bulk geocoding backfill.
+
+    CLUSTER holds an ACCESS EXCLUSIVE lock for the whole rewrite. On a live
+    database prefer pg_repack, which reorders the table online:
+
+        pg_repack --table geocode_results --order-by "voter_id, service_name"
+    """
+    from rich.progress import SpinnerColumn, TextColumn
+    from sqlalchemy import text
+    from vote_match.database import db_session
+
+    logger.info("db-cluster-geocode-results command called")
+
+    typer.secho(
+        "WARNING: geocode_results will be locked for reads and writes while it is rewritten!",
+        fg=typer.colors.RED,
+        bold=True,
+    )
+    confirm = typer.confirm("Are you sure you want to continue?")
+    if not confirm:
+        typer.secho("Operation cancelled", fg=typer.colors.YELLOW)
+        raise typer.Abort()
+
+    settings = get_settings()
+
+    try:
+        with db_session(settings) as session:
+            with _progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                transient=False,
+            ) as progress:
+                task = progress.add_task("Clustering geocode_results...", total=None)
+                # Also records the index as the table's cluster index for later re-runs
+                session.execute(
+                    text("CLUSTER geocode_results USING idx_geocode_results_voter_service")
+                )
+                session.execute(text("ANALYZE geocode_results"))
+                session.commit()
+                progress.update(task, completed=True)
+
+        typer.secho(
+            "✓ geocode_results clustered by voter and service",
+            fg=typer.colors.GREEN,
+            bold=True,
+        )
+
+    except Exception as e:
+        logger.error("Failed to cluster geocode_results: {}", str(e))
+        typer.secho(
+            f"✗ Failed to cluster geocode_results: {str(e)}",
+            fg=typer.colors.RED,
+            bold=True,
+        )
+        raise typer.Exit(code=1)
+
+
 @app.command()
 def load_csv(
     csv_file: Path = typer.Argument(..., help="Path to voter registration CSV file"),
     truncate: bool = typer.Option(
         False,
         "--truncate",
-        help="Clear all existing voter records before loading",
+        help="Clear all existing voter records (and their geocode results) before loading",
+    ),
+    rebuild_indexes: bool | None = typer.Option(
+        None,
+        "--rebuild-indexes/--keep-indexes",
+        help="Drop secondary voter indexes during the load and rebuild them after (default: on with --truncate)",
+    ),
+    force_reload: bool = typer.Option(
+        False,
+        "--force-reload",
+        help="Load the file even if an identical copy was already loaded",
     ),
 ) -> None:
     """Load voter registration data from CSV into the database."""
+    from rich.progress import BarColumn, MofNCompleteColumn, SpinnerColumn, TextColumn
+    from sqlalchemy import func, text
+    from vote_match.database import db_session
+    from vote_match.csv_reader import count_voter_csv_rows, hash_file, iter_voter_csv
+    from vote_match.models import LoadHistory
+    from vote_match.processing import bulk_upsert_voters, drop_voter_indexes, recreate_indexes
+
     logger.info("load-csv command called with file: {}", csv_file)
 
     settings = get_settings()
 
+    if rebuild_indexes is None:
+        rebuild_indexes = truncate
+
+    if truncate and not settings.allow_truncate:
+        typer.secho(
+            "✗ --truncate is disabled; set VOTE_MATCH_ALLOW_TRUNCATE=true to enable it",
+            fg=typer.colors.RED,
+            bold=True,
+        )
+        raise typer.Exit(code=1)
+
     try:
-        # Read and validate CSV
         typer.echo(f"Reading CSV file: {csv_file}")
-        df = read_voter_csv(str(csv_file))
-        total_records = len(df)
-        logger.info("Loaded {} records from CSV", total_records)
-
-        # Convert to dictionaries
-        records = dataframe_to_dicts(df)
+        file_path = str(csv_file.resolve())
+        file_hash = hash_file(file_path)
+
+        # Get database connection (closing the session rolls back a failed load)
+        with db_session(settings) as session:
+            # An unchanged file needs no parsing or upserting at all
+            previous = session.get(LoadHistory, file_path)
+            if (
+                previous is not None
+                and previous.file_hash == file_hash
+                and not truncate
+                and not force_reload
+            ):
+                typer.secho(
+                    f"✓ CSV already loaded (hash match, {previous.row_count:,} records); skipping",
+                    fg=typer.colors.GREEN,
+                )
+                typer.echo("  Use --force-reload to load it again")
+                return
 
-        # Get database connection
-        engine = get_engine(settings)
-        session = get_session(engine)
+            total_records = count_voter_csv_rows(str(csv_file))
+            logger.info("Found ~{} records in CSV", total_records)
 
-        try:
-            # Truncate table if requested
+            # Confirm truncation before the load transaction starts
             if truncate:
                 typer.secho(
                     "WARNING: About to delete all existing voter records!",
                     fg=typer.colors.RED,
                     bold=True,
                 )
+                typer.secho(
+                    "Geocoding results and district assignments for these voters "
+                    "will be deleted too.",
+                    fg=typer.colors.RED,
+                )
                 confirm = typer.confirm("Are you sure you want to continue?")
                 if not confirm:
                     typer.secho("Operation cancelled", fg=typer.colors.YELLOW)
                     raise typer.Abort()
 
+            # Validate the CSV header only once the load is going ahead; the
+            # rows are streamed straight into COPY below, which closes the file
+            columns, rows = iter_voter_csv(str(csv_file))
+
+            # The whole load runs as one transaction. Skipping the WAL flush
+            # wait at commit is safe here: if the server crashes before the
+            # commit is durable, the CSV can simply be loaded again.
+            session.execute(text("SET LOCAL synchronous_commit = off"))
+
+            if truncate:
+                # TRUNCATE is transactional in PostgreSQL, so a failed load
+                # still leaves the existing records in place. CASCADE empties
+                # the tables referencing voters (geocode_results,
+                # voter_district_assignments) as well.
                 logger.warning("Truncating voters table")
-                session.execute(delete(Voter))
-                session.commit()
-                typer.secho("✓ Existing records deleted", fg=typer.colors.YELLOW)
+                session.execute(text("TRUNCATE TABLE voters RESTART IDENTITY CASCADE"))
+                typer.secho("✓ Existing records truncated", fg=typer.colors.YELLOW)
 
-            # Insert records in batches with progress bar
-            batch_size = 1000
-            total_batches = (total_records + batch_size - 1) // batch_size
+            # Secondary indexes are cheaper to build once than to maintain per row
+            dropped_indexes = drop_voter_indexes(session) if rebuild_indexes else []
 
-            with Progress(
+            # Stream records into a staging table with COPY, then merge them
+            # into voters with one INSERT ... ON CONFLICT statement
+            with _progress(
                 SpinnerColumn(),
                 TextColumn("[progress.description]{task.description}"),
                 BarColumn(),
@@ -472,53 +673,48 @@ def load_csv(
                     total=total_records,
                 )
 
-                for i in range(0, total_records, batch_size):
-                    batch = records[i : i + batch_size]
-                    batch_num = (i // batch_size) + 1
+                stats = bulk_upsert_voters(
+                    session,
+                    columns,
+                    rows,
+                    progress_callback=lambda n: progress.update(task, advance=n),
+                )
 
-                    logger.info(
-                        "Processing batch {}/{} ({} records)",
-                        batch_num,
-                        total_batches,
-                        len(batch),
+                if dropped_indexes:
+                    index_task = progress.add_task(
+                        "Rebuilding indexes...",
+                        total=len(dropped_indexes),
                     )
-
-                    # Use PostgreSQL's INSERT ... ON CONFLICT for upsert
-                    stmt = pg_insert(Voter).values(batch)
-                    stmt = stmt.on_conflict_do_update(
-                        index_elements=["voter_registration_number"],
-                        set_={
-                            col: stmt.excluded[col]
-                            for col in batch[0].keys()
-                            if col != "voter_registration_number"
-                        },
+                    recreate_indexes(
+                        session,
+                        dropped_indexes,
+                        progress_callback=lambda name: progress.update(
+                            index_task, advance=1, description=f"Rebuilt {name}"
+                        ),
                     )
 
-                    session.execute(stmt)
-                    session.commit()
-
-                    progress.update(task, advance=len(batch))
-
-            session.close()
-            engine.dispose()
+                session.merge(
+                    LoadHistory(
+                        file_path=file_path,
+                        file_hash=file_hash,
+                        row_count=stats["staged"],
+                        loaded_at=func.now(),
+                    )
+                )
+                session.commit()
 
             # Success message
             typer.secho(
-                f"\n✓ Successfully loaded {total_records:,} records",
+                f"\n✓ Successfully loaded {stats['staged']:,} records",
                 fg=typer.colors.GREEN,
                 bold=True,
             )
             typer.secho(
-                f"  Database operation completed in {total_batches} batch(es)",
+                f"  Inserted: {stats['inserted']:,}  Updated: {stats['updated']:,}  "
+                f"Unchanged: {stats['unchanged']:,}",
                 fg=typer.colors.GREEN,
             )
 
-        except Exception:
-            session.rollback()
-            session.close()
-            engine.dispose()
-            raise
-
     except FileNotFoundError as e:
         logger.error("File not found: {}", str(e))
         typer.secho(
@@ -577,6 +773,13 @@ def geocode(
         "--retry-failed",
         help="Retry previously failed records",
     ),
+    workers: int | None = typer.Option(
+        None,
+        "--workers",
+        "-w",
+        min=1,
+        help="Batches sent to the service at the same time (default: per-service setting)",
+    ),
 ) -> None:
     """Geocode voter addresses using specified service.
 
@@ -588,10 +791,21 @@ def geocode(
         vote-match geocode                           # Use Census (default)
         vote-match geocode --service nominatim       # Use Nominatim
         vote-match geocode --service census --all    # Force Census to process all voters
+        vote-match geocode --service census -w 4     # Keep four Census batches in flight
     """
+    from rich.progress import (
+        BarColumn,
+        MofNCompleteColumn,
+        SpinnerColumn,
+        TextColumn,
+        TimeRemainingColumn,
+    )
+    from rich.table import Table
+    from vote_match.database import db_session
+
     # Import geocoding modules
     from vote_match.geocoding.registry import GeocodeServiceRegistry
-    from vote_match.geocoding.services import census, nominatim  # noqa: F401 - ensure services are registered
+    import vote_match.geocoding.services  # noqa: F401 - registers services (imported on first use)
     from vote_match.processing import process_geocoding_service
 
     settings = get_settings()
@@ -626,6 +840,23 @@ def geocode(
         else:
             batch_size = settings.default_batch_size
 
+    # Concurrency priority: CLI flag > service-specific default (rate-limited
+    # services default to 1)
+    service_config = getattr(settings.geocode_services, service_name, None)
+    max_concurrent_batches = workers or getattr(service_config, "max_concurrent_batches", 1)
+
+    # rate_limit_delay is enforced per request inside each batch, so every
+    # extra worker would add another full-rate stream of requests
+    rate_limit_delay = getattr(service_config, "rate_limit_delay", 0.0)
+    if max_concurrent_batches > 1 and rate_limit_delay > 0:
+        typer.secho(
+            f"✗ {service_name} is rate limited to one request every {rate_limit_delay}s; "
+            f"{max_concurrent_batches} concurrent batches would exceed it. Use --workers 1.",
+            fg=typer.colors.RED,
+            bold=True,
+        )
+        raise typer.Exit(code=1)
+
     # Default behavior for only_unmatched
     # Census processes all ungeocoded voters, other services only process no_match
     if only_unmatched is None:
@@ -638,10 +869,7 @@ def geocode(
 
     try:
         # Get database connection
-        engine = get_engine(settings)
-        session = get_session(engine)
-
-        try:
+        with db_session(settings) as session:
             # Display strategy info
             if only_unmatched:
                 typer.echo(
@@ -652,14 +880,20 @@ def geocode(
 
             typer.echo(f"Service: {geocoding_service.service_name}")
             typer.echo(f"Batch size: {batch_size}")
+            if max_concurrent_batches > 1:
+                typer.echo(f"Concurrent batches: {max_concurrent_batches}")
             if limit:
                 typer.echo(f"Limit: {limit}")
             typer.echo("")
 
-            # Process geocoding with progress indication
-            with Progress(
+            # Process geocoding with progress indication; the total is set once
+            # the pending voters have been selected
+            with _progress(
                 SpinnerColumn(),
                 TextColumn("[progress.description]{task.description}"),
+                BarColumn(),
+                MofNCompleteColumn(),
+                TimeRemainingColumn(),
                 transient=False,
             ) as progress:
                 task = progress.add_task(f"Geocoding with {service_name}...", total=None)
@@ -672,16 +906,13 @@ def geocode(
                     limit=limit,
                     only_unmatched=only_unmatched,
                     retry_failed=retry_failed,
+                    max_concurrent_batches=max_concurrent_batches,
+                    progress_callback=lambda done, total: progress.update(
+                        task, completed=done, total=total
+                    ),
                 )
 
-                progress.update(task, completed=True)
-
             # Display results
-            from rich.console import Console
-            from rich.table import Table
-
-            console = Console()
-
             table = Table(
                 title=f"Geocoding Results ({service_name})",
                 show_header=True,
@@ -693,13 +924,10 @@ def geocode(
 
             total = stats["total"]
             if total > 0:
-                for status in ["exact", "interpolated", "approximate", "no_match", "failed"]:
-                    if stats[status] > 0:
-                        table.add_row(
-                            status.replace("_", " ").title(),
-                            str(stats[status]),
-                            f"{stats[status] / total * 100:.1f}%",
-                        )
+                for status, label in GEOCODE_STATUS_LABELS:
+                    count = stats.get(status, 0)
+                    if count:
+                        table.add_row(label, str(count), f"{count / total * 100:.1f}%")
                 table.add_row(
                     "Total",
                     str(total),
@@ -740,10 +968,6 @@ def geocode(
                     fg=typer.colors.YELLOW,
                 )
 
-        finally:
-            session.close()
-            engine.dispose()
-
     except Exception as e:
         logger.error(f"Geocoding failed: {e}")
         typer.secho(
@@ -795,6 +1019,10 @@ def sync_geocode(
         vote-match sync-geocode --limit 1000       # Process first 1000 voters
         vote-match sync-geocode --service census --force  # Re-sync using only census results
     """
+    from rich.progress import SpinnerColumn, TextColumn
+    from rich.table import Table
+    from vote_match.database import db_session
+
     logger.info(
         f"sync-geocode command called with limit={limit}, force_update={force_update}, "
         f"skip_legacy_fields={skip_legacy_fields}, service={service}"
@@ -804,10 +1032,7 @@ def sync_geocode(
 
     try:
         # Get database connection
-        engine = get_engine(settings)
-        session = get_session(engine)
-
-        try:
+        with db_session(settings) as session:
             from vote_match.processing import sync_best_geocode_to_voters
 
             # Display info
@@ -823,7 +1048,7 @@ def sync_geocode(
             typer.echo("")
 
             # Process sync with progress indication
-            with Progress(
+            with _progress(
                 SpinnerColumn(),
                 TextColumn("[progress.description]{task.description}"),
                 transient=False,
@@ -842,11 +1067,6 @@ def sync_geocode(
                 progress.update(task, completed=True)
 
             # Display results
-            from rich.console import Console
-            from rich.table import Table
-
-            console = Console()
-
             table = Table(
                 title="Sync Results",
                 show_header=True,
@@ -885,10 +1105,6 @@ def sync_geocode(
                     fg=typer.colors.YELLOW,
                 )
 
-        finally:
-            session.close()
-            engine.dispose()
-
     except Exception as e:
         logger.error(f"Sync failed: {e}")
         typer.secho(
@@ -914,6 +1130,10 @@ def validate_usps(
     ),
 ) -> None:
     """Validate voter addresses using USPS Address Validation API."""
+    from rich.progress import SpinnerColumn, TextColumn
+    from rich.table import Table
+    from vote_match.database import db_session
+
     logger.info(
         "validate-usps command called with limit={}, retry_failed={}",
         limit,
@@ -937,17 +1157,14 @@ def validate_usps(
 
     try:
         # Get database connection
-        engine = get_engine(settings)
-        session = get_session(engine)
-
-        try:
+        with db_session(settings) as session:
             # Import processing module
             from vote_match.processing import process_usps_validation
 
             # Process USPS validation with progress indication
             typer.echo("Starting USPS validation process...")
 
-            with Progress(
+            with _progress(
                 SpinnerColumn(),
                 TextColumn("[progress.description]{task.description}"),
                 transient=False,
@@ -965,11 +1182,6 @@ def validate_usps(
                 progress.update(task, completed=True)
 
             # Display results
-            from rich.table import Table
-            from rich.console import Console
-
-            console = Console()
-
             table = Table(
                 title="USPS Validation Results", show_header=True, header_style="bold magenta"
             )
@@ -1033,10 +1245,6 @@ def validate_usps(
                     fg=typer.colors.YELLOW,
                 )
 
-        finally:
-            session.close()
-            engine.dispose()
-
     except Exception as e:
         logger.error("USPS validation failed: {}", str(e))
         typer.secho(
@@ -1047,27 +1255,88 @@ def validate_usps(
         raise typer.Exit(code=1)
 
 
+# Last status report per database URL: (snapshot, monotonic time, renderables)
+_status_cache: dict[str, tuple[str, float, list]] = {}
+STATUS_CACHE_TTL = 30.0
+
+
 @app.command()
-def status() -> None:
-    """Display status of voter records (loaded, geocoded, matched)."""
+def status(
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Always recompute the report instead of reusing a recent unchanged one",
+    ),
+) -> None:
+    """Display status of voter records (loaded, geocoded, matched).
+
+    Within one process (e.g. the repl) the report is reused for up to
+    STATUS_CACHE_TTL seconds as long as no writing transaction has started or
+    committed since it was built.
+    """
+    import time
+
+    from rich.table import Table
+    from vote_match.database import db_session
+    from vote_match.models import Voter
+
     logger.info("status command called")
 
     settings = get_settings()
 
     try:
         # Get database connection
-        engine = get_engine(settings)
-        session = get_session(engine)
+        with db_session(settings) as session:
+            from sqlalchemy import select, func, text, tuple_
+
+            # The snapshot (xmin:xmax:in-progress xids) changes whenever a
+            # writing transaction starts or commits, including one that was
+            # already running when the cached report was built
+            snapshot = session.execute(text("SELECT pg_current_snapshot()::text")).scalar_one()
+            cached = _status_cache.get(settings.database_url)
+            if (
+                not no_cache
+                and cached is not None
+                and cached[0] == snapshot
+                and time.monotonic() - cached[1] < STATUS_CACHE_TTL
+            ):
+                logger.debug("Reusing status report from {:.1f}s ago", time.monotonic() - cached[1])
+                console.print(Group(*cached[2]))
+                return
 
-        try:
-            from sqlalchemy import select, func, case
-            from rich.console import Console
-            from rich.table import Table
+            # One pass over voters: counts per (county, geocode status) and per
+            # USPS status; GROUPING() tells the two sets apart.
+            summary_stmt = select(
+                Voter.county,
+                Voter.geocode_status,
+                Voter.usps_validation_status,
+                func.grouping(Voter.usps_validation_status).label("usps_rollup"),
+                func.count().label("count"),
+            ).group_by(
+                func.grouping_sets(
+                    tuple_(Voter.county, Voter.geocode_status),
+                    tuple_(Voter.usps_validation_status),
+                )
+            )
 
-            console = Console()
+            status_counts: dict[str, int] = {}
+            county_counts: dict[str | None, list[int]] = {}
+            usps_status_counts: dict[str, int] = {}
+            for county, geocode_status, usps_status, usps_rollup, count in session.execute(
+                summary_stmt
+            ):
+                if usps_rollup:
+                    status_key = geocode_status if geocode_status is not None else "pending"
+                    status_counts[status_key] = status_counts.get(status_key, 0) + count
+                    county_total = county_counts.setdefault(county, [0, 0])
+                    county_total[0] += count
+                    if geocode_status == "matched":
+                        county_total[1] += count
+                else:
+                    usps_key = usps_status if usps_status is not None else "pending"
+                    usps_status_counts[usps_key] = count
 
-            # Query total count
-            total_count = session.execute(select(func.count()).select_from(Voter)).scalar()
+            total_count = sum(status_counts.values())
 
             if total_count == 0:
                 typer.secho(
@@ -1080,29 +1349,8 @@ def status() -> None:
                 )
                 return
 
-            # Query counts by geocode status
-            status_stmt = select(
-                Voter.geocode_status,
-                func.count().label("count"),
-            ).group_by(Voter.geocode_status)
-            status_results = session.execute(status_stmt).all()
-
-            # Build status counts dictionary
-            status_counts = {}
-            for status, count in status_results:
-                if status is None:
-                    status_counts["pending"] = count
-                else:
-                    status_counts[status] = count
-
-            # Calculate individual counts
-            pending_count = status_counts.get("pending", 0)
-            matched_count = status_counts.get("matched", 0)
-            no_match_count = status_counts.get("no_match", 0)
-            failed_count = status_counts.get("failed", 0)
-
-            # Display title
-            console.print("\n[bold cyan]Voter Record Status[/bold cyan]\n")
+            # Collect the report and print it in one write at the end
+            report: list = ["\n[bold cyan]Voter Record Status[/bold cyan]\n"]
 
             # Create overall statistics table
             overall_table = Table(
@@ -1112,50 +1360,24 @@ def status() -> None:
             overall_table.add_column("Count", justify="right", style="green")
             overall_table.add_column("Percent", justify="right")
 
-            # Add rows with formatted numbers
-            overall_table.add_row(
-                "Total",
-                f"{total_count:,}",
-                "100.0%",
-                style="bold",
-            )
-            overall_table.add_row(
-                "Pending",
-                f"{pending_count:,}",
-                f"{pending_count / total_count * 100:.1f}%" if total_count > 0 else "0.0%",
-            )
-            overall_table.add_row(
-                "Matched",
-                f"{matched_count:,}",
-                f"{matched_count / total_count * 100:.1f}%" if total_count > 0 else "0.0%",
-            )
-            overall_table.add_row(
-                "No Match",
-                f"{no_match_count:,}",
-                f"{no_match_count / total_count * 100:.1f}%" if total_count > 0 else "0.0%",
-            )
-            overall_table.add_row(
-                "Failed",
-                f"{failed_count:,}",
-                f"{failed_count / total_count * 100:.1f}%" if total_count > 0 else "0.0%",
-            )
-
-            console.print(overall_table)
-            console.print()
-
-            # Query county breakdown
-            county_stmt = (
-                select(
-                    Voter.county,
-                    func.count().label("total"),
-                    func.sum(case((Voter.geocode_status == "matched", 1), else_=0)).label(
-                        "matched"
-                    ),
-                )
-                .group_by(Voter.county)
-                .order_by(Voter.county)
-            )
-            county_results = session.execute(county_stmt).all()
+            # Add rows with formatted numbers (total_count > 0 here)
+            overall_table.add_row("Total", f"{total_count:,}", "100.0%", style="bold")
+            for label, key in (
+                ("Pending", "pending"),
+                ("Matched", "matched"),
+                ("No Match", "no_match"),
+                ("Failed", "failed"),
+            ):
+                count = status_counts.get(key, 0)
+                overall_table.add_row(label, f"{count:,}", f"{count / total_count:.1%}")
+
+            report += [overall_table, ""]
+
+            # County breakdown, ordered by name with unknown counties last
+            county_results = [
+                (county, *county_counts[county])
+                for county in sorted(county_counts, key=lambda c: (c is None, c or ""))
+            ]
 
             # Create county breakdown table
             if county_results:
@@ -1177,31 +1399,17 @@ def status() -> None:
                         f"{match_pct:.1f}%",
                     )
 
-                console.print(county_table)
-                console.print()
-
-            # Query USPS validation status counts
-            usps_stmt = select(
-                Voter.usps_validation_status,
-                func.count().label("count"),
-            ).group_by(Voter.usps_validation_status)
-            usps_results = session.execute(usps_stmt).all()
-
-            # Build USPS status counts dictionary
-            usps_status_counts = {}
-            for status, count in usps_results:
-                if status is None:
-                    usps_status_counts["pending"] = count
-                else:
-                    usps_status_counts[status] = count
+                report += [county_table, ""]
 
             # Only display USPS table if there's any USPS data
             if usps_status_counts:
-                usps_pending = usps_status_counts.get("pending", 0)
-                usps_validated = usps_status_counts.get("validated", 0)
-                usps_corrected = usps_status_counts.get("corrected", 0)
-                usps_failed = usps_status_counts.get("failed", 0)
-                usps_total = usps_pending + usps_validated + usps_corrected + usps_failed
+                usps_rows = (
+                    ("Pending", usps_status_counts.get("pending", 0)),
+                    ("Validated (as-is)", usps_status_counts.get("validated", 0)),
+                    ("Corrected", usps_status_counts.get("corrected", 0)),
+                    ("Failed", usps_status_counts.get("failed", 0)),
+                )
+                usps_total = sum(count for _, count in usps_rows)
 
                 usps_table = Table(
                     title="USPS Validation Status", show_header=True, header_style="bold magenta"
@@ -1210,29 +1418,14 @@ def status() -> None:
                 usps_table.add_column("Count", justify="right", style="green")
                 usps_table.add_column("Percent", justify="right")
 
-                usps_table.add_row(
-                    "Pending",
-                    f"{usps_pending:,}",
-                    f"{usps_pending / usps_total * 100:.1f}%" if usps_total > 0 else "0.0%",
-                )
-                usps_table.add_row(
-                    "Validated (as-is)",
-                    f"{usps_validated:,}",
-                    f"{usps_validated / usps_total * 100:.1f}%" if usps_total > 0 else "0.0%",
-                )
-                usps_table.add_row(
-                    "Corrected",
-                    f"{usps_corrected:,}",
-                    f"{usps_corrected / usps_total * 100:.1f}%" if usps_total > 0 else "0.0%",
-                )
-                usps_table.add_row(
-                    "Failed",
-                    f"{usps_failed:,}",
-                    f"{usps_failed / usps_total * 100:.1f}%" if usps_total > 0 else "0.0%",
-                )
+                for label, count in usps_rows:
+                    usps_table.add_row(
+                        label,
+                        f"{count:,}",
+                        f"{count / usps_total:.1%}" if usps_total > 0 else "0.0%",
+                    )
 
-                console.print(usps_table)
-                console.print()
+                report += [usps_table, ""]
 
             # --- District Boundaries & Comparison Status ---
             from vote_match.processing import get_district_status
@@ -1263,12 +1456,10 @@ def status() -> None:
                         f"{info['no_registered']:,}",
                     )
 
-                console.print(dist_table)
-                console.print()
+                report += [dist_table, ""]
 
-        finally:
-            session.close()
-            engine.dispose()
+            _status_cache[settings.database_url] = (snapshot, time.monotonic(), report)
+            console.print(Group(*report))
 
     except Exception as e:
         logger.error("Failed to get status: {}", str(e))
@@ -1308,13 +1499,22 @@ def delete_geocode_results(
         vote-match delete-geocode-results --status failed  # All services
         vote-match delete-geocode-results --service nominatim  # All statuses
     """
+    from rich.progress import SpinnerColumn, TextColumn
+    from rich.table import Table
+    from sqlalchemy import func, select
+    from vote_match.database import db_session
+    from vote_match.geocoding.base import GeocodeQuality
+    from vote_match.models import GeocodeResult
+    from vote_match.processing import delete_geocode_results_in_batches
+
     logger.info(
         f"delete-geocode-results command called with service={service}, "
         f"status={status}, all_results={all_results}"
     )
 
-    # Valid status values
-    VALID_STATUSES = {"exact", "interpolated", "approximate", "no_match", "failed"}
+    # Valid status values: the labels of the geocode_quality enum, which
+    # PostgreSQL would otherwise reject with an invalid-cast error
+    VALID_STATUSES = {quality.value for quality in GeocodeQuality}
 
     # Validate parameters - at least one must be provided
     if not service and not status and not all_results:
@@ -1354,10 +1554,7 @@ def delete_geocode_results(
 
     try:
         # Get database connection
-        engine = get_engine(settings)
-        session = get_session(engine)
-
-        try:
+        with db_session(settings) as session:
             # Build conditions for the query
             conditions = []
             if service:
@@ -1365,12 +1562,10 @@ def delete_geocode_results(
             if status:
                 conditions.append(GeocodeResult.status == status)
 
-            # Query for count BEFORE deletion
-            count_query = select(func.count()).select_from(GeocodeResult)
-            for condition in conditions:
-                count_query = count_query.filter(condition)
-
-            count = session.execute(count_query).scalar()
+            # Count before deleting so the confirmation shows what will be removed
+            count = session.execute(
+                select(func.count()).select_from(GeocodeResult).where(*conditions)
+            ).scalar_one()
 
             # Check if any records match
             if count == 0:
@@ -1409,40 +1604,31 @@ def delete_geocode_results(
             typer.echo("")
 
             typer.secho(
-                "WARNING: This will permanently delete geocoding results!",
+                f"WARNING: This will permanently delete {count:,} geocoding results!",
                 fg=typer.colors.RED,
                 bold=True,
             )
 
-            confirm = typer.confirm("Are you sure you want to continue?")
+            confirm = typer.confirm(f"Delete {count:,} geocoding results?")
             if not confirm:
                 typer.secho("Operation cancelled", fg=typer.colors.YELLOW)
                 raise typer.Abort()
 
-            # Execute deletion
-            delete_stmt = delete(GeocodeResult)
-            for condition in conditions:
-                delete_stmt = delete_stmt.where(condition)
-
-            with Progress(
+            # Delete in committed batches so locks and WAL stay bounded
+            with _progress(
                 SpinnerColumn(),
                 TextColumn("[progress.description]{task.description}"),
-                transient=False,
+                TextColumn("{task.completed:,.0f} deleted"),
             ) as progress:
-                task = progress.add_task("Deleting records...", total=None)
-                result = session.execute(delete_stmt)
-                session.commit()
-                progress.update(task, completed=True)
-
-            # Get the actual count of deleted rows
-            deleted_count = result.rowcount
+                task = progress.add_task("Deleting records...", total=count)
+                deleted_count = delete_geocode_results_in_batches(
+                    session,
+                    service_name=service,
+                    status=status,
+                    progress_callback=lambda n: progress.update(task, advance=n),
+                )
 
             # Display results
-            from rich.console import Console
-            from rich.table import Table
-
-            console = Console()
-
             table = Table(
                 title="Deletion Summary",
                 show_header=True,
@@ -1482,10 +1668,6 @@ def delete_geocode_results(
                         fg=typer.colors.CYAN,
                     )
 
-        finally:
-            session.close()
-            engine.dispose()
-
     except typer.Abort:
         # User cancelled the operation - this is expected, not an error
         logger.info("Delete operation cancelled by user")
@@ -1568,6 +1750,10 @@ def export(
     ),
 ) -> None:
     """Export voter records to CSV, GeoJSON, or interactive Leaflet map."""
+    from rich.progress import SpinnerColumn, TextColumn
+    from vote_match.database import db_session
+    from vote_match.models import Voter
+
     logger.info(
         "export command called with output: {}, format: {}, matched_only: {}, "
         "mismatch_only: {}, district_type: {}, exact_match_only: {}, include_districts: {}, title: {}, limit: {}, county: {}, upload_to_r2: {}, redact_pii: {}, print_embed_code: {}",
@@ -1609,10 +1795,7 @@ def export(
 
     try:
         # Get database connection
-        engine = get_engine(settings)
-        session = get_session(engine)
-
-        try:
+        with db_session(settings) as session:
             # Handle leaflet format separately (uses different processing logic)
             if format == "leaflet":
                 # Use map title from settings if not provided via CLI
@@ -1637,6 +1820,9 @@ def export(
                 return
 
             # For CSV and GeoJSON formats, query voters
+            from contextlib import closing
+            from itertools import chain
+
             from sqlalchemy import select
 
             # Build query
@@ -1679,43 +1865,62 @@ def export(
             if limit:
                 query = query.limit(limit)
 
-            # Execute query with progress
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                transient=False,
-            ) as progress:
-                task = progress.add_task("Querying database...", total=None)
-                voters = session.execute(query).scalars().all()
-                progress.update(task, completed=True)
+            # Exports only read columns, so select them directly and never
+            # build ORM objects
+            columns = _voter_export_columns()
+            query = query.with_only_columns(*(Voter.__mapper__.c[key] for key in columns))
 
-            # Check if we have records
-            if not voters:
-                typer.secho(
-                    "No records found to export",
-                    fg=typer.colors.YELLOW,
-                )
-                return
+            if format == "csv":
+                with _progress(
+                    SpinnerColumn(),
+                    TextColumn("[progress.description]{task.description}"),
+                    transient=False,
+                ) as progress:
+                    task = progress.add_task("Exporting records...", total=None)
+                    exported = _export_csv(session, query, output)
+                    progress.update(task, completed=True)
 
-            logger.info("Retrieved {} voters for export", len(voters))
+                if exported == 0:
+                    output.unlink(missing_ok=True)
+                    typer.secho(
+                        "No records found to export",
+                        fg=typer.colors.YELLOW,
+                    )
+                    return
+            else:
+                # Stream features built by PostgreSQL through a server-side cursor
+                voters = session.execute(
+                    _geojson_features_query(query).execution_options(yield_per=10_000)
+                )
 
-            # Export based on format
-            if format == "csv":
-                _export_csv(voters, output)
-            elif format == "geojson":
-                _export_geojson(voters, output)
+                # Check if we have records
+                first = next(voters, None)
+                if first is None:
+                    typer.secho(
+                        "No records found to export",
+                        fg=typer.colors.YELLOW,
+                    )
+                    return
+
+                with (
+                    _progress(
+                        SpinnerColumn(),
+                        TextColumn("[progress.description]{task.description}"),
+                        transient=False,
+                    ) as progress,
+                    closing(_prefetched(chain([first], voters))) as rows,
+                ):
+                    task = progress.add_task("Exporting records...", total=None)
+                    exported = _export_geojson(rows, output)
+                    progress.update(task, completed=True)
 
             # Success message
             typer.secho(
-                f"\n✓ Successfully exported {len(voters):,} records to {output}",
+                f"\n✓ Successfully exported {exported:,} records to {output}",
                 fg=typer.colors.GREEN,
                 bold=True,
             )
 
-        finally:
-            session.close()
-            engine.dispose()
-
     except Exception as e:
         logger.error("Export failed: {}", str(e))
         typer.secho(
@@ -1726,79 +1931,189 @@ def export(
         raise typer.Exit(code=1)
 
 
-def _export_csv(voters: list[Voter], output: Path) -> None:
+def _prefetched(
+    rows: Iterable[Sequence], batch_size: int = 10_000, max_batches: int = 4
+) -> Generator[Sequence, None, None]:
+    """
+    Iterate rows while a background thread fetches the next batches.
+
+    Fetching from the database cursor overlaps with serializing and writing
+    on the caller's side. At most max_batches batches are buffered. Closing
+    the generator stops the fetch thread.
+
+    Args:
+        rows: Rows to read (e.g. a streaming query result)
+        batch_size: Rows handed over per batch
+        max_batches: Maximum number of batches waiting to be consumed
+
+    Yields:
+        Rows in their original order
+    """
+    import queue
+    import threading
+    from itertools import batched
+
+    batches: queue.Queue = queue.Queue(maxsize=max_batches)
+    stop = threading.Event()
+    done = object()
+
+    def fetch() -> None:
+        try:
+            for batch in batched(rows, batch_size):
+                if stop.is_set():
+                    return
+                batches.put(batch)
+            batches.put(done)
+        except Exception as e:
+            batches.put(e)
+
+    thread = threading.Thread(target=fetch, name="export-fetch", daemon=True)
+    thread.start()
+    try:
+        while (batch := batches.get()) is not done:
+            if isinstance(batch, Exception):
+                raise batch
+            yield from batch
+    finally:
+        # Unblock a fetch thread waiting on a full queue, then wait for it
+        stop.set()
+        while thread.is_alive():
+            try:
+                batches.get_nowait()
+            except queue.Empty:
+                thread.join(timeout=0.1)
+
+
+@lru_cache(maxsize=1)
+def _voter_export_columns() -> tuple[str, ...]:
+    """Voter column names included in CSV/GeoJSON exports (everything but geom).
+
+    The mapper's columns don't change at runtime, so the tuple is built once
+    per process.
+    """
+    from vote_match.models import Voter
+
+    return tuple(key for key in Voter.__mapper__.c.keys() if key != "geom")
+
+
+def _export_csv(session: "Session", query: "Select", output: Path) -> int:
     """
-    Export voters to CSV format.
+    Export voters to CSV format with COPY ... TO STDOUT.
+
+    PostgreSQL formats the rows (with a header) and the bytes are written to
+    the file as they arrive, with no per-row work in Python. Boolean columns
+    are rendered as True/False, as the earlier pandas-based export wrote
+    them, rather than COPY's t/f; NULLs are empty fields.
 
     Args:
-        voters: List of Voter objects to export
+        session: SQLAlchemy session
+        query: Select of the voter columns to export, with all filters applied
         output: Output file path
+
+    Returns:
+        Number of rows written
     """
-    import pandas as pd
-
-    logger.info("Exporting {} voters to CSV: {}", len(voters), output)
-
-    # Convert voters to dictionaries
-    records = []
-    for voter in voters:
-        # Get all attributes except SQLAlchemy internal state
-        record = {}
-        for key in voter.__mapper__.c.keys():
-            value = getattr(voter, key)
-            # Convert geometry to WKT string if present
-            if key == "geom" and value is not None:
-                # Skip geometry column for CSV
-                continue
-            record[key] = value
-        records.append(record)
+    from sqlalchemy import Boolean, case, select
+    from sqlalchemy.dialects import postgresql
+
+    logger.info("Exporting voters to CSV: {}", output)
+
+    voters = query.subquery("v")
+    query = select(
+        *(
+            case((column.is_(True), "True"), (column.is_(False), "False")).label(column.name)
+            if isinstance(column.type, Boolean)
+            else column
+            for column in voters.c
+        )
+    )
+
+    # COPY cannot take bind parameters, so filter values are rendered inline
+    select_sql = query.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+    copy_sql = f"COPY ({select_sql}) TO STDOUT WITH (FORMAT CSV, HEADER)"
+
+    dbapi_connection = session.connection().connection.driver_connection
+    with dbapi_connection.cursor() as cursor:
+        with open(output, "wb") as f, cursor.copy(copy_sql) as copy:
+            for data in copy:
+                f.write(data)
+        written = cursor.rowcount
+
+    logger.info("CSV export complete: {} rows written to {}", written, output)
+    return written
 
-    # Create DataFrame and write to CSV
-    df = pd.DataFrame(records)
-    df.to_csv(output, index=False)
 
-    logger.info("CSV export complete: {}", output)
+def _geojson_features_query(query: "Select") -> "Select":
+    """
+    Wrap a voter column select so PostgreSQL returns each row as a GeoJSON feature.
+
+    The feature is a Point at the geocoded coordinates with every selected
+    column as a property, returned as JSON text. Rows without coordinates
+    come back as NULL so the caller can count them.
+
+    Args:
+        query: Select of the voter columns to export, with all filters applied
+
+    Returns:
+        Select of one JSON text (or NULL) column per voter
+    """
+    from sqlalchemy import Text, and_, case, cast, func, literal_column, select
+
+    voters = query.subquery("v")
+    feature = func.json_build_object(
+        "type",
+        "Feature",
+        "geometry",
+        func.json_build_object(
+            "type",
+            "Point",
+            "coordinates",
+            func.json_build_array(voters.c.geocode_longitude, voters.c.geocode_latitude),
+        ),
+        # The whole subquery row: all voter fields except geom
+        "properties",
+        func.to_json(literal_column("v")),
+    )
+    has_coordinates = and_(
+        voters.c.geocode_longitude.isnot(None), voters.c.geocode_latitude.isnot(None)
+    )
+    return select(case((has_coordinates, cast(feature, Text)))).select_from(voters)
 
 
-def _export_geojson(voters: list[Voter], output: Path) -> None:
+def _export_geojson(features: Iterable[Sequence], output: Path) -> int:
     """
     Export voters to GeoJSON format.
 
+    The FeatureCollection is written one feature per line as rows are read,
+    so memory use does not grow with the number of voters.
+
     Args:
-        voters: List of Voter objects to export
+        features: Rows from _geojson_features_query (may be a streaming result)
         output: Output file path
-    """
-    import json
 
-    logger.info("Exporting {} voters to GeoJSON: {}", len(voters), output)
+    Returns:
+        Number of features written
+    """
+    logger.info("Exporting voters to GeoJSON: {}", output)
 
-    # Build features list
-    features = []
+    written = 0
     skipped = 0
 
-    for voter in voters:
-        # Only include records with valid coordinates
-        if voter.geocode_longitude is None or voter.geocode_latitude is None:
-            skipped += 1
-            continue
+    with open(output, "w") as f:
+        f.write('{"type": "FeatureCollection", "features": [\n')
 
-        # Build properties dictionary (all voter fields except geom)
-        properties = {}
-        for key in voter.__mapper__.c.keys():
-            if key == "geom":
+        for (feature,) in features:
+            # Only include records with valid coordinates
+            if feature is None:
+                skipped += 1
                 continue
-            value = getattr(voter, key)
-            properties[key] = value
-
-        # Build feature
-        feature = {
-            "type": "Feature",
-            "geometry": {
-                "type": "Point",
-                "coordinates": [voter.geocode_longitude, voter.geocode_latitude],
-            },
-            "properties": properties,
-        }
-        features.append(feature)
+
+            if written:
+                f.write(",\n")
+            f.write(feature)
+            written += 1
+
+        f.write("\n]}\n")
 
     # Warn if records were skipped
     if skipped > 0:
@@ -1808,17 +2123,8 @@ def _export_geojson(voters: list[Voter], output: Path) -> None:
         )
         logger.warning("Skipped {} records without coordinates", skipped)
 
-    # Build GeoJSON FeatureCollection
-    geojson = {
-        "type": "FeatureCollection",
-        "features": features,
-    }
-
-    # Write to file
-    with open(output, "w") as f:
-        json.dump(geojson, f, indent=2)
-
-    logger.info("GeoJSON export complete: {} features written to {}", len(features), output)
+    logger.info("GeoJSON export complete: {} features written to {}", written, output)
+    return written
 
 
 def _generate_iframe_embed_code(
@@ -1856,7 +2162,7 @@ def _generate_iframe_embed_code(
 
 
 def _export_leaflet(
-    session: Session,
+    session: "Session",
     output: Path,
     title: str,
     limit: int | None,
@@ -1890,6 +2196,7 @@ def _export_leaflet(
         district_type: List of district types to filter by (when mismatch_only is True)
         county: Filter by county name (normalized to uppercase)
     """
+    from rich.progress import SpinnerColumn, TextColumn
     from vote_match.processing import generate_leaflet_map
 
     logger.info("Generating Leaflet map: {}", output)
@@ -1904,7 +2211,7 @@ def _export_leaflet(
         html_filename = output.name  # Extract filename (e.g., "map.html")
 
     # Show progress
-    with Progress(
+    with _progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
         transient=False,
@@ -1939,7 +2246,7 @@ def _export_leaflet(
 
         try:
             # Upload index.html, voters.geojson, and districts.geojson
-            with Progress(
+            with _progress(
                 SpinnerColumn(),
                 TextColumn("[progress.description]{task.description}"),
                 transient=False,
@@ -2099,6 +2406,11 @@ def import_geojson(
 
     The GeoJSON file should contain a FeatureCollection with district polygons.
     """
+    from rich.progress import SpinnerColumn, TextColumn
+    from rich.table import Table
+    from vote_match.database import db_session
+    from vote_match.models import DISTRICT_TYPES, CountyCommissionDistrict, DistrictBoundary
+
     # Validate: either legacy OR district_type must be provided
     if not legacy and district_type is None:
         typer.secho(
@@ -2140,9 +2452,7 @@ def import_geojson(
                 )
                 raise typer.Exit(code=1)
 
-            engine = get_engine(settings)
-            session = get_session(engine)
-            try:
+            with db_session(settings) as session:
                 if clear:
                     count = session.query(CountyCommissionDistrict).count()
                     typer.secho(
@@ -2155,7 +2465,7 @@ def import_geojson(
                         typer.secho("Operation cancelled", fg=typer.colors.YELLOW)
                         raise typer.Abort()
 
-                with Progress(
+                with _progress(
                     SpinnerColumn(),
                     TextColumn("[progress.description]{task.description}"),
                     transient=False,
@@ -2185,9 +2495,6 @@ def import_geojson(
                     fg=typer.colors.GREEN,
                     bold=True,
                 )
-            finally:
-                session.close()
-                engine.dispose()
         except Exception as e:
             typer.secho(f"✗ Import failed: {e}", fg=typer.colors.RED, bold=True)
             logger.exception("import-geojson (legacy) failed: {}", e)
@@ -2218,10 +2525,7 @@ def import_geojson(
             )
             raise typer.Exit(code=1)
 
-        engine = get_engine(settings)
-        session = get_session(engine)
-
-        try:
+        with db_session(settings) as session:
             if clear:
                 count = (
                     session.query(DistrictBoundary)
@@ -2238,7 +2542,7 @@ def import_geojson(
                     typer.secho("Operation cancelled", fg=typer.colors.YELLOW)
                     raise typer.Abort()
 
-            with Progress(
+            with _progress(
                 SpinnerColumn(),
                 TextColumn("[progress.description]{task.description}"),
                 transient=False,
@@ -2278,10 +2582,6 @@ def import_geojson(
 
             logger.info("import-geojson completed successfully")
 
-        finally:
-            session.close()
-            engine.dispose()
-
     except FileNotFoundError as e:
         typer.secho(f"✗ File error: {e}", fg=typer.colors.RED, bold=True)
         logger.error("File not found: {}", e)
@@ -2303,6 +2603,9 @@ def list_district_types() -> None:
     Shows the mapping between district type keys (used in commands) and
     the corresponding voter registration columns.
     """
+    from rich.table import Table
+    from vote_match.models import DISTRICT_TYPES
+
     table = Table(title="Available District Types", header_style="bold magenta")
     table.add_column("Type Key", style="cyan", no_wrap=True)
     table.add_column("Voter Column", style="green")
@@ -2371,6 +2674,11 @@ def import_shapefiles(
         vote-match import-shapefiles --data-dir data
         vote-match import-shapefiles --clear --no-skip-existing
     """
+    from rich.progress import SpinnerColumn, TextColumn
+    from rich.table import Table
+    from vote_match.database import get_engine, get_session
+    from vote_match.models import DistrictBoundary
+
     logger.info(f"import-shapefiles command called with data_dir: {data_dir}")
 
     # Import processing function
@@ -2460,8 +2768,8 @@ def import_shapefiles(
 
     # Get database connection
     settings = get_settings()
-    engine = get_engine(settings)
-    session = get_session(engine)
+    # Shared engine: disposed once at exit, not per command
+    session = get_session(get_engine(settings))
 
     try:
         # Check which district types already have boundaries
@@ -2508,10 +2816,9 @@ def import_shapefiles(
         # Import each file
         results: list[tuple[str, str, dict[str, int]]] = []
 
-        with Progress(
+        with _progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
-            console=console,
         ) as progress:
             for file_path, district_type in import_plan:
                 # Skip if already exists and skip_existing is True
@@ -2630,11 +2937,9 @@ def import_shapefiles(
             )
 
         session.close()
-        engine.dispose()
 
     except Exception as e:
         session.close()
-        engine.dispose()
         logger.exception("import-shapefiles failed with error: {}", e)
         typer.secho(f"✗ Error: {e}", fg=typer.colors.RED, bold=True)
         raise typer.Exit(code=1)
@@ -2706,6 +3011,8 @@ def link_districts_to_counties(
         # Filter spatial joins to Georgia counties only
         vote-match link-districts-to-counties --spatial --state-fips 13
     """
+    from vote_match.database import get_engine, get_session
+
     from .county_linking import (
         link_districts_from_csv,
         link_districts_spatial,
@@ -2736,8 +3043,8 @@ def link_districts_to_counties(
 
     # Setup database
     settings = get_settings()
-    engine = get_engine(settings)
-    session = get_session(engine)
+    # Shared engine: disposed once at exit, not per command
+    session = get_session(get_engine(settings))
 
     try:
         # Validation mode
@@ -2830,14 +3137,12 @@ def link_districts_to_counties(
 
     except Exception as e:
         session.close()
-        engine.dispose()
         logger.exception("link-districts-to-counties failed with error: {}", e)
         typer.secho(f"✗ Error: {e}", fg=typer.colors.RED, bold=True)
         raise typer.Exit(code=1)
 
     finally:
         session.close()
-        engine.dispose()
 
 
 @app.command()
@@ -2869,7 +3174,7 @@ def compare_districts(
     export: Path | None = typer.Option(
         None,
         "--export",
-        help="(Legacy only) Export mismatches to CSV file",
+        help="(Legacy only) Export mismatches to a CSV file, or Parquet if it ends in .parquet",
     ),
 ) -> None:
     """Compare voter registration districts with spatial district boundaries.
@@ -2883,15 +3188,26 @@ def compare_districts(
     Note: Voters must have geocoded locations (run 'geocode' and 'sync-geocode'
     first) and boundaries must be imported (run 'import-geojson' first).
     """
+    import json
+    from dataclasses import asdict
+
+    from rich.progress import SpinnerColumn, TextColumn
+    from rich.table import Table
+    from vote_match.database import db_session
+    from vote_match.models import CountyCommissionDistrict, DistrictBoundary, Voter
+    from vote_match.processing import (
+        compare_all_districts,
+        compare_voter_districts,
+        export_district_comparison,
+        update_voter_district_comparison,
+    )
+
     logger.info("compare-districts command called")
 
     settings = get_settings()
 
     try:
-        engine = get_engine(settings)
-        session = get_session(engine)
-
-        try:
+        with db_session(settings) as session:
             # --- Legacy path (unchanged behavior) ---
             if legacy:
                 district_count = session.query(CountyCommissionDistrict).count()
@@ -2905,8 +3221,11 @@ def compare_districts(
 
                 typer.echo(f"Found {district_count} legacy districts in database")
 
-                voters_with_geom = session.query(Voter).filter(Voter.geom.isnot(None)).count()
-                if voters_with_geom == 0:
+                # EXISTS stops at the first geocoded voter instead of counting them all
+                has_geom = session.query(
+                    session.query(Voter).filter(Voter.geom.isnot(None)).exists()
+                ).scalar()
+                if not has_geom:
                     typer.secho(
                         "✗ No voters with geocoded locations.",
                         fg=typer.colors.RED,
@@ -2914,56 +3233,52 @@ def compare_districts(
                     )
                     raise typer.Exit(code=1)
 
-                typer.echo(f"Found {voters_with_geom} voters with geocoded locations")
-
-                with Progress(
+                with _progress(
                     SpinnerColumn(),
                     TextColumn("[progress.description]{task.description}"),
                     transient=False,
                 ) as progress:
                     task = progress.add_task("Comparing districts (legacy)...", total=None)
-                    from vote_match.processing import (
-                        compare_voter_districts,
-                        export_district_comparison,
-                        update_voter_district_comparison,
-                    )
-
                     result = compare_voter_districts(session=session, limit=limit)
                     progress.update(task, completed=True)
 
                 stats = result["stats"]
                 mismatches = result["mismatches"]
+                mismatched = stats.mismatched
 
-                table = Table(
-                    title="Legacy District Comparison Results",
-                    header_style="bold magenta",
-                )
-                table.add_column("Metric", style="cyan")
-                table.add_column("Count", style="green", justify="right")
-                table.add_column("Percentage", style="yellow", justify="right")
-
-                total = stats["total"]
-                matched = stats["matched"]
-                mismatched = stats["mismatched"]
-                no_district = stats["no_district"]
-
-                matched_pct = (matched / total * 100) if total > 0 else 0
-                mismatched_pct = (mismatched / total * 100) if total > 0 else 0
-                no_district_pct = (no_district / total * 100) if total > 0 else 0
-
-                table.add_row("Total Voters Processed", str(total), "100.0%")
-                table.add_row("Matched Districts", str(matched), f"{matched_pct:.1f}%")
-                table.add_row("Mismatched Districts", str(mismatched), f"{mismatched_pct:.1f}%")
-                table.add_row("No District Found", str(no_district), f"{no_district_pct:.1f}%")
+                # Styled table for terminals; one JSON line for logs and pipes
+                if console.is_terminal:
+                    table = Table(
+                        title="Legacy District Comparison Results",
+                        header_style="bold magenta",
+                    )
+                    table.add_column("Metric", style="cyan")
+                    table.add_column("Count", style="green", justify="right")
+                    table.add_column("Percentage", style="yellow", justify="right")
+
+                    total = stats.total
+
+                    table.add_row("Total Voters Processed", str(total), "100.0%")
+                    for label, key in (
+                        ("Matched Districts", "matched"),
+                        ("Mismatched Districts", "mismatched"),
+                        ("No District Found", "no_district"),
+                    ):
+                        count = getattr(stats, key)
+                        table.add_row(
+                            label, str(count), f"{count / total:.1%}" if total else "0.0%"
+                        )
 
-                console.print()
-                console.print(table)
-                console.print()
+                    console.print()
+                    console.print(table)
+                    console.print()
+                else:
+                    typer.echo(json.dumps(asdict(stats)))
 
                 if export:
-                    export_district_comparison(mismatches, export)
+                    exported = export_district_comparison(mismatches, export)
                     typer.secho(
-                        f"✓ Exported {len(mismatches)} mismatches to {export}",
+                        f"✓ Exported {exported} mismatches to {export}",
                         fg=typer.colors.GREEN,
                         bold=True,
                     )
@@ -3000,8 +3315,11 @@ def compare_districts(
                 return
 
             # --- New multi-district path ---
-            voters_with_geom = session.query(Voter).filter(Voter.geom.isnot(None)).count()
-            if voters_with_geom == 0:
+            # EXISTS stops at the first geocoded voter instead of counting them all
+            has_geom = session.query(
+                session.query(Voter).filter(Voter.geom.isnot(None)).exists()
+            ).scalar()
+            if not has_geom:
                 typer.secho(
                     "✗ No voters with geocoded locations. Run 'geocode' and 'sync-geocode' first.",
                     fg=typer.colors.RED,
@@ -3009,8 +3327,6 @@ def compare_districts(
                 )
                 raise typer.Exit(code=1)
 
-            typer.echo(f"Found {voters_with_geom} voters with geocoded locations")
-
             # Check for available boundaries
             boundary_count = session.query(DistrictBoundary).count()
             if boundary_count == 0:
@@ -3024,15 +3340,13 @@ def compare_districts(
 
             typer.echo(f"Found {boundary_count} district boundaries in database")
 
-            with Progress(
+            with _progress(
                 SpinnerColumn(),
                 TextColumn("[progress.description]{task.description}"),
                 transient=False,
             ) as progress:
                 task = progress.add_task("Comparing districts...", total=None)
 
-                from vote_match.processing import compare_all_districts
-
                 results = compare_all_districts(
                     session=session,
                     district_types=district_type,
@@ -3049,37 +3363,38 @@ def compare_districts(
                 )
                 return
 
-            # Display results per district type
-            for dtype, stats in results.items():
-                total = stats["total"]
-                matched = stats["matched"]
-                mismatched = stats["mismatched"]
-                no_dist = stats["no_district"]
-                no_reg = stats["no_registered"]
-
-                table = Table(
-                    title=f"Comparison: {dtype}",
-                    header_style="bold magenta",
-                )
-                table.add_column("Metric", style="cyan")
-                table.add_column("Count", style="green", justify="right")
-                table.add_column("Percentage", style="yellow", justify="right")
+            # Display results per district type: styled tables for terminals,
+            # one JSON line for logs and pipes
+            if console.is_terminal:
+                for dtype, stats in results.items():
+                    total = stats["total"]
 
-                matched_pct = (matched / total * 100) if total > 0 else 0
-                mismatched_pct = (mismatched / total * 100) if total > 0 else 0
-                no_dist_pct = (no_dist / total * 100) if total > 0 else 0
-                no_reg_pct = (no_reg / total * 100) if total > 0 else 0
+                    table = Table(
+                        title=f"Comparison: {dtype}",
+                        header_style="bold magenta",
+                    )
+                    table.add_column("Metric", style="cyan")
+                    table.add_column("Count", style="green", justify="right")
+                    table.add_column("Percentage", style="yellow", justify="right")
+
+                    table.add_row("Total Voters", str(total), "100.0%")
+                    for label, key in (
+                        ("Matched", "matched"),
+                        ("Mismatched", "mismatched"),
+                        ("No Boundary Found", "no_district"),
+                        ("No Registration Value", "no_registered"),
+                    ):
+                        count = stats[key]
+                        table.add_row(
+                            label, str(count), f"{count / total:.1%}" if total else "0.0%"
+                        )
 
-                table.add_row("Total Voters", str(total), "100.0%")
-                table.add_row("Matched", str(matched), f"{matched_pct:.1f}%")
-                table.add_row("Mismatched", str(mismatched), f"{mismatched_pct:.1f}%")
-                table.add_row("No Boundary Found", str(no_dist), f"{no_dist_pct:.1f}%")
-                table.add_row("No Registration Value", str(no_reg), f"{no_reg_pct:.1f}%")
+                    console.print()
+                    console.print(table)
 
                 console.print()
-                console.print(table)
-
-            console.print()
+            else:
+                typer.echo(json.dumps(results, default=str))
 
             # Summary across all types
             total_mismatches = sum(s["mismatched"] for s in results.values())
@@ -3113,15 +3428,67 @@ def compare_districts(
 
             logger.info("compare-districts completed successfully")
 
-        finally:
-            session.close()
-            engine.dispose()
-
     except Exception as e:
         typer.secho(f"✗ Comparison failed: {e}", fg=typer.colors.RED, bold=True)
         logger.exception("compare-districts failed with error: {}", e)
         raise typer.Exit(code=1)
 
 
+@app.command()
+def repl() -> None:
+    """Run vote-match commands interactively in a single process.
+
+    The database engine and its connection pool are created by the first
+    command that needs them and reused by every later one, so repeated runs
+    (e.g. compare-districts per county) skip connection setup.
+
+    Examples:
+        vote-match repl
+        vote-match> status
+        vote-match> compare-districts --district-type county_commission
+        vote-match> exit
+    """
+    import shlex
+
+    import click
+    from typer.main import get_command
+
+    logger.info("repl command called")
+
+    command = get_command(app)
+    console.print("Type a command (e.g. 'status'), 'help' for the list, or 'exit' to quit.")
+
+    while True:
+        try:
+            line = input("vote-match> ")
+        except (EOFError, KeyboardInterrupt):
+            console.print()
+            break
+
+        try:
+            args = shlex.split(line)
+        except ValueError as e:
+            typer.secho(f"✗ {e}", fg=typer.colors.RED)
+            continue
+
+        if not args:
+            continue
+        if args[0] in ("exit", "quit"):
+            break
+        if args[0] == "help":
+            args = ["--help"]
+        if args[0] == "repl":
+            typer.secho("✗ Already in interactive mode", fg=typer.colors.RED)
+            continue
+
+        try:
+            # standalone_mode=False returns exit codes instead of exiting the process
+            command.main(args, prog_name="vote-match", standalone_mode=False)
+        except click.ClickException as e:
+            e.show()
+        except click.Abort:
+            typer.secho("Aborted", fg=typer.colors.YELLOW)
+
+
 if __name__ == "__main__":
     app()
@@ -1,5 +1,6 @@
 """Configuration management for Vote Match using pydantic-settings."""
 
+from functools import lru_cache
 from typing import Optional
 
 from pydantic import BaseModel, Field
@@ -13,6 +14,7 @@ class ServiceConfig(BaseModel):
     timeout: int = 60
     rate_limit_delay: float = 0.0  # Seconds between requests
     batch_size: Optional[int] = None  # Service-specific default batch size
+    max_concurrent_batches: int = 1  # Batches in flight at once (1 = sequential)
 
 
 class CensusConfig(ServiceConfig):
@@ -21,6 +23,7 @@ class CensusConfig(ServiceConfig):
     benchmark: str = "Public_AR_Current"
     vintage: str = "Current_Current"
     timeout: int = 300
+    max_concurrent_batches: int = 2  # Batch uploads are slow server-side; overlap two
 
 
 class NominatimConfig(ServiceConfig):
@@ -120,6 +123,14 @@ class Settings(BaseSettings):
         default=5000,
         description="Default batch size for processing records",
     )
+    allow_truncate: bool = Field(
+        default=False,
+        description="Allow load-csv --truncate (TRUNCATE voters CASCADE, including geocode results)",
+    )
+    alembic_compare_server_default: bool = Field(
+        default=False,
+        description="Compare column server defaults during autogenerate (slower; enable for schema audits)",
+    )
 
     # Geocoding service configurations
     geocode_services: GeocodeServicesConfig = Field(default_factory=GeocodeServicesConfig)
@@ -232,6 +243,12 @@ class Settings(BaseSettings):
     )
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get application settings instance."""
+    """Get application settings instance.
+
+    The settings are parsed from the environment once per process and reused
+    by every subsequent caller (CLI commands, Alembic env.py, migrations).
+    Call ``get_settings.cache_clear()`` to force a reload.
+    """
     return Settings()
@@ -1,5 +1,9 @@
 """CSV reader for voter registration data."""
 
+import csv
+import hashlib
+from collections.abc import Iterator
+
 import pandas as pd
 from loguru import logger
 from pathlib import Path
@@ -78,6 +82,32 @@ REQUIRED_COLUMNS = [
     "County Precinct",
 ]
 
+# Values read as missing, matching the pandas.read_csv defaults the
+# DataFrame-based loader used
+NA_VALUES = frozenset(
+    {
+        "",
+        "#N/A",
+        "#N/A N/A",
+        "#NA",
+        "-1.#IND",
+        "-1.#QNAN",
+        "-NaN",
+        "-nan",
+        "1.#IND",
+        "1.#QNAN",
+        "<NA>",
+        "N/A",
+        "NA",
+        "NULL",
+        "NaN",
+        "None",
+        "n/a",
+        "nan",
+        "null",
+    }
+)
+
 
 def read_voter_csv(file_path: str) -> pd.DataFrame:
     """
@@ -158,3 +188,111 @@ def dataframe_to_dicts(df: pd.DataFrame) -> list[dict]:
     logger.debug("Converted {} records to dictionaries", len(records))
 
     return records
+
+
+def count_voter_csv_rows(file_path: str, block_size: int = 1 << 20) -> int:
+    """
+    Count data rows in a CSV file without parsing it.
+
+    Counts newlines in fixed-size blocks, so memory use is constant. Quoted
+    fields containing newlines are over-counted; the result is meant for
+    progress reporting.
+
+    Args:
+        file_path: Path to the CSV file
+        block_size: Bytes to read per block
+
+    Returns:
+        Number of lines after the header row
+    """
+    lines = 0
+    last_byte = b"\n"
+    with open(file_path, "rb") as f:
+        while block := f.read(block_size):
+            lines += block.count(b"\n")
+            last_byte = block[-1:]
+
+    # A final line without a trailing newline still counts
+    if last_byte != b"\n":
+        lines += 1
+
+    return max(lines - 1, 0)
+
+
+def hash_file(file_path: str, block_size: int = 1 << 20) -> bytes:
+    """
+    Compute the BLAKE2b digest of a file's contents.
+
+    Args:
+        file_path: Path to the file
+        block_size: Bytes to read per block
+
+    Returns:
+        64-byte digest
+    """
+    digest = hashlib.blake2b()
+    with open(file_path, "rb") as f:
+        while block := f.read(block_size):
+            digest.update(block)
+    return digest.digest()
+
+
+def iter_voter_csv(file_path: str) -> tuple[list[str], Iterator[tuple[str | None, ...]]]:
+    """
+    Stream voter registration rows from a CSV file.
+
+    The header is read and validated immediately; rows are then yielded one
+    at a time, so memory use does not grow with the file size.
+
+    Args:
+        file_path: Path to the CSV file
+
+    Returns:
+        Tuple of (snake_case column names, iterator of row value tuples).
+        Only columns in COLUMN_MAP are included, in file order, and empty
+        or NA_VALUES values are returned as None.
+
+    Raises:
+        FileNotFoundError: If the CSV file doesn't exist
+        ValueError: If required columns are missing
+    """
+    path = Path(file_path)
+    if not path.exists():
+        logger.error("CSV file not found: {}", file_path)
+        raise FileNotFoundError(f"CSV file not found: {file_path}")
+
+    logger.info("Streaming CSV file: {}", file_path)
+
+    # utf-8-sig drops a leading BOM, which would otherwise stick to the first header
+    with open(path, newline="", encoding="utf-8-sig") as handle:
+        header = next(csv.reader(handle), [])
+
+    # Validate required columns
+    missing_columns = [col for col in REQUIRED_COLUMNS if col not in header]
+    if missing_columns:
+        logger.error("Missing required columns: {}", missing_columns)
+        raise ValueError(
+            f"Missing required columns: {', '.join(missing_columns)}. "
+            f"Required: {', '.join(REQUIRED_COLUMNS)}"
+        )
+
+    logger.info("CSV validation successful - all required columns present")
+
+    indices = [i for i, col in enumerate(header) if col in COLUMN_MAP]
+    columns = [COLUMN_MAP[header[i]] for i in indices]
+    width = len(header)
+
+    def rows() -> Iterator[tuple[str | None, ...]]:
+        # The file is only opened once iteration starts, and closed when the
+        # generator finishes, is closed, or is garbage collected
+        with open(path, newline="", encoding="utf-8-sig") as handle:
+            reader = csv.reader(handle)
+            next(reader, None)  # Header, already validated
+            for row in reader:
+                if not row:
+                    continue  # Skip blank lines
+                if len(row) < width:
+                    row.extend([""] * (width - len(row)))
+                yield tuple(None if row[i] in NA_VALUES else row[i] for i in indices)
+
+    return columns, rows()
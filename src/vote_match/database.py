@@ -1,5 +1,9 @@
 """Database connection and initialization for Vote Match application."""
 
+import atexit
+from collections.abc import Iterator
+from contextlib import contextmanager
+
 from sqlalchemy import create_engine, text
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session
@@ -9,9 +13,25 @@ from vote_match.config import Settings
 from vote_match.models import Base
 
 
+# One engine (and connection pool) per database URL for the life of the process
+_engines: dict[str, Engine] = {}
+
+
+@atexit.register
+def _dispose_engines() -> None:
+    """Close pooled connections of every engine created by get_engine()."""
+    for engine in _engines.values():
+        engine.dispose()
+
+
 def get_engine(settings: Settings) -> Engine:
     """
-    Create SQLAlchemy engine from settings.
+    Get the SQLAlchemy engine for the configured database.
+
+    Engines are created once per database URL and shared for the life of the
+    process, so repeated calls reuse the same connection pool. Calling
+    dispose() on the returned engine only closes its pooled connections; the
+    engine stays usable.
 
     Args:
         settings: Application settings containing database URL
@@ -19,8 +39,17 @@ def get_engine(settings: Settings) -> Engine:
     Returns:
         SQLAlchemy Engine instance
     """
-    logger.debug("Creating database engine with URL: {}", settings.database_url)
-    engine = create_engine(settings.database_url, echo=False)
+    engine = _engines.get(settings.database_url)
+    if engine is None:
+        logger.debug("Creating database engine with URL: {}", settings.database_url)
+        engine = create_engine(
+            settings.database_url,
+            echo=False,
+            pool_pre_ping=True,
+            pool_size=10,
+            max_overflow=20,
+        )
+        _engines[settings.database_url] = engine
     return engine
 
 
@@ -37,6 +66,26 @@ def get_session(engine: Engine) -> Session:
     return Session(engine)
 
 
+@contextmanager
+def db_session(settings: Settings) -> Iterator[Session]:
+    """
+    Open a session on the shared engine and close it on exit.
+
+    Closing the session rolls back anything that was not committed.
+
+    Args:
+        settings: Application settings containing database URL
+
+    Yields:
+        SQLAlchemy Session instance
+    """
+    session = get_session(get_engine(settings))
+    try:
+        yield session
+    finally:
+        session.close()
+
+
 def init_database(drop_tables: bool, settings: Settings, run_migrations: bool = True) -> None:
     """
     Initialize PostGIS database schema.
@@ -54,7 +103,7 @@ def init_database(drop_tables: bool, settings: Settings, run_migrations: bool =
     """
     logger.info("Initializing database schema")
 
-    # Get engine
+    # Shared engine; its pool is closed at process exit
     engine = get_engine(settings)
 
     try:
@@ -107,5 +156,3 @@ def init_database(drop_tables: bool, settings: Settings, run_migrations: bool =
     except Exception as e:
         logger.error("Failed to initialize database: {}", str(e))
         raise
-    finally:
-        engine.dispose()
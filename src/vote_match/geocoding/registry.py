@@ -1,5 +1,6 @@
 """Service registry for geocoding providers."""
 
+import importlib
 from typing import Any
 
 from .base import GeocodeService
@@ -9,6 +10,7 @@ class GeocodeServiceRegistry:
     """Registry for discovering and instantiating geocoding services."""
 
     _services: dict[str, type[GeocodeService]] = {}
+    _lazy_services: dict[str, str] = {}
 
     @classmethod
     def register(cls, service_class: type[GeocodeService]) -> type[GeocodeService]:
@@ -32,6 +34,19 @@ class GeocodeServiceRegistry:
         cls._services[service_name] = service_class
         return service_class
 
+    @classmethod
+    def register_lazy(cls, name: str, module_path: str) -> None:
+        """Register a service by module path without importing it yet.
+
+        The module is imported the first time the service is requested; its
+        @register decorator then adds the service class.
+
+        Args:
+            name: Service identifier (e.g., 'census')
+            module_path: Dotted path of the module defining the service
+        """
+        cls._lazy_services[name] = module_path
+
     @classmethod
     def get_service(cls, name: str, config: Any) -> GeocodeService:
         """Instantiate a service by name.
@@ -46,6 +61,8 @@ class GeocodeServiceRegistry:
         Raises:
             ValueError: If service name is not registered
         """
+        if name not in cls._services and name in cls._lazy_services:
+            importlib.import_module(cls._lazy_services[name])
         if name not in cls._services:
             available = ", ".join(cls.list_services())
             raise ValueError(f"Unknown geocoding service: {name}. Available services: {available}")
@@ -58,4 +75,4 @@ class GeocodeServiceRegistry:
         Returns:
             List of service identifiers
         """
-        return sorted(list(cls._services.keys()))
+        return sorted(set(cls._services) | set(cls._lazy_services))
@@ -1,12 +1,20 @@
 """Geocoding service implementations."""
 
-# Services will auto-register on import
-# Import all service modules here to ensure registration
-from . import census  # noqa: F401
-from . import geocodio  # noqa: F401
-from . import google_maps  # noqa: F401
-from . import mapbox  # noqa: F401
-from . import nominatim  # noqa: F401
-from . import photon  # noqa: F401
+from ..registry import GeocodeServiceRegistry
+
+# Services register themselves when their module is imported. Each module is
+# only imported the first time its service is requested, so selecting one
+# service does not pull in every provider's HTTP client and config.
+_SERVICE_MODULES = {
+    "census": "census",
+    "geocodio": "geocodio",
+    "google": "google_maps",
+    "mapbox": "mapbox",
+    "nominatim": "nominatim",
+    "photon": "photon",
+}
+
+for _name, _module in _SERVICE_MODULES.items():
+    GeocodeServiceRegistry.register_lazy(_name, f"{__name__}.{_module}")
 
 __all__ = ["census", "nominatim", "geocodio", "mapbox", "photon", "google_maps"]
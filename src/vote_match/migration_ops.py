@@ -0,0 +1,40 @@
+"""Shared Alembic operations for Vote Match migration scripts."""
+
+from typing import Any, Sequence
+
+from alembic import op
+
+
+def create_index_concurrently(
+    index_name: str,
+    table_name: str,
+    columns: Sequence[str],
+    **kw: Any,
+) -> None:
+    """Create an index with CREATE INDEX CONCURRENTLY IF NOT EXISTS.
+
+    Runs in an autocommit block, since PostgreSQL does not allow concurrent
+    index builds inside a transaction. Extra keyword arguments (e.g.
+    postgresql_using, postgresql_where) are passed to op.create_index.
+    """
+    with op.get_context().autocommit_block():
+        op.create_index(
+            index_name,
+            table_name,
+            list(columns),
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+            **kw,
+        )
+
+
+def drop_index_concurrently(index_name: str, table_name: str) -> None:
+    """Drop an index with DROP INDEX CONCURRENTLY IF EXISTS in an autocommit block."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            index_name,
+            table_name=table_name,
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -1,5 +1,7 @@
 """Database migration utilities using Alembic."""
 
+from collections.abc import Iterator
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -8,15 +10,19 @@ from alembic.config import Config
 from alembic.script import ScriptDirectory
 from alembic.runtime.migration import MigrationContext
 from loguru import logger
-from sqlalchemy import create_engine
+from sqlalchemy import Engine
 
 from vote_match.config import get_settings
+from vote_match.database import get_engine
 
 
+@lru_cache(maxsize=1)
 def get_alembic_config() -> Config:
     """
     Get Alembic configuration object.
 
+    The config is parsed once per process and shared by every helper below.
+
     Returns:
         Configured Alembic Config object
 
@@ -41,6 +47,34 @@ def get_alembic_config() -> Config:
     return config
 
 
+def _get_migration_engine() -> Engine:
+    """Engine shared by the migration helpers and the rest of the application.
+
+    Uses the process-wide engine from get_engine(), so migrations run from
+    init-db or the repl reuse the same connection pool as other commands.
+    """
+    return get_engine(get_settings())
+
+
+def _run_with_shared_connection(command, config: Config, revision: str) -> Optional[str]:
+    """Run an Alembic command on a connection from the shared engine.
+
+    env.py picks the connection up from config.attributes instead of
+    creating its own engine. The resulting revision is read on the same
+    connection, so callers don't need another round trip to report it.
+
+    Returns:
+        Database revision after the command, or None if no migrations applied
+    """
+    with _get_migration_engine().connect() as connection:
+        config.attributes["connection"] = connection
+        try:
+            command(config, revision)
+        finally:
+            config.attributes.pop("connection", None)
+        return MigrationContext.configure(connection).get_current_revision()
+
+
 def create_migration(message: str, autogenerate: bool = True) -> None:
     """
     Create a new migration file.
@@ -67,13 +101,16 @@ def create_migration(message: str, autogenerate: bool = True) -> None:
         raise
 
 
-def upgrade_database(revision: str = "head") -> None:
+def upgrade_database(revision: str = "head") -> Optional[str]:
     """
     Upgrade database to a specific revision.
 
     Args:
         revision: Target revision (default: "head" for latest)
 
+    Returns:
+        Database revision after the upgrade, or None if no migrations applied
+
     Raises:
         Exception: If upgrade fails
     """
@@ -81,20 +118,24 @@ def upgrade_database(revision: str = "head") -> None:
     config = get_alembic_config()
 
     try:
-        alembic_command.upgrade(config, revision)
-        logger.info("Database upgraded successfully to: {}", revision)
+        new_revision = _run_with_shared_connection(alembic_command.upgrade, config, revision)
+        logger.info("Database upgraded successfully to: {}", new_revision)
+        return new_revision
     except Exception as e:
         logger.error("Failed to upgrade database: {}", str(e))
         raise
 
 
-def downgrade_database(revision: str) -> None:
+def downgrade_database(revision: str) -> Optional[str]:
     """
     Downgrade database to a specific revision.
 
     Args:
         revision: Target revision to downgrade to
 
+    Returns:
+        Database revision after the downgrade, or None if no migrations applied
+
     Raises:
         Exception: If downgrade fails
     """
@@ -102,8 +143,9 @@ def downgrade_database(revision: str) -> None:
     config = get_alembic_config()
 
     try:
-        alembic_command.downgrade(config, revision)
-        logger.info("Database downgraded successfully to: {}", revision)
+        new_revision = _run_with_shared_connection(alembic_command.downgrade, config, revision)
+        logger.info("Database downgraded successfully to: {}", new_revision)
+        return new_revision
     except Exception as e:
         logger.error("Failed to downgrade database: {}", str(e))
         raise
@@ -117,11 +159,9 @@ def show_current_revision() -> Optional[str]:
         Current revision string or None if no migrations applied
     """
     logger.debug("Checking current database revision")
-    settings = get_settings()
-    engine = create_engine(settings.database_url, echo=False)
 
     try:
-        with engine.connect() as connection:
+        with _get_migration_engine().connect() as connection:
             context = MigrationContext.configure(connection)
             current_rev = context.get_current_revision()
             logger.debug("Current revision: {}", current_rev)
@@ -129,31 +169,42 @@ def show_current_revision() -> Optional[str]:
     except Exception as e:
         logger.error("Failed to get current revision: {}", str(e))
         raise
-    finally:
-        engine.dispose()
 
 
-def show_history() -> list[tuple[str, str, bool]]:
+@lru_cache(maxsize=1)
+def _revision_history(versions_mtime: float) -> tuple[tuple[str, str], ...]:
+    """(revision, description) pairs from head down to base.
+
+    Keyed by the versions directory mtime, so adding or removing a
+    migration file invalidates the cache.
     """
-    Get list of all migrations with their descriptions.
+    script = ScriptDirectory.from_config(get_alembic_config())
+    return tuple(
+        (revision.revision, revision.doc or "(no description)")
+        for revision in script.walk_revisions()
+    )
 
-    Returns:
-        List of (revision, description, is_current) tuples
+
+def show_history() -> Iterator[tuple[str, str, bool]]:
+    """
+    Iterate over all migrations with their descriptions, newest first.
+
+    The parsed revision list is cached per process and only re-read when
+    the versions directory changes; the current revision is queried once.
+
+    Yields:
+        (revision, description, is_current) tuples
     """
     logger.debug("Retrieving migration history")
     config = get_alembic_config()
 
     try:
-        script = ScriptDirectory.from_config(config)
+        versions_dir = Path(config.get_main_option("script_location")) / "versions"
+        history = _revision_history(versions_dir.stat().st_mtime)
         current_rev = show_current_revision()
-        revisions = []
-
-        for revision in script.walk_revisions():
-            is_current = revision.revision == current_rev
-            revisions.append((revision.revision, revision.doc or "(no description)", is_current))
 
-        logger.debug("Found {} migrations", len(revisions))
-        return revisions
+        for revision, description in history:
+            yield revision, description, revision == current_rev
     except Exception as e:
         logger.error("Failed to get migration history: {}", str(e))
         raise
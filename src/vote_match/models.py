@@ -8,17 +8,23 @@ from sqlalchemy import (
     Boolean,
     Column,
     DateTime,
+    Enum,
     Float,
     ForeignKey,
     Index,
     Integer,
+    LargeBinary,
     String,
     Text,
     UniqueConstraint,
     func,
+    text,
 )
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import declarative_base, relationship
 
+from vote_match.geocoding.base import GeocodeQuality
+
 Base = declarative_base()
 
 # Maps district type keys to the corresponding Voter model column names.
@@ -44,6 +50,15 @@ DISTRICT_TYPES: dict[str, str] = {
     "municipality": "municipality",
 }
 
+# District types that get their own partial GiST index on district_boundaries.geom
+PARTIAL_GEOM_INDEX_TYPES: tuple[str, ...] = (
+    "county",
+    "county_precinct",
+    "state_senate",
+    "state_house",
+    "psc",
+)
+
 
 class GeocodeResult(Base):
     """Stores geocoding results from any service.
@@ -56,23 +71,28 @@ class GeocodeResult(Base):
     __tablename__ = "geocode_results"
 
     id = Column(Integer, primary_key=True)
+    # Same (unbounded) type as voters.voter_registration_number so FK joins compare like types
+    # No standalone index: idx_geocode_results_voter_service leads with voter_id
     voter_id = Column(
         String,
         ForeignKey("voters.voter_registration_number"),
         nullable=False,
-        index=True,
     )
     service_name = Column(String(50), nullable=False, index=True)
+    # Native PostgreSQL enum: 4 bytes per row/index key instead of a varchar.
+    # service_name stays a string because services are registered dynamically.
     status = Column(
-        String(20), nullable=False
+        Enum(*(quality.value for quality in GeocodeQuality), name="geocode_quality"),
+        nullable=False,
     )  # exact, interpolated, approximate, no_match, failed
     longitude = Column(Float, nullable=True)
     latitude = Column(Float, nullable=True)
     matched_address = Column(Text, nullable=True)
     match_confidence = Column(Float, nullable=True)  # 0.0-1.0
-    raw_response = Column(JSON, nullable=True)  # Service-specific data
+    raw_response = Column(JSONB, nullable=True)  # Service-specific data
     error_message = Column(Text, nullable=True)
-    geocoded_at = Column(DateTime, nullable=False, default=func.now())
+    # Server default too: save_geocode_results COPYs rows without geocoded_at
+    geocoded_at = Column(DateTime, nullable=False, default=func.now(), server_default=func.now())
 
     # Relationship
     voter = relationship("Voter", back_populates="geocode_results")
@@ -81,6 +101,19 @@ class GeocodeResult(Base):
     __table_args__ = (
         Index("idx_geocode_results_voter_service", "voter_id", "service_name"),
         Index("idx_geocode_results_status", "status"),
+        Index(
+            "idx_geocode_results_raw_response_gin",
+            "raw_response",
+            postgresql_using="gin",
+            postgresql_ops={"raw_response": "jsonb_path_ops"},
+        ),
+        # Rows are append-only, so geocoded_at tracks physical order (BRIN-friendly)
+        Index(
+            "idx_geocode_results_geocoded_at_brin",
+            "geocoded_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
     )
 
     def __repr__(self) -> str:
@@ -141,7 +174,7 @@ class Voter(Base):
     super_commissioner_district = Column(String, nullable=True)
     super_school_board_district = Column(String, nullable=True)
     fire_district = Column(String, nullable=True)
-    psc_district = Column(String, nullable=True)
+    psc_district = Column(String, nullable=True, index=True)
 
     # Municipality and Land Information
     municipality = Column(String, nullable=True)
@@ -187,7 +220,7 @@ class Voter(Base):
     # District comparison results (added by compare-districts command)
     spatial_district_id = Column(String(10), nullable=True, index=True)
     spatial_district_name = Column(String(100), nullable=True)
-    district_mismatch = Column(Boolean, nullable=True, index=True)
+    district_mismatch = Column(Boolean, nullable=True)
     district_compared_at = Column(DateTime, nullable=True)
 
     # USPS validation result fields (added by USPS validator)
@@ -218,9 +251,23 @@ class Voter(Base):
     # Additional indexes
     __table_args__ = (
         Index("idx_voter_geocode_status", "geocode_status"),
-        Index("idx_voter_county", "county"),
         Index("idx_voter_county_precinct", "county_precinct"),
         Index("idx_voter_usps_validation", "usps_validation_status"),
+        # Covers every column the status summary groups by, so its GROUPING SETS
+        # query can run as an index-only scan instead of reading the whole table.
+        # Its leading county column also serves plain county lookups.
+        Index(
+            "idx_voter_status_summary",
+            "county",
+            "geocode_status",
+            postgresql_include=["usps_validation_status"],
+        ),
+        # Partial index: only mismatched voters are ever looked up by this flag
+        Index(
+            "ix_voters_district_mismatch",
+            "district_mismatch",
+            postgresql_where=text("district_mismatch = true"),
+        ),
     )
 
     def build_street_address(self) -> str:
@@ -414,6 +461,18 @@ class DistrictBoundary(Base):
         Index("idx_district_boundary_type", "district_type"),
         Index("idx_district_boundary_county", "county_name"),
         Index("idx_district_boundary_geom", "geom", postgresql_using="gist"),
+        # Per-type partial GiST indexes for the large, frequently compared types;
+        # ST_Within lookups scoped by district_type search a much smaller tree.
+        *(
+            Index(
+                f"idx_district_boundary_geom_{district_type}",
+                "geom",
+                postgresql_using="gist",
+                postgresql_with={"fillfactor": 90},
+                postgresql_where=text(f"district_type = '{district_type}'"),
+            )
+            for district_type in PARTIAL_GEOM_INDEX_TYPES
+        ),
     )
 
     def __repr__(self) -> str:
@@ -436,6 +495,7 @@ class VoterDistrictAssignment(Base):
 
     id = Column(Integer, primary_key=True)
 
+    # Same (unbounded) type as voters.voter_registration_number so FK joins compare like types
     voter_id = Column(
         String,
         ForeignKey("voters.voter_registration_number"),
@@ -463,10 +523,43 @@ class VoterDistrictAssignment(Base):
 
     __table_args__ = (
         UniqueConstraint("voter_id", "district_type", name="uq_voter_district_type"),
-        Index("idx_vda_voter", "voter_id"),
-        Index("idx_vda_type", "district_type"),
-        Index("idx_vda_mismatch", "is_mismatch"),
+        Index("idx_vda_mismatch", "is_mismatch", postgresql_where=text("is_mismatch = true")),
         # Composite indexes for filtering performance
+        # (their leading columns also serve voter_id-only / district_type-only lookups)
         Index("idx_vda_voter_mismatch", "voter_id", "is_mismatch"),
-        Index("idx_vda_type_mismatch", "district_type", "is_mismatch"),
+        # INCLUDE columns let the per-district mismatch map query run as an index-only scan
+        Index(
+            "idx_vda_type_mismatch",
+            "district_type",
+            "is_mismatch",
+            postgresql_include=["voter_id", "spatial_district_id"],
+        ),
+        Index(
+            "idx_vda_compared_at_brin",
+            "compared_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
     )
+
+
+class LoadHistory(Base):
+    """Content hash of each voter CSV loaded with load-csv.
+
+    Lets load-csv skip a file whose bytes are identical to the last load of
+    the same path.
+    """
+
+    __tablename__ = "load_history"
+
+    # Resolved absolute path of the loaded CSV
+    file_path = Column(Text, primary_key=True)
+
+    # BLAKE2b digest of the file contents
+    file_hash = Column(LargeBinary, nullable=False)
+    row_count = Column(Integer, nullable=False)
+    loaded_at = Column(DateTime, nullable=False, default=func.now())
+
+    def __repr__(self) -> str:
+        """String representation of LoadHistory model."""
+        return f"<LoadHistory(file_path='{self.file_path}', row_count={self.row_count})>"
@@ -3,13 +3,18 @@
 import hashlib
 import json
 import math
+from collections import Counter
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 from geoalchemy2 import WKTElement
 from loguru import logger
 from shapely.geometry import shape
-from sqlalchemy import case, func, or_, text
+from sqlalchemy import TextClause, case, delete, func, or_, select, text
 from sqlalchemy.orm import Session
 
 from vote_match.config import Settings
@@ -66,6 +71,180 @@ def normalize_district_id(value: str | None) -> str | None:
     return normalized
 
 
+@lru_cache(maxsize=8)
+def _voter_load_statements(columns: tuple[str, ...]) -> tuple[TextClause, str, TextClause]:
+    """Build the staging, COPY and merge statements for a set of CSV columns.
+
+    Cached so repeated loads with the same header reuse the same statement
+    objects (and SQLAlchemy's compiled cache entries).
+    """
+    column_list = ", ".join(columns)
+    update_columns = [col for col in columns if col != "voter_registration_number"]
+
+    create_stage = text(
+        f"CREATE TEMP TABLE voters_stage ON COMMIT DROP AS "
+        f"SELECT {column_list} FROM voters WITH NO DATA"
+    )
+    copy_sql = f"COPY voters_stage ({column_list}) FROM STDIN"
+
+    set_clause = ", ".join(f"{col} = EXCLUDED.{col}" for col in update_columns)
+    current = ", ".join(f"voters.{col}" for col in update_columns)
+    incoming = ", ".join(f"EXCLUDED.{col}" for col in update_columns)
+    merge = text(
+        f"""
+        INSERT INTO voters ({column_list})
+        SELECT DISTINCT ON (voter_registration_number) {column_list}
+        FROM voters_stage
+        ORDER BY voter_registration_number, load_order DESC
+        ON CONFLICT (voter_registration_number) DO UPDATE
+        SET {set_clause}
+        WHERE ({current}) IS DISTINCT FROM ({incoming})
+        RETURNING (xmax = 0) AS inserted
+        """
+    )
+    return create_stage, copy_sql, merge
+
+
+def bulk_upsert_voters(
+    session: Session,
+    columns: list[str],
+    rows: Iterable[Sequence[str | None]],
+    progress_callback: Callable[[int], None] | None = None,
+    progress_every: int = 10000,
+) -> dict[str, int]:
+    """Upsert voter rows using COPY into a staging table and one INSERT ... SELECT.
+
+    Rows are streamed with COPY FROM STDIN into a temporary staging table,
+    then merged into voters with a single ON CONFLICT statement. Rows whose
+    values are identical to the existing voter are not rewritten. If a voter
+    registration number appears more than once, the last occurrence wins.
+
+    The caller is responsible for committing the session.
+
+    Args:
+        session: SQLAlchemy database session (psycopg driver)
+        columns: Voter column names, in the order values appear in each row
+        rows: Iterable of value tuples (str or None), one per voter
+        progress_callback: Optional callback receiving the number of rows
+            staged since the previous call
+        progress_every: How many rows to stage between progress callbacks
+
+    Returns:
+        Dictionary with statistics: staged, inserted, updated, unchanged
+    """
+    create_stage, copy_sql, merge = _voter_load_statements(tuple(columns))
+
+    # Staging table with just the CSV columns plus the file order (ON COMMIT DROP)
+    session.execute(create_stage)
+    session.execute(
+        text("ALTER TABLE voters_stage ADD COLUMN load_order BIGINT GENERATED ALWAYS AS IDENTITY")
+    )
+
+    # COPY runs on the session's own connection so it sees the temp table
+    dbapi_connection = session.connection().connection.driver_connection
+    staged = 0
+    pending = 0
+    with dbapi_connection.cursor() as cursor:
+        with cursor.copy(copy_sql) as copy:
+            for row in rows:
+                copy.write_row(row)
+                staged += 1
+                pending += 1
+                if progress_callback and pending >= progress_every:
+                    progress_callback(pending)
+                    pending = 0
+    if progress_callback and pending:
+        progress_callback(pending)
+
+    logger.info("Staged {} voter rows via COPY", staged)
+
+    result = session.execute(merge)
+    inserted = 0
+    updated = 0
+    for (was_inserted,) in result:
+        if was_inserted:
+            inserted += 1
+        else:
+            updated += 1
+
+    stats = {
+        "staged": staged,
+        "inserted": inserted,
+        "updated": updated,
+        "unchanged": staged - inserted - updated,
+    }
+    logger.info(
+        "Voter upsert complete: {} inserted, {} updated, {} unchanged",
+        inserted,
+        updated,
+        stats["unchanged"],
+    )
+    return stats
+
+
+def drop_voter_indexes(session: Session) -> list[tuple[str, str]]:
+    """Drop the secondary indexes on voters ahead of a bulk load.
+
+    The primary key (the ON CONFLICT target) and indexes backing constraints
+    are kept. DROP INDEX is transactional, so if the load fails and the
+    session rolls back, the dropped indexes come back with it.
+
+    Args:
+        session: SQLAlchemy database session
+
+    Returns:
+        List of (index name, CREATE INDEX statement) pairs to pass to
+        recreate_indexes() after the load
+    """
+    indexes = [
+        (name, definition)
+        for name, definition in session.execute(
+            text(
+                """
+                SELECT i.indexrelid::regclass::text, pg_get_indexdef(i.indexrelid)
+                FROM pg_index i
+                WHERE i.indrelid = 'voters'::regclass
+                  AND NOT i.indisprimary
+                  AND NOT EXISTS (
+                      SELECT 1 FROM pg_constraint c WHERE c.conindid = i.indexrelid
+                  )
+                """
+            )
+        )
+    ]
+    for name, _definition in indexes:
+        session.execute(text(f"DROP INDEX {name}"))
+
+    logger.info("Dropped {} voter indexes for bulk load", len(indexes))
+    return indexes
+
+
+def recreate_indexes(
+    session: Session,
+    indexes: list[tuple[str, str]],
+    progress_callback: Callable[[str], None] | None = None,
+) -> None:
+    """Recreate indexes dropped by drop_voter_indexes().
+
+    Runs in the load transaction, so the table is never committed without
+    its indexes. PostgreSQL builds B-tree indexes with parallel workers
+    (max_parallel_maintenance_workers).
+
+    Args:
+        session: SQLAlchemy database session
+        indexes: (index name, CREATE INDEX statement) pairs
+        progress_callback: Optional callback invoked with each index name
+            once it has been rebuilt
+    """
+    for name, definition in indexes:
+        logger.debug("Recreating index {}", name)
+        session.execute(text(definition))
+        if progress_callback:
+            progress_callback(name)
+
+    logger.info("Recreated {} voter indexes", len(indexes))
+
+
 def get_pending_voters(
     session: Session,
     limit: int | None = None,
@@ -242,7 +421,7 @@ def process_geocoding(
         batch_num = (i // batch_size) + 1
         total_batches = (len(voters) + batch_size - 1) // batch_size
 
-        logger.info("Processing batch {}/{} ({} records)", batch_num, total_batches, len(batch))
+        logger.debug("Processing batch {}/{} ({} records)", batch_num, total_batches, len(batch))
 
         try:
             # Build CSV for this batch
@@ -521,7 +700,9 @@ def get_voters_for_geocoding(
         limit: Maximum number of voters to return
         only_unmatched: If True, only return voters with no_match/failed from ANY service
                        If False, only return voters with no results at all
-        retry_failed: If True, include voters with failed status
+        retry_failed: If True, include voters with failed status. Earlier failed
+            attempts are kept as history; they no longer count as having been
+            processed, and the new result supersedes them in best-result selection
 
     Returns:
         List of Voter objects needing geocoding
@@ -573,11 +754,12 @@ def get_voters_for_geocoding(
             )
 
         # Exclude voters already processed by THIS specific service
-        this_service_subquery = (
-            session.query(GeocodeResultModel.voter_id)
-            .filter(GeocodeResultModel.service_name == service_name)
-            .subquery()
+        this_service_query = session.query(GeocodeResultModel.voter_id).filter(
+            GeocodeResultModel.service_name == service_name
         )
+        if retry_failed:
+            this_service_query = this_service_query.filter(GeocodeResultModel.status != "failed")
+        this_service_subquery = this_service_query.subquery()
         query = query.outerjoin(
             this_service_subquery,
             Voter.voter_registration_number == this_service_subquery.c.voter_id,
@@ -586,7 +768,11 @@ def get_voters_for_geocoding(
 
     else:
         # DEFAULT STRATEGY (Census): Find voters with NO geocoding results at all
-        any_result_subquery = session.query(GeocodeResultModel.voter_id).distinct().subquery()
+        any_result_query = session.query(GeocodeResultModel.voter_id)
+        if retry_failed:
+            # Voters whose only results are failures are tried again
+            any_result_query = any_result_query.filter(GeocodeResultModel.status != "failed")
+        any_result_subquery = any_result_query.distinct().subquery()
         query = query.outerjoin(
             any_result_subquery,
             Voter.voter_registration_number == any_result_subquery.c.voter_id,
@@ -612,43 +798,118 @@ def get_voters_for_geocoding(
     return voters
 
 
+def delete_geocode_results_in_batches(
+    session: Session,
+    service_name: str | None = None,
+    status: str | None = None,
+    batch_size: int = 10_000,
+    progress_callback: Callable[[int], None] | None = None,
+) -> int:
+    """Delete geocode results matching the filters, batch_size rows at a time.
+
+    Each batch is committed on its own, so row locks and WAL growth stay
+    bounded however many results match. A batch shorter than batch_size
+    means nothing is left, so no final empty DELETE is issued.
+
+    Args:
+        session: SQLAlchemy session
+        service_name: Only delete results from this service
+        status: Only delete results with this status
+        batch_size: Maximum rows deleted per transaction
+        progress_callback: Called with the number of rows removed by each batch
+
+    Returns:
+        Total number of deleted results
+    """
+    conditions = []
+    if service_name:
+        conditions.append(GeocodeResultModel.service_name == service_name)
+    if status:
+        conditions.append(GeocodeResultModel.status == status)
+
+    batch_ids = select(GeocodeResultModel.id).where(*conditions).limit(batch_size)
+    delete_stmt = delete(GeocodeResultModel).where(GeocodeResultModel.id.in_(batch_ids))
+
+    deleted = 0
+    while True:
+        rowcount = session.execute(
+            delete_stmt.execution_options(synchronize_session=False)
+        ).rowcount
+        session.commit()
+        deleted += rowcount
+        if progress_callback and rowcount:
+            progress_callback(rowcount)
+        if rowcount < batch_size:
+            break
+
+    logger.info(f"Deleted {deleted} geocode results in batches of {batch_size}")
+    return deleted
+
+
+_GEOCODE_RESULT_COPY = (
+    "COPY geocode_results (voter_id, service_name, status, longitude, latitude, "
+    "matched_address, match_confidence, raw_response, error_message) FROM STDIN"
+)
+
+
 def save_geocode_results(session: Session, results: list[StandardGeocodeResult]) -> int:
     """Save geocoding results to the database.
 
+    Results are streamed into geocode_results with COPY FROM STDIN on the
+    session's connection. The table is append-only, so no merge step is
+    needed; geocoded_at and id come from the column defaults.
+
     Args:
-        session: SQLAlchemy session
+        session: SQLAlchemy session (psycopg driver)
         results: List of StandardGeocodeResult objects
 
     Returns:
         Count of saved records
     """
-    saved_count = 0
+    dbapi_connection = session.connection().connection.driver_connection
+    with dbapi_connection.cursor() as cursor:
+        with cursor.copy(_GEOCODE_RESULT_COPY) as copy:
+            for result in results:
+                copy.write_row(
+                    (
+                        result.voter_id,
+                        result.service_name,
+                        result.status.value,
+                        result.longitude,
+                        result.latitude,
+                        result.matched_address,
+                        result.match_confidence,
+                        json.dumps(result.raw_response),
+                        result.error_message,
+                    )
+                )
 
-    for result in results:
-        # Create GeocodeResult model instance
-        geocode_result = GeocodeResultModel(
-            voter_id=result.voter_id,
-            service_name=result.service_name,
-            status=result.status.value,
-            longitude=result.longitude,
-            latitude=result.latitude,
-            matched_address=result.matched_address,
-            match_confidence=result.match_confidence,
-            raw_response=result.raw_response,
-            error_message=result.error_message,
-        )
+    session.commit()
+    logger.debug("Saved {} geocoding results to database", len(results))
 
-        session.add(geocode_result)
-        saved_count += 1
+    return len(results)
 
-        logger.debug(
-            f"Saved {result.service_name} result for voter {result.voter_id}: {result.status.value}"
-        )
 
-    session.commit()
-    logger.info(f"Saved {saved_count} geocoding results to database")
+def _failed_geocode_results(
+    service: GeocodeService, voters: list[Voter], error: Exception
+) -> list[StandardGeocodeResult]:
+    """Build FAILED results for every voter in a batch that errored."""
+    from vote_match.geocoding.base import GeocodeQuality
 
-    return saved_count
+    return [
+        StandardGeocodeResult(
+            voter_id=voter.voter_registration_number,
+            service_name=service.service_name,
+            status=GeocodeQuality.FAILED,
+            longitude=None,
+            latitude=None,
+            matched_address=None,
+            match_confidence=None,
+            raw_response={},
+            error_message=str(error),
+        )
+        for voter in voters
+    ]
 
 
 def process_geocoding_service(
@@ -658,9 +919,16 @@ def process_geocoding_service(
     limit: Optional[int] = None,
     only_unmatched: bool = True,
     retry_failed: bool = False,
+    max_concurrent_batches: int = 1,
+    progress_callback: Callable[[int, int], None] | None = None,
 ) -> dict[str, int]:
     """Unified geocoding processing pipeline for any service.
 
+    Batches are prepared and parsed on the calling thread, which also owns
+    the database session. Only the HTTP round trip (service.submit_request)
+    runs in a worker thread, so with max_concurrent_batches > 1 several
+    requests are in flight while finished batches are being saved.
+
     Args:
         session: SQLAlchemy session
         service: GeocodeService instance to use
@@ -668,6 +936,9 @@ def process_geocoding_service(
         limit: Maximum total records to process
         only_unmatched: Only process voters with no successful match from any service
         retry_failed: Include voters with failed status
+        max_concurrent_batches: Batches submitted to the service at the same time
+        progress_callback: Optional callback receiving (records done, total
+            records), called once the voters are selected and after each batch
 
     Returns:
         Dictionary with statistics:
@@ -678,8 +949,6 @@ def process_geocoding_service(
         - no_match: No matches found
         - failed: Failed records
     """
-    from vote_match.geocoding.base import GeocodeQuality
-
     # Initialize statistics
     stats = {
         "total": 0,
@@ -703,66 +972,78 @@ def process_geocoding_service(
         logger.info(f"No voters to geocode with {service.service_name}")
         return stats
 
+    if progress_callback:
+        progress_callback(0, len(voters))
+
+    max_concurrent_batches = max(1, max_concurrent_batches)
+    total_batches = (len(voters) + batch_size - 1) // batch_size
     logger.info(
-        f"Processing {len(voters)} voters with {service.service_name} in batches of {batch_size}"
+        f"Processing {len(voters)} voters with {service.service_name} in batches of "
+        f"{batch_size} ({max_concurrent_batches} concurrent)"
     )
 
-    # Process in batches
-    for i in range(0, len(voters), batch_size):
-        batch = voters[i : i + batch_size]
-        batch_num = (i // batch_size) + 1
-        total_batches = (len(voters) + batch_size - 1) // batch_size
+    batches = (
+        ((i // batch_size) + 1, voters[i : i + batch_size])
+        for i in range(0, len(voters), batch_size)
+    )
 
-        logger.info(f"Processing batch {batch_num}/{total_batches} ({len(batch)} records)")
+    def save_batch(batch_num: int, results: list[StandardGeocodeResult]) -> None:
+        """Save one batch of results and fold them into the statistics."""
+        save_geocode_results(session, results)
 
-        try:
-            # Geocode batch using service
-            results = service.geocode_batch(batch)
+        counts = Counter(result.status.value for result in results)
+        stats["total"] += len(results)
+        for status, count in counts.items():
+            if status in stats:
+                stats[status] += count
+            else:
+                stats["failed"] += count
 
-            # Save results to database
-            save_geocode_results(session, results)
+        if progress_callback:
+            progress_callback(stats["total"], len(voters))
 
-            # Update statistics
-            stats["total"] += len(results)
-            for result in results:
-                status = result.status.value
-                if status in stats:
-                    stats[status] += 1
-                else:
-                    stats["failed"] += 1
+        logger.info(
+            f"Batch {batch_num}/{total_batches} completed: "
+            f"{counts['exact']} exact, "
+            f"{counts['interpolated']} interpolated, "
+            f"{counts['approximate']} approximate, "
+            f"{counts['no_match']} no_match, "
+            f"{counts['failed']} failed"
+        )
 
-            logger.info(
-                f"Batch {batch_num}/{total_batches} completed: "
-                f"{sum(1 for r in results if r.status.value == 'exact')} exact, "
-                f"{sum(1 for r in results if r.status.value == 'interpolated')} interpolated, "
-                f"{sum(1 for r in results if r.status.value == 'approximate')} approximate, "
-                f"{sum(1 for r in results if r.status.value == 'no_match')} no_match, "
-                f"{sum(1 for r in results if r.status.value == 'failed')} failed"
+    def submit_next(executor: ThreadPoolExecutor, in_flight: dict) -> None:
+        """Prepare the next batch and hand its request to the executor."""
+        for batch_num, batch in batches:
+            logger.debug(
+                "Processing batch {}/{} ({} records)", batch_num, total_batches, len(batch)
             )
-
-        except Exception as e:
-            # On error, mark batch as failed
-            logger.error(f"Batch {batch_num}/{total_batches} failed: {e}")
-
-            # Create failed results for this batch
-            failed_results = [
-                StandardGeocodeResult(
-                    voter_id=voter.voter_registration_number,
-                    service_name=service.service_name,
-                    status=GeocodeQuality.FAILED,
-                    longitude=None,
-                    latitude=None,
-                    matched_address=None,
-                    match_confidence=None,
-                    raw_response={},
-                    error_message=str(e),
-                )
-                for voter in batch
-            ]
-
-            save_geocode_results(session, failed_results)
-            stats["failed"] += len(batch)
-            stats["total"] += len(batch)
+            try:
+                prepared = service.prepare_addresses(batch)
+            except Exception as e:
+                logger.error(f"Batch {batch_num}/{total_batches} failed: {e}")
+                save_batch(batch_num, _failed_geocode_results(service, batch, e))
+                continue
+            in_flight[executor.submit(service.submit_request, prepared)] = (batch_num, batch)
+            return
+
+    with ThreadPoolExecutor(max_workers=max_concurrent_batches) as executor:
+        in_flight: dict = {}
+        for _ in range(max_concurrent_batches):
+            submit_next(executor, in_flight)
+
+        while in_flight:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                batch_num, batch = in_flight.pop(future)
+                try:
+                    results = service.parse_response(future.result(), batch)
+                except Exception as e:
+                    # On error, mark batch as failed
+                    logger.error(f"Batch {batch_num}/{total_batches} failed: {e}")
+                    results = _failed_geocode_results(service, batch, e)
+
+                save_batch(batch_num, results)
+                submit_next(executor, in_flight)
 
     logger.info(
         f"Geocoding complete with {service.service_name}: "
@@ -777,15 +1058,12 @@ def process_geocoding_service(
     return stats
 
 
-def _clear_voter_geocode(voter: "Voter", update_legacy_fields: bool) -> None:
-    """Clear a voter's geometry and optionally legacy geocode fields."""
-    voter.geom = None
-    if update_legacy_fields:
-        voter.geocode_status = None
-        voter.geocode_match_type = None
-        voter.geocode_matched_address = None
-        voter.geocode_longitude = None
-        voter.geocode_latitude = None
+_SYNC_LEGACY_SET = """,
+        geocode_status = CASE WHEN p.has_coords THEN p.status::text END,
+        geocode_match_type = CASE WHEN p.has_coords THEN p.status::text END,
+        geocode_matched_address = CASE WHEN p.has_coords THEN p.matched_address END,
+        geocode_longitude = CASE WHEN p.has_coords THEN p.longitude END,
+        geocode_latitude = CASE WHEN p.has_coords THEN p.latitude END"""
 
 
 def sync_best_geocode_to_voters(
@@ -801,6 +1079,14 @@ def sync_best_geocode_to_voters(
     legacy geocode_* fields) with the best geocoding result from the
     GeocodeResult table. Required for QGIS visualization.
 
+    The best result per voter is picked with DISTINCT ON and applied with a
+    single UPDATE ... FROM in a data-modifying CTE (which PostgreSQL runs
+    even though the final SELECT only reads the plan), so the sync is one
+    statement regardless of the number of voters. geocode_quality enum
+    values sort in quality order (exact > interpolated > approximate >
+    no_match > failed); ties go to the higher match confidence, as in
+    Voter.best_geocode_result.
+
     Args:
         session: SQLAlchemy session
         limit: Maximum number of voters to process (None for all)
@@ -812,120 +1098,98 @@ def sync_best_geocode_to_voters(
         Dictionary with statistics:
         - total_processed: Voters examined
         - updated: Voters with geometry updated
+        - cleared: Voters whose geometry was cleared (service_name set and
+          that service has no usable result)
         - skipped_no_results: Voters with no geocode results
         - skipped_no_coords: Voters with results but no coordinates
         - skipped_already_set: Voters with geom already set (force_update=False)
     """
-    stats = {
-        "total_processed": 0,
-        "updated": 0,
-        "cleared": 0,
-        "skipped_no_results": 0,
-        "skipped_no_coords": 0,
-        "skipped_already_set": 0,
-    }
-
-    # Build query for voters with geocode results
-    query = session.query(Voter)
-
-    if not force_update:
-        # Only process voters without geometry
-        query = query.filter(Voter.geom.is_(None))
-
-    # Order consistently
-    query = query.order_by(Voter.voter_registration_number)
-
-    if limit:
-        query = query.limit(limit)
-
-    voters = query.all()
     logger.info(
-        f"Syncing best geocode results to {len(voters)} voters "
-        f"(force_update={force_update}, update_legacy_fields={update_legacy_fields}, "
-        f"service_name={service_name})"
+        "Syncing best geocode results to voters "
+        f"(limit={limit}, force_update={force_update}, "
+        f"update_legacy_fields={update_legacy_fields}, service_name={service_name})"
     )
 
-    quality_order = ["exact", "interpolated", "approximate", "no_match", "failed"]
-
-    def _pick_best(results: list) -> Optional["GeocodeResult"]:
-        """Pick highest quality result from a list of GeocodeResults."""
-        if not results:
-            return None
-
-        def sort_key(result: "GeocodeResult") -> tuple[int, float]:
-            try:
-                rank = quality_order.index(result.status)
-            except ValueError:
-                rank = len(quality_order)
-            confidence = result.match_confidence if result.match_confidence else 0.0
-            return (rank, -confidence)
-
-        return sorted(results, key=sort_key)[0]
-
-    for voter in voters:
-        stats["total_processed"] += 1
-
-        # Get best geocode result, optionally filtered by service
-        if service_name:
-            results = [r for r in voter.geocode_results if r.service_name == service_name]
-            best_result = _pick_best(results)
-        else:
-            best_result = voter.best_geocode_result
-
-        if not best_result:
-            stats["skipped_no_results"] += 1
-            if service_name and voter.geom is not None:
-                _clear_voter_geocode(voter, update_legacy_fields)
-                stats["cleared"] += 1
-            logger.debug(f"Voter {voter.voter_registration_number} has no geocode results")
-            continue
-
-        # Check if result has valid coordinates
-        if best_result.longitude is None or best_result.latitude is None:
-            stats["skipped_no_coords"] += 1
-            if service_name and voter.geom is not None:
-                _clear_voter_geocode(voter, update_legacy_fields)
-                stats["cleared"] += 1
-            logger.debug(
-                f"Voter {voter.voter_registration_number} best result has no coordinates "
-                f"(status={best_result.status})"
-            )
-            continue
-
-        # Skip if already has geometry and not forcing update
-        if not force_update and voter.geom is not None:
-            stats["skipped_already_set"] += 1
-            continue
-
-        # Update geometry
-        wkt = f"POINT({best_result.longitude} {best_result.latitude})"
-        voter.geom = WKTElement(wkt, srid=4326)
-
-        # Update legacy fields if requested
-        if update_legacy_fields:
-            voter.geocode_status = best_result.status
-            voter.geocode_match_type = best_result.status  # Same as status for filtering
-            voter.geocode_matched_address = best_result.matched_address
-            voter.geocode_longitude = best_result.longitude
-            voter.geocode_latitude = best_result.latitude
-
-            # Note: Legacy fields like tigerline_id, FIPS codes, etc.
-            # are Census-specific and stored in raw_response
-            # We don't populate them here to keep it service-agnostic
+    sql = f"""
+        WITH candidates AS (
+            SELECT voter_registration_number, geom IS NOT NULL AS has_geom
+            FROM voters
+            WHERE :force_update OR geom IS NULL
+            ORDER BY voter_registration_number
+            LIMIT :limit
+        ),
+        best AS (
+            SELECT DISTINCT ON (g.voter_id)
+                g.voter_id, g.status, g.matched_address, g.longitude, g.latitude
+            FROM geocode_results g
+            JOIN candidates c ON c.voter_registration_number = g.voter_id
+            WHERE CAST(:service_name AS text) IS NULL OR g.service_name = :service_name
+            ORDER BY g.voter_id, g.status, COALESCE(g.match_confidence, 0) DESC
+        ),
+        plan AS (
+            SELECT
+                c.voter_registration_number,
+                c.has_geom,
+                b.voter_id IS NOT NULL AS has_result,
+                b.longitude IS NOT NULL AND b.latitude IS NOT NULL AS has_coords,
+                b.status,
+                b.matched_address,
+                b.longitude,
+                b.latitude
+            FROM candidates c
+            LEFT JOIN best b ON b.voter_id = c.voter_registration_number
+        ),
+        applied AS (
+            UPDATE voters v
+            SET geom = CASE
+                    WHEN p.has_coords
+                    THEN ST_SetSRID(ST_MakePoint(p.longitude, p.latitude), 4326)
+                END{_SYNC_LEGACY_SET if update_legacy_fields else ""}
+            FROM plan p
+            WHERE v.voter_registration_number = p.voter_registration_number
+              AND (p.has_coords OR (:clear_missing AND p.has_geom))
+        )
+        SELECT
+            count(*) AS total_processed,
+            count(*) FILTER (WHERE has_coords) AS updated,
+            count(*) FILTER (WHERE :clear_missing AND has_geom AND NOT has_coords) AS cleared,
+            count(*) FILTER (WHERE NOT has_result) AS skipped_no_results,
+            count(*) FILTER (WHERE has_result AND NOT has_coords) AS skipped_no_coords
+        FROM plan
+    """
 
-        stats["updated"] += 1
+    row = (
+        session.execute(
+            text(sql),
+            {
+                "force_update": force_update,
+                "limit": limit,
+                "service_name": service_name,
+                "clear_missing": service_name is not None,
+            },
+        )
+        .mappings()
+        .one()
+    )
 
-        if stats["updated"] % 1000 == 0:
-            logger.info(f"Progress: {stats['updated']} voters updated...")
+    stats = {
+        "total_processed": row["total_processed"],
+        "updated": row["updated"],
+        "cleared": row["cleared"],
+        "skipped_no_results": row["skipped_no_results"],
+        "skipped_no_coords": row["skipped_no_coords"],
+        # Voters with geometry are filtered out up front unless force_update is set
+        "skipped_already_set": 0,
+    }
 
     # Commit all updates
     session.commit()
 
     logger.info(
         f"Sync complete: {stats['updated']} updated, "
+        f"{stats['cleared']} cleared, "
         f"{stats['skipped_no_results']} no results, "
-        f"{stats['skipped_no_coords']} no coords, "
-        f"{stats['skipped_already_set']} already set"
+        f"{stats['skipped_no_coords']} no coords"
     )
 
     return stats
@@ -1054,15 +1318,27 @@ def import_geojson_districts(
     return stats
 
 
+@dataclass(slots=True, frozen=True)
+class CompareStats:
+    """Counts from compare_voter_districts()."""
+
+    total: int  # Voter/district rows compared
+    matched: int
+    mismatched: int
+    no_location: int  # Always 0: only voters with a location are compared
+    no_district: int  # No containing district, or no registered district
+
+
 def compare_voter_districts(
     session: Session,
     limit: int | None = None,
-) -> dict[str, int | list[dict]]:
+) -> dict[str, CompareStats | Iterator[dict]]:
     """Compare voter registration districts with spatially-determined districts.
 
     Uses PostGIS spatial joins to find which district polygon contains each
     voter's geocoded point location, then compares with their registered
-    district.
+    district. The comparison and the counts run in PostgreSQL in a single
+    statement; only mismatched voters come back with their details.
 
     Args:
         session: Database session
@@ -1070,268 +1346,291 @@ def compare_voter_districts(
 
     Returns:
         Dictionary with:
-        - statistics: total, matched, mismatched, no_location, no_district
-        - mismatches: List of mismatch records (voter_id, registered, spatial)
+        - stats: CompareStats with total, matched, mismatched, no_location, no_district
+        - mismatches: Iterator of mismatch records (voter_id, registered, spatial),
+          streamed from the database; consume it before committing the session
     """
+    from itertools import chain
+
     from sqlalchemy import text
 
     logger.info("Starting voter district comparison")
 
-    # Count total voters with geocoded locations
-    total_with_geom = session.query(Voter).filter(Voter.geom.isnot(None)).count()
-    logger.info(f"Found {total_with_geom} voters with geocoded locations")
-
-    # Build query to find spatial district for each voter
-    # Using ST_Within to find which district polygon contains the voter's point
+    # compared: one row per voter/containing-district pair, classified in SQL.
+    # Voter's county_commission_district might be like "District 1" or "1";
+    # the word "District" is stripped before comparing with the district ID.
+    # counts is joined to the mismatch details so there is always one row.
     query = text(
         """
-        SELECT
-            v.voter_registration_number,
-            v.first_name,
-            v.last_name,
-            v.middle_name,
-            v.suffix,
-            v.residence_street_number,
-            v.residence_pre_direction,
-            v.residence_street_name,
-            v.residence_street_type,
-            v.residence_post_direction,
-            v.residence_apt_unit_number,
-            v.residence_city,
-            v.residence_zipcode,
-            v.county_commission_district as registered_district,
-            d.district_id as spatial_district,
-            d.name as spatial_district_name,
-            ST_AsText(v.geom) as voter_location,
-            best_gr.service_name as geocode_service,
-            best_gr.status as geocode_status,
-            best_gr.match_confidence as geocode_confidence,
-            best_gr.matched_address as geocode_matched_address,
-            v.birth_year,
-            v.race,
-            v.gender,
-            v.registration_date,
-            v.last_party_voted,
-            v.last_vote_date
-        FROM voters v
-        LEFT JOIN county_commission_districts d
-            ON ST_Within(v.geom, d.geom)
-        LEFT JOIN LATERAL (
-            SELECT service_name, status, match_confidence, matched_address
-            FROM geocode_results gr
-            WHERE gr.voter_id = v.voter_registration_number
-                AND gr.longitude IS NOT NULL
-                AND gr.latitude IS NOT NULL
-            ORDER BY
-                CASE gr.status
-                    WHEN 'exact' THEN 1
-                    WHEN 'interpolated' THEN 2
-                    WHEN 'approximate' THEN 3
-                    WHEN 'no_match' THEN 4
-                    WHEN 'failed' THEN 5
-                    ELSE 6
-                END,
-                gr.match_confidence DESC NULLS LAST
-            LIMIT 1
-        ) best_gr ON true
-        WHERE v.geom IS NOT NULL
+        WITH compared AS MATERIALIZED (
+            SELECT
+                v.voter_registration_number,
+                v.county_commission_district AS registered_district,
+                d.district_id AS spatial_district,
+                d.name AS spatial_district_name,
+                CASE
+                    WHEN NULLIF(d.district_id, '') IS NULL
+                        OR NULLIF(v.county_commission_district, '') IS NULL
+                        THEN 'no_district'
+                    WHEN btrim(replace(replace(v.county_commission_district,
+                                               'District', ''), 'district', ''))
+                        = btrim(d.district_id)
+                        THEN 'matched'
+                    ELSE 'mismatched'
+                END AS outcome
+            FROM voters v
+            LEFT JOIN county_commission_districts d
+                ON ST_Within(v.geom, d.geom)
+            WHERE v.geom IS NOT NULL
+            LIMIT :limit
+        ),
+        counts AS (
+            SELECT
+                count(*) AS total,
+                count(*) FILTER (WHERE outcome = 'matched') AS matched,
+                count(*) FILTER (WHERE outcome = 'mismatched') AS mismatched,
+                count(*) FILTER (WHERE outcome = 'no_district') AS no_district
+            FROM compared
+        )
+        SELECT counts.*, m.*
+        FROM counts
+        LEFT JOIN (
+            SELECT
+                v.voter_registration_number AS voter_id,
+                v.first_name,
+                v.last_name,
+                v.middle_name,
+                v.suffix,
+                v.residence_street_number,
+                v.residence_pre_direction,
+                v.residence_street_name,
+                v.residence_street_type,
+                v.residence_post_direction,
+                v.residence_apt_unit_number,
+                v.residence_city,
+                v.residence_zipcode,
+                c.registered_district,
+                c.spatial_district,
+                c.spatial_district_name,
+                ST_AsText(v.geom) AS voter_location,
+                best_gr.service_name AS geocode_service,
+                best_gr.status AS geocode_status,
+                best_gr.match_confidence AS geocode_confidence,
+                best_gr.matched_address AS geocode_matched_address,
+                v.birth_year,
+                v.race,
+                v.gender,
+                v.registration_date,
+                v.last_party_voted,
+                v.last_vote_date
+            FROM compared c
+            JOIN voters v ON v.voter_registration_number = c.voter_registration_number
+            LEFT JOIN LATERAL (
+                SELECT service_name, status, match_confidence, matched_address
+                FROM geocode_results gr
+                WHERE gr.voter_id = v.voter_registration_number
+                    AND gr.longitude IS NOT NULL
+                    AND gr.latitude IS NOT NULL
+                ORDER BY gr.status, gr.match_confidence DESC NULLS LAST
+                LIMIT 1
+            ) best_gr ON true
+            WHERE c.outcome = 'mismatched'
+        ) m ON true
         """
     )
 
-    if limit:
-        query = text(str(query) + f" LIMIT {limit}")
-
     logger.info("Executing spatial join query...")
-    results = session.execute(query).fetchall()
+    rows = session.execute(query, {"limit": limit}, execution_options={"yield_per": 10_000})
+
+    first = next(rows)
+    stats = CompareStats(
+        total=first.total,
+        matched=first.matched,
+        mismatched=first.mismatched,
+        no_location=0,
+        no_district=first.no_district,
+    )
 
-    stats = {
-        "total": len(results),
-        "matched": 0,
-        "mismatched": 0,
-        "no_location": 0,
-        "no_district": 0,
-    }
+    logger.info(
+        f"Comparison complete: {stats.matched} matched, "
+        f"{stats.mismatched} mismatched, "
+        f"{stats.no_district} no district found"
+    )
 
-    mismatches = []
-
-    for row in results:
-        voter_id = row[0]
-        first_name = row[1]
-        last_name = row[2]
-        middle_name = row[3]
-        suffix = row[4]
-        street_number = row[5]
-        pre_direction = row[6]
-        street_name = row[7]
-        street_type = row[8]
-        post_direction = row[9]
-        apt_unit = row[10]
-        city = row[11]
-        zipcode = row[12]
-        registered_district = row[13]
-        spatial_district = row[14]
-        spatial_district_name = row[15]
-        voter_location = row[16]
-        geocode_service = row[17]
-        geocode_status = row[18]
-        geocode_confidence = row[19]
-        geocode_matched_address = row[20]
-        birth_year = row[21]
-        race = row[22]
-        gender = row[23]
-        registration_date = row[24]
-        last_party_voted = row[25]
-        last_vote_date = row[26]
-
-        # Build full address for convenience
-        address_parts = [
-            street_number,
-            pre_direction,
-            street_name,
-            street_type,
-            post_direction,
-        ]
-        full_address = " ".join(filter(None, address_parts))
-        if apt_unit:
-            full_address += f" {apt_unit}"
-        if city:
-            full_address += f", {city}"
-        if zipcode:
-            full_address += f" {zipcode}"
-
-        # Build full name for convenience
-        name_parts = [first_name, middle_name, last_name, suffix]
-        full_name = " ".join(filter(None, name_parts))
-
-        # Skip if we couldn't determine spatial district
-        if not spatial_district:
-            stats["no_district"] += 1
-            continue
+    # The counts row carries no details when there are no mismatches
+    mismatches = (_mismatch_record(row) for row in chain([first], rows) if row.voter_id is not None)
 
-        # Skip if voter doesn't have a registered district
-        if not registered_district:
-            stats["no_district"] += 1
-            continue
+    return {
+        "stats": stats,
+        "mismatches": mismatches,
+    }
 
-        # Compare districts (normalize to handle different formats)
-        # Voter's county_commission_district might be like "District 1" or "1"
-        # District ID might be like "1" or "01"
-        registered_normalized = (
-            registered_district.replace("District", "").replace("district", "").strip()
-        )
-        spatial_normalized = spatial_district.strip()
 
-        if registered_normalized == spatial_normalized:
-            stats["matched"] += 1
-        else:
-            stats["mismatched"] += 1
-            mismatches.append(
-                {
-                    "voter_id": voter_id,
-                    "full_name": full_name,
-                    "first_name": first_name or "",
-                    "last_name": last_name or "",
-                    "middle_name": middle_name or "",
-                    "suffix": suffix or "",
-                    "birth_year": birth_year or "",
-                    "race": race or "",
-                    "gender": gender or "",
-                    "registration_date": registration_date or "",
-                    "last_party_voted": last_party_voted or "",
-                    "last_vote_date": last_vote_date or "",
-                    "residence_full_address": full_address,
-                    "residence_street_number": street_number or "",
-                    "residence_pre_direction": pre_direction or "",
-                    "residence_street_name": street_name or "",
-                    "residence_street_type": street_type or "",
-                    "residence_post_direction": post_direction or "",
-                    "residence_apt_unit_number": apt_unit or "",
-                    "residence_city": city or "",
-                    "residence_zipcode": zipcode or "",
-                    "registered_district": registered_district,
-                    "expected_district": spatial_district,
-                    "spatial_district_name": spatial_district_name,
-                    "geocode_service": geocode_service or "",
-                    "geocode_status": geocode_status or "",
-                    "geocode_confidence": geocode_confidence or "",
-                    "geocode_matched_address": geocode_matched_address or "",
-                    "location": voter_location,
-                }
-            )
+# Column order of district mismatch exports (organized for elections board usability)
+MISMATCH_EXPORT_FIELDS = (
+    "voter_id",
+    "full_name",
+    "first_name",
+    "last_name",
+    "middle_name",
+    "suffix",
+    "birth_year",
+    "race",
+    "gender",
+    "registration_date",
+    "last_party_voted",
+    "last_vote_date",
+    "residence_full_address",
+    "residence_street_number",
+    "residence_pre_direction",
+    "residence_street_name",
+    "residence_street_type",
+    "residence_post_direction",
+    "residence_apt_unit_number",
+    "residence_city",
+    "residence_zipcode",
+    "registered_district",
+    "expected_district",
+    "spatial_district_name",
+    "geocode_service",
+    "geocode_status",
+    "geocode_confidence",
+    "geocode_matched_address",
+    "location",
+)
 
-        if (stats["matched"] + stats["mismatched"]) % 1000 == 0:
-            logger.info(
-                f"Progress: {stats['matched'] + stats['mismatched']}/{stats['total']} voters processed..."
-            )
 
-    logger.info(
-        f"Comparison complete: {stats['matched']} matched, "
-        f"{stats['mismatched']} mismatched, "
-        f"{stats['no_district']} no district found"
-    )
+def _mismatch_record(row) -> dict:
+    """Build the export record for one mismatched voter row from compare_voter_districts().
+
+    Values keep their database types (None for NULL); the CSV writer renders
+    None as an empty field and the Parquet writer stores it as null.
+    """
+    # Build full address for convenience
+    address_parts = [
+        row.residence_street_number,
+        row.residence_pre_direction,
+        row.residence_street_name,
+        row.residence_street_type,
+        row.residence_post_direction,
+    ]
+    full_address = " ".join(filter(None, address_parts))
+    if row.residence_apt_unit_number:
+        full_address += f" {row.residence_apt_unit_number}"
+    if row.residence_city:
+        full_address += f", {row.residence_city}"
+    if row.residence_zipcode:
+        full_address += f" {row.residence_zipcode}"
+
+    # Build full name for convenience
+    name_parts = [row.first_name, row.middle_name, row.last_name, row.suffix]
+    full_name = " ".join(filter(None, name_parts))
 
     return {
-        "stats": stats,
-        "mismatches": mismatches,
+        "voter_id": row.voter_id,
+        "full_name": full_name,
+        "first_name": row.first_name,
+        "last_name": row.last_name,
+        "middle_name": row.middle_name,
+        "suffix": row.suffix,
+        "birth_year": row.birth_year,
+        "race": row.race,
+        "gender": row.gender,
+        "registration_date": row.registration_date,
+        "last_party_voted": row.last_party_voted,
+        "last_vote_date": row.last_vote_date,
+        "residence_full_address": full_address,
+        "residence_street_number": row.residence_street_number,
+        "residence_pre_direction": row.residence_pre_direction,
+        "residence_street_name": row.residence_street_name,
+        "residence_street_type": row.residence_street_type,
+        "residence_post_direction": row.residence_post_direction,
+        "residence_apt_unit_number": row.residence_apt_unit_number,
+        "residence_city": row.residence_city,
+        "residence_zipcode": row.residence_zipcode,
+        "registered_district": row.registered_district,
+        "expected_district": row.spatial_district,
+        "spatial_district_name": row.spatial_district_name,
+        "geocode_service": row.geocode_service,
+        "geocode_status": row.geocode_status,
+        "geocode_confidence": row.geocode_confidence,
+        "geocode_matched_address": row.geocode_matched_address,
+        "location": row.voter_location,
     }
 
 
 def export_district_comparison(
-    mismatches: list[dict],
+    mismatches: Iterable[dict],
     output_path: Path,
-) -> None:
-    """Export district comparison mismatches to CSV file.
+) -> int:
+    """Export district comparison mismatches to a CSV or Parquet file.
+
+    A .parquet output path writes zstd-compressed, typed Parquet; any other
+    path writes CSV. Columns follow MISMATCH_EXPORT_FIELDS. Records are
+    written as they are read, so a streamed iterator is never held in memory.
 
     Args:
-        mismatches: List of mismatch records from compare_voter_districts()
-        output_path: Path to output CSV file
+        mismatches: Mismatch records from compare_voter_districts()
+        output_path: Path to output CSV or Parquet file
+
+    Returns:
+        Number of records written
     """
     import csv
 
-    logger.info(f"Exporting {len(mismatches)} mismatches to {output_path}")
-
-    # Define field order for CSV (organized for elections board usability)
-    fieldnames = [
-        "voter_id",
-        "full_name",
-        "first_name",
-        "last_name",
-        "middle_name",
-        "suffix",
-        "birth_year",
-        "race",
-        "gender",
-        "registration_date",
-        "last_party_voted",
-        "last_vote_date",
-        "residence_full_address",
-        "residence_street_number",
-        "residence_pre_direction",
-        "residence_street_name",
-        "residence_street_type",
-        "residence_post_direction",
-        "residence_apt_unit_number",
-        "residence_city",
-        "residence_zipcode",
-        "registered_district",
-        "expected_district",
-        "spatial_district_name",
-        "geocode_service",
-        "geocode_status",
-        "geocode_confidence",
-        "geocode_matched_address",
-        "location",
-    ]
+    logger.info(f"Exporting mismatches to {output_path}")
 
-    with open(output_path, "w", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
+    if output_path.suffix.lower() == ".parquet":
+        written = _write_mismatches_parquet(mismatches, output_path)
+    else:
+        written = 0
+        with open(output_path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=MISMATCH_EXPORT_FIELDS)
+            writer.writeheader()
 
-        if mismatches:
-            writer.writerows(mismatches)
-            logger.info(f"Export complete: {len(mismatches)} records written to {output_path}")
-        else:
-            logger.info("No mismatches to export, wrote empty file with headers")
+            for record in mismatches:
+                writer.writerow(record)
+                written += 1
+
+    if written:
+        logger.info(f"Export complete: {written} records written to {output_path}")
+    else:
+        logger.info("No mismatches to export, wrote empty file with headers")
+    return written
+
+
+def _write_mismatches_parquet(
+    mismatches: Iterable[dict],
+    output_path: Path,
+    batch_size: int = 50_000,
+) -> int:
+    """Write mismatch records to Parquet in batches of batch_size rows.
+
+    birth_year is stored as an integer (null when the voter file value is not
+    a number; the CSV export keeps the raw text) and geocode_confidence as a
+    double; every other field is a string. Missing values are written as nulls.
+
+    Returns:
+        Number of records written
+    """
+    from itertools import batched
+
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    types = {"birth_year": pa.int32(), "geocode_confidence": pa.float64()}
+    schema = pa.schema([(name, types.get(name, pa.string())) for name in MISMATCH_EXPORT_FIELDS])
+    written = 0
+    with pq.ParquetWriter(output_path, schema, compression="zstd") as writer:
+        for batch in batched(mismatches, batch_size):
+            columns = {name: [record[name] for record in batch] for name in MISMATCH_EXPORT_FIELDS}
+            columns["birth_year"] = [
+                int(value) if value and value.isascii() and value.isdigit() else None
+                for value in columns["birth_year"]
+            ]
+            writer.write_table(pa.table(columns, schema=schema))
+            written += len(batch)
+    return written
 
 
 def update_voter_district_comparison(
@@ -1372,83 +1671,80 @@ def update_voter_district_comparison(
         "records_cleared": 0,
     }
 
-    # Clear existing comparison results if requested
-    if clear_existing:
-        # Count voters with existing results
-        count = session.query(Voter).filter(Voter.district_compared_at.isnot(None)).count()
+    # Clear and update run as one transaction. Skipping the WAL flush wait at
+    # commit is safe: the comparison can simply be re-run if it is lost.
+    session.execute(text("SET LOCAL synchronous_commit = off"))
 
-        if count > 0:
-            logger.info(f"Clearing {count} existing comparison results...")
-            session.query(Voter).update(
-                {
-                    Voter.spatial_district_id: None,
-                    Voter.spatial_district_name: None,
-                    Voter.district_mismatch: None,
-                    Voter.district_compared_at: None,
-                }
+    # Clear existing comparison results if requested (same transaction as the update)
+    if clear_existing:
+        cleared = session.execute(
+            text(
+                """
+                UPDATE voters
+                SET spatial_district_id = NULL,
+                    spatial_district_name = NULL,
+                    district_mismatch = NULL,
+                    district_compared_at = NULL
+                WHERE district_compared_at IS NOT NULL
+                """
             )
-            session.commit()
-            stats["records_cleared"] = count
-
-    # Run district comparison
-    logger.info("Running district comparison...")
-    result = compare_voter_districts(session=session, limit=limit)
-
-    comparison_stats = result["stats"]
-
-    stats["total_compared"] = comparison_stats["total"]
-    stats["matched"] = comparison_stats["matched"]
-    stats["mismatched"] = comparison_stats["mismatched"]
-    stats["no_district"] = comparison_stats["no_district"]
+        ).rowcount
+        if cleared:
+            logger.info(f"Cleared {cleared} existing comparison results")
+        stats["records_cleared"] = cleared
 
-    # Build lookup of all comparison results
-    # We need to update ALL voters, not just mismatches
-    comparison_timestamp = datetime.now()
-
-    # Strategy: Use the raw SQL query results to update all voters
-    # This is more efficient than individual updates
-    from sqlalchemy import text
-
-    # Build update query that sets comparison results for all voters
+    # One statement: spatial join, voter update, and counts over the updated rows.
+    # No separate compare_voter_districts() pass is needed just for the counts.
     update_query = text(
         """
-        UPDATE voters v
-        SET
-            spatial_district_id = subq.spatial_district,
-            spatial_district_name = subq.spatial_district_name,
-            district_mismatch = subq.is_mismatch,
-            district_compared_at = :compared_at
-        FROM (
-            SELECT
-                v2.voter_registration_number,
-                d.district_id as spatial_district,
-                d.name as spatial_district_name,
-                CASE
-                    WHEN d.district_id IS NULL THEN NULL
-                    WHEN v2.county_commission_district IS NULL THEN NULL
-                    WHEN REPLACE(REPLACE(LOWER(v2.county_commission_district), 'district', ''), ' ', '')
-                         != LOWER(TRIM(d.district_id))
-                    THEN true
-                    ELSE false
-                END as is_mismatch
-            FROM voters v2
-            LEFT JOIN county_commission_districts d
-                ON ST_Within(v2.geom, d.geom)
-            WHERE v2.geom IS NOT NULL
-            """
-        + (f"LIMIT {limit}" if limit else "")
-        + """
-        ) subq
-        WHERE v.voter_registration_number = subq.voter_registration_number
-    """
+        WITH updated AS (
+            UPDATE voters v
+            SET
+                spatial_district_id = subq.spatial_district,
+                spatial_district_name = subq.spatial_district_name,
+                district_mismatch = subq.is_mismatch,
+                district_compared_at = :compared_at
+            FROM (
+                SELECT
+                    v2.voter_registration_number,
+                    d.district_id as spatial_district,
+                    d.name as spatial_district_name,
+                    CASE
+                        WHEN d.district_id IS NULL THEN NULL
+                        WHEN v2.county_commission_district IS NULL THEN NULL
+                        WHEN REPLACE(REPLACE(LOWER(v2.county_commission_district), 'district', ''), ' ', '')
+                             != LOWER(TRIM(d.district_id))
+                        THEN true
+                        ELSE false
+                    END as is_mismatch
+                FROM voters v2
+                LEFT JOIN county_commission_districts d
+                    ON ST_Within(v2.geom, d.geom)
+                WHERE v2.geom IS NOT NULL
+                LIMIT :limit
+            ) subq
+            WHERE v.voter_registration_number = subq.voter_registration_number
+            RETURNING v.district_mismatch
+        )
+        SELECT
+            count(*) AS updated,
+            count(*) FILTER (WHERE district_mismatch = false) AS matched,
+            count(*) FILTER (WHERE district_mismatch) AS mismatched,
+            count(*) FILTER (WHERE district_mismatch IS NULL) AS no_district
+        FROM updated
+        """
     )
 
     logger.info("Updating voter records with comparison results...")
-    result_proxy = session.execute(update_query, {"compared_at": comparison_timestamp})
-    stats["records_updated"] = result_proxy.rowcount
-
+    counts = session.execute(update_query, {"compared_at": datetime.now(), "limit": limit}).one()
     session.commit()
 
+    stats["total_compared"] = counts.updated
+    stats["records_updated"] = counts.updated
+    stats["matched"] = counts.matched
+    stats["mismatched"] = counts.mismatched
+    stats["no_district"] = counts.no_district
+
     logger.info(
         f"District comparison update complete: {stats['records_updated']} voters updated, "
         f"{stats['matched']} matched, {stats['mismatched']} mismatched, "
@@ -2642,6 +2938,15 @@ def compare_all_districts(
     return results
 
 
+# Columns compared to decide whether an existing assignment needs rewriting
+_ASSIGNMENT_VALUE_COLUMNS = (
+    "registered_value",
+    "spatial_district_id",
+    "spatial_district_name",
+    "is_mismatch",
+)
+
+
 def _save_district_assignments(
     session: Session,
     district_type: str,
@@ -2662,6 +2967,8 @@ def _save_district_assignments(
     for i in range(0, len(assignments), batch_size):
         batch = assignments[i : i + batch_size]
         stmt = pg_insert(VoterDistrictAssignment).values(batch)
+        # Unchanged assignments are not rewritten (no dead tuples or WAL), so
+        # compared_at records when an assignment last changed
         stmt = stmt.on_conflict_do_update(
             constraint="uq_voter_district_type",
             set_={
@@ -2671,6 +2978,14 @@ def _save_district_assignments(
                 "is_mismatch": stmt.excluded.is_mismatch,
                 "compared_at": stmt.excluded.compared_at,
             },
+            where=or_(
+                *(
+                    getattr(VoterDistrictAssignment, column).is_distinct_from(
+                        getattr(stmt.excluded, column)
+                    )
+                    for column in _ASSIGNMENT_VALUE_COLUMNS
+                )
+            ),
         )
         session.execute(stmt)
 
@@ -2683,6 +2998,7 @@ def _update_legacy_mismatch_field(session: Session) -> int:
 
     Sets district_mismatch = True if voter has ANY mismatch across ANY district type.
     This maintains backward compatibility with existing QGIS projects and queries.
+    Voters whose flag is already correct are left untouched.
 
     Returns:
         Number of voters updated
@@ -2704,6 +3020,10 @@ def _update_legacy_mismatch_field(session: Session) -> int:
             GROUP BY voter_id
         ) as subquery
         WHERE voters.voter_registration_number = subquery.voter_id
+          AND (
+              voters.district_mismatch IS DISTINCT FROM subquery.has_mismatch
+              OR voters.district_compared_at IS NULL
+          )
     """
 
     result = session.execute(text(update_sql))
@@ -0,0 +1,237 @@
+"""Tests for CLI helpers."""
+
+import csv
+from contextlib import contextmanager
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+import typer
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from vote_match import cli
+from vote_match.cli import (
+    _export_csv,
+    _voter_export_columns,
+    delete_geocode_results,
+    geocode,
+    status,
+)
+from vote_match.database import init_database
+from vote_match.models import Voter
+
+
+class TestExportCsv:
+    """Tests for the COPY-based CSV export."""
+
+    def _mock_session(self, chunks):
+        """Build a session whose raw cursor streams the given COPY chunks."""
+        session = Mock(spec=Session)
+        copy = MagicMock()
+        copy.__iter__.return_value = iter(chunks)
+        cursor = MagicMock(rowcount=2)
+        cursor.__enter__.return_value = cursor
+        cursor.copy.return_value.__enter__.return_value = copy
+        session.connection.return_value.connection.driver_connection.cursor.return_value = cursor
+        return session, cursor
+
+    def _query(self):
+        columns = _voter_export_columns()
+        return (
+            select(Voter)
+            .where(Voter.county == "BIBB")
+            .with_only_columns(*(Voter.__mapper__.c[key] for key in columns))
+        )
+
+    def test_copy_keeps_column_order_header_and_boolean_format(self, tmp_path):
+        """Test the COPY statement pins the header, column order and True/False booleans."""
+        session, cursor = self._mock_session([])
+
+        _export_csv(session, self._query(), tmp_path / "voters.csv")
+
+        copy_sql = cursor.copy.call_args[0][0]
+        assert copy_sql.endswith("TO STDOUT WITH (FORMAT CSV, HEADER)")
+        assert "WHERE voters.county = 'BIBB'" in copy_sql
+        assert (
+            "CASE WHEN (v.district_mismatch IS true) THEN 'True' "
+            "WHEN (v.district_mismatch IS false) THEN 'False' END AS district_mismatch"
+        ) in copy_sql
+
+        # The CSV header is the outer select list, in export column order
+        select_list = copy_sql.removeprefix("COPY (SELECT ").split("\nFROM", 1)[0]
+        header = [item.split()[-1].removeprefix("v.") for item in select_list.split(", ")]
+        assert header == list(_voter_export_columns())
+        assert "geom" not in header
+
+    def test_copy_output_is_written_unchanged(self, tmp_path):
+        """Test that the bytes PostgreSQL sends are written to the file as-is."""
+        output = tmp_path / "voters.csv"
+        session, _cursor = self._mock_session(
+            [b"voter_registration_number,county,district_mismatch\n", b"1,BIBB,True\n2,,\n"]
+        )
+
+        written = _export_csv(session, self._query(), output)
+
+        assert written == 2
+        assert output.read_text() == (
+            "voter_registration_number,county,district_mismatch\n1,BIBB,True\n2,,\n"
+        )
+
+
+class TestExportCsvDatabase:
+    """Tests for the COPY-based CSV export against PostgreSQL."""
+
+    def test_copy_writes_true_false_booleans(self, test_settings, db_session, tmp_path):
+        """Test that a real COPY writes the export header and True/False/empty booleans."""
+        init_database(drop_tables=True, settings=test_settings, run_migrations=False)
+        db_session.add_all(
+            [
+                Voter(voter_registration_number="1", county="BIBB", district_mismatch=True),
+                Voter(voter_registration_number="2", county="BIBB", district_mismatch=False),
+                Voter(voter_registration_number="3", county="BIBB", district_mismatch=None),
+                Voter(voter_registration_number="4", county="JONES", district_mismatch=True),
+            ]
+        )
+        db_session.flush()
+        output = tmp_path / "voters.csv"
+        query = (
+            select(Voter)
+            .where(Voter.county == "BIBB")
+            .with_only_columns(*(Voter.__mapper__.c[key] for key in _voter_export_columns()))
+            .order_by(Voter.voter_registration_number)
+        )
+
+        written = _export_csv(db_session, query, output)
+
+        with open(output, newline="") as f:
+            reader = csv.DictReader(f)
+            rows = list(reader)
+        assert written == 3
+        assert reader.fieldnames == list(_voter_export_columns())
+        assert [row["voter_registration_number"] for row in rows] == ["1", "2", "3"]
+        assert [row["district_mismatch"] for row in rows] == ["True", "False", ""]
+
+
+class TestStatusCache:
+    """Tests for reusing the status report between repl commands."""
+
+    SUMMARY_ROWS = (("BIBB", "matched", None, 1, 5), (None, None, "validated", 0, 5))
+
+    def _run_status(self, test_settings, session, snapshot):
+        """Run status once against a session reporting the given snapshot."""
+        session.execute.side_effect = [
+            Mock(**{"scalar_one.return_value": snapshot}),
+            iter(self.SUMMARY_ROWS),
+        ]
+
+        @contextmanager
+        def fake_db_session(settings):
+            yield session
+
+        with (
+            patch("vote_match.cli.get_settings", return_value=test_settings),
+            patch("vote_match.database.db_session", fake_db_session),
+            patch("vote_match.processing.get_district_status", return_value={}),
+        ):
+            status(no_cache=False)
+
+    def test_unchanged_snapshot_reuses_report(self, test_settings):
+        """Test that the report is served from cache while the snapshot is unchanged."""
+        cli._status_cache.clear()
+        session = Mock(spec=Session)
+
+        self._run_status(test_settings, session, "100:105:101")
+        self._run_status(test_settings, session, "100:105:101")
+
+        # Second run only probed the snapshot
+        assert session.execute.call_count == 3
+
+    def test_committed_write_invalidates_report(self, test_settings):
+        """Test that a write committing without moving xmax forces a recompute."""
+        cli._status_cache.clear()
+        session = Mock(spec=Session)
+
+        self._run_status(test_settings, session, "100:105:101")
+        # Transaction 101 (e.g. a long load-csv) committed; xmax did not move
+        self._run_status(test_settings, session, "102:105:")
+
+        assert session.execute.call_count == 4
+        assert cli._status_cache[test_settings.database_url][0] == "102:105:"
+
+
+class TestGeocodeWorkers:
+    """Tests for the geocode --workers option."""
+
+    @pytest.mark.parametrize("service", ["mapbox", "nominatim"])
+    def test_rate_limited_service_rejects_extra_workers(self, test_settings, service):
+        """Test that concurrent batches are refused for services with a request rate limit."""
+        with (
+            patch("vote_match.cli.get_settings", return_value=test_settings),
+            patch("vote_match.geocoding.registry.GeocodeServiceRegistry.get_service"),
+            patch("vote_match.processing.process_geocoding_service") as mock_process,
+            pytest.raises(typer.Exit),
+        ):
+            geocode(
+                service=service,
+                batch_size=None,
+                limit=None,
+                only_unmatched=None,
+                retry_failed=False,
+                workers=2,
+            )
+
+        mock_process.assert_not_called()
+
+
+class TestDeleteGeocodeResults:
+    """Tests for the delete-geocode-results command."""
+
+    def test_unknown_status_is_rejected_before_querying(self, test_settings):
+        """Test that a status outside the geocode_quality enum never reaches PostgreSQL."""
+        with (
+            patch("vote_match.cli.get_settings", return_value=test_settings),
+            patch("vote_match.database.db_session") as mock_db_session,
+            pytest.raises(typer.Exit) as exc_info,
+        ):
+            delete_geocode_results(service=None, status="bogus", all_results=False)
+
+        assert exc_info.value.exit_code == 1
+        mock_db_session.assert_not_called()
+
+    def _run_cancelled(self, test_settings, count, **options):
+        """Run the command against a session matching count rows, declining the prompt."""
+        session = Mock(spec=Session)
+        session.execute.return_value.scalar_one.return_value = count
+
+        @contextmanager
+        def fake_db_session(settings):
+            yield session
+
+        with (
+            patch("vote_match.cli.get_settings", return_value=test_settings),
+            patch("vote_match.database.db_session", fake_db_session),
+            patch("vote_match.cli.typer.confirm", return_value=False) as mock_confirm,
+            patch("vote_match.processing.delete_geocode_results_in_batches") as mock_delete,
+            pytest.raises(typer.Exit),
+        ):
+            delete_geocode_results(
+                service=options.get("service"),
+                status=options.get("status"),
+                all_results=options.get("all_results", False),
+            )
+
+        mock_delete.assert_not_called()
+        return mock_confirm
+
+    def test_preview_shows_record_count(self, test_settings, capsys):
+        """Test that the number of matching rows is shown before confirming."""
+        self._run_cancelled(test_settings, 1234, service="census", status="failed")
+
+        assert "Records to delete: 1,234" in capsys.readouterr().out
+
+    def test_confirmation_prompt_includes_record_count(self, test_settings, capsys):
+        """Test that the warning and the prompt both name the number of rows to delete."""
+        mock_confirm = self._run_cancelled(test_settings, 42, status="failed")
+
+        assert "permanently delete 42 geocoding results" in capsys.readouterr().out
+        mock_confirm.assert_called_once_with("Delete 42 geocoding results?")
@@ -8,6 +8,9 @@ import pytest
 from vote_match.csv_reader import (
     COLUMN_MAP,
     REQUIRED_COLUMNS,
+    count_voter_csv_rows,
+    hash_file,
+    iter_voter_csv,
     read_voter_csv,
     dataframe_to_dicts,
 )
@@ -206,6 +209,98 @@ def test_dataframe_to_dicts_only_includes_mapped_columns(tmp_path: Path):
     assert "extra_column" not in records[0]
 
 
+def test_iter_voter_csv_matches_dataframe_to_dicts(full_csv_file: Path):
+    """Test that streamed rows carry the same values as dataframe_to_dicts."""
+    columns, rows = iter_voter_csv(str(full_csv_file))
+    streamed = [dict(zip(columns, row)) for row in rows]
+
+    records = dataframe_to_dicts(read_voter_csv(str(full_csv_file)))
+
+    assert streamed == records
+
+
+def test_iter_voter_csv_strips_utf8_bom(tmp_path: Path, minimal_csv_content: str):
+    """Test that a UTF-8 BOM does not hide the first header column."""
+    csv_file = tmp_path / "bom.csv"
+    csv_file.write_text("\ufeff" + minimal_csv_content, encoding="utf-8")
+
+    columns, rows = iter_voter_csv(str(csv_file))
+
+    assert columns[0] == "voter_registration_number"
+    assert next(rows)[0] == "01234567"
+
+
+def test_iter_voter_csv_closes_abandoned_file(minimal_csv_file: Path, monkeypatch):
+    """Test that the file is closed when the row iterator is abandoned part-way."""
+    import builtins
+
+    opened = []
+    real_open = builtins.open
+
+    def tracking_open(*args, **kwargs):
+        handle = real_open(*args, **kwargs)
+        opened.append(handle)
+        return handle
+
+    monkeypatch.setattr(builtins, "open", tracking_open)
+
+    _columns, rows = iter_voter_csv(str(minimal_csv_file))
+    next(rows)
+    rows.close()
+
+    assert opened
+    assert all(handle.closed for handle in opened)
+
+
+@pytest.mark.parametrize("value", ["NA", "N/A", "NULL", "nan", "None", "#N/A"])
+def test_iter_voter_csv_treats_na_values_as_missing(tmp_path: Path, value: str):
+    """Test that the values pandas read as missing are loaded as None."""
+    csv_file = tmp_path / "na.csv"
+    csv_file.write_text(
+        "Voter Registration Number,Last Name,First Name,County,County Precinct,Residence City\n"
+        f"01234567,DOE,JOHN,FULTON,01-001,{value}\n"
+    )
+
+    columns, rows = iter_voter_csv(str(csv_file))
+    record = dict(zip(columns, next(rows)))
+
+    assert record["residence_city"] is None
+    assert record == dataframe_to_dicts(read_voter_csv(str(csv_file)))[0]
+
+
+def test_iter_voter_csv_missing_required_columns(tmp_path: Path):
+    """Test that iter_voter_csv validates the header before yielding rows."""
+    csv_file = tmp_path / "bad.csv"
+    csv_file.write_text("Voter Registration Number,Last Name\n01234567,DOE\n")
+
+    with pytest.raises(ValueError, match="Missing required columns"):
+        iter_voter_csv(str(csv_file))
+
+
+def test_iter_voter_csv_file_not_found():
+    """Test that iter_voter_csv raises FileNotFoundError for missing file."""
+    with pytest.raises(FileNotFoundError):
+        iter_voter_csv("/nonexistent/path/to/file.csv")
+
+
+def test_count_voter_csv_rows(minimal_csv_file: Path, tmp_path: Path):
+    """Test row counting with and without a trailing newline."""
+    assert count_voter_csv_rows(str(minimal_csv_file)) == 2
+
+    no_trailing_newline = tmp_path / "no_newline.csv"
+    no_trailing_newline.write_text("Header\nrow1\nrow2")
+    assert count_voter_csv_rows(str(no_trailing_newline)) == 2
+
+
+def test_hash_file_matches_blake2b(minimal_csv_file: Path):
+    """Test that hash_file is the BLAKE2b digest of the whole file, regardless of block size."""
+    import hashlib
+
+    expected = hashlib.blake2b(minimal_csv_file.read_bytes()).digest()
+    assert hash_file(str(minimal_csv_file)) == expected
+    assert hash_file(str(minimal_csv_file), block_size=7) == expected
+
+
 def test_column_map_completeness():
     """Test that COLUMN_MAP has entries for all expected columns."""
     # We expect 53 columns in the map (actual Georgia voter file structure)
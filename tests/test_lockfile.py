@@ -0,0 +1,27 @@
+"""Tests that uv.lock is in sync with the dependencies in pyproject.toml."""
+
+import re
+import tomllib
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+
+def _requirement_name(requirement: str) -> str:
+    """Return the normalized distribution name of a PEP 508 requirement string."""
+    name = re.match(r"[A-Za-z0-9._-]+", requirement).group(0)
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+def test_lock_covers_project_dependencies():
+    """Test that every pyproject dependency is locked, and nothing extra is."""
+    pyproject = tomllib.loads((PROJECT_ROOT / "pyproject.toml").read_text())
+    lock = tomllib.loads((PROJECT_ROOT / "uv.lock").read_text())
+
+    declared = {_requirement_name(req) for req in pyproject["project"]["dependencies"]}
+    (project,) = [pkg for pkg in lock["package"] if pkg["name"] == "vote-match"]
+    locked = {req["name"] for req in project["metadata"]["requires-dist"]}
+    resolved = {pkg["name"] for pkg in lock["package"]}
+
+    assert locked == declared, "uv.lock is stale; run 'uv lock'"
+    assert declared <= resolved
@@ -61,6 +61,47 @@ class TestInitDbWithMigrations:
         finally:
             engine.dispose()
 
+    def test_save_geocode_results_without_migrations(self, test_settings: Settings):
+        """Test that COPYed geocode results get geocoded_at on a metadata-created schema."""
+        from sqlalchemy.orm import Session
+
+        from vote_match.geocoding.base import GeocodeQuality, StandardGeocodeResult
+        from vote_match.models import Voter
+        from vote_match.processing import save_geocode_results
+
+        init_database(drop_tables=True, settings=test_settings, run_migrations=False)
+        engine = create_engine(test_settings.database_url)
+
+        try:
+            with Session(engine) as session:
+                session.add(Voter(voter_registration_number="123"))
+                session.commit()
+
+                saved = save_geocode_results(
+                    session,
+                    [
+                        StandardGeocodeResult(
+                            voter_id="123",
+                            service_name="census",
+                            status=GeocodeQuality.EXACT,
+                            longitude=-83.6,
+                            latitude=32.8,
+                            matched_address="123 MAIN ST, MACON, GA, 31201",
+                            match_confidence=1.0,
+                            raw_response={},
+                            error_message=None,
+                        )
+                    ],
+                )
+
+                assert saved == 1
+                geocoded_at = session.execute(
+                    text("SELECT geocoded_at FROM geocode_results WHERE voter_id = '123'")
+                ).scalar_one()
+                assert geocoded_at is not None
+        finally:
+            engine.dispose()
+
 
 class TestMigrationUpgradeDowngrade:
     """Tests for migration upgrade and downgrade operations."""
@@ -1,12 +1,35 @@
 """Tests for processing functions."""
 
-from unittest.mock import Mock, patch
+import threading
+import time
+from collections import Counter
+from unittest.mock import MagicMock, Mock, patch
 
+import pytest
 from geoalchemy2 import WKTElement
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.orm import Session
 
-from vote_match.processing import get_pending_voters, apply_geocode_results, process_geocoding
+from vote_match.processing import (
+    MISMATCH_EXPORT_FIELDS,
+    CompareStats,
+    apply_geocode_results,
+    bulk_upsert_voters,
+    compare_voter_districts,
+    delete_geocode_results_in_batches,
+    drop_voter_indexes,
+    export_district_comparison,
+    get_pending_voters,
+    get_voters_for_geocoding,
+    process_geocoding,
+    process_geocoding_service,
+    recreate_indexes,
+    save_geocode_results,
+    sync_best_geocode_to_voters,
+    update_voter_district_comparison,
+)
 from vote_match.geocoder import GeocodeResult
+from vote_match.geocoding.base import GeocodeQuality, StandardGeocodeResult
 from vote_match.models import Voter
 from vote_match.config import Settings
 
@@ -520,3 +543,559 @@ class TestProcessGeocoding:
                         mock_get_pending.assert_called_once_with(
                             session, limit=None, retry_failed=False, retry_no_match=True
                         )
+
+
+class TestBulkUpsertVoters:
+    """Tests for bulk_upsert_voters function."""
+
+    def _mock_session(self, returning_rows):
+        """Build a session whose raw connection supports cursor().copy()."""
+        session = Mock(spec=Session)
+        copy = MagicMock()
+        cursor = MagicMock()
+        cursor.__enter__.return_value = cursor
+        cursor.copy.return_value.__enter__.return_value = copy
+        driver_connection = Mock()
+        driver_connection.cursor.return_value = cursor
+        session.connection.return_value.connection.driver_connection = driver_connection
+        # CREATE TEMP TABLE, ALTER TABLE, then the INSERT ... RETURNING
+        session.execute.side_effect = [Mock(), Mock(), returning_rows]
+        return session, cursor, copy
+
+    def test_bulk_upsert_streams_rows_and_counts_results(self):
+        """Test that rows are COPYed and inserted/updated/unchanged are counted."""
+        session, cursor, copy = self._mock_session([(True,), (False,)])
+        rows = [("1", "SMITH"), ("2", "JONES"), ("3", "BROWN")]
+
+        stats = bulk_upsert_voters(session, ["voter_registration_number", "last_name"], rows)
+
+        assert copy.write_row.call_count == 3
+        copy_sql = cursor.copy.call_args[0][0]
+        assert copy_sql == "COPY voters_stage (voter_registration_number, last_name) FROM STDIN"
+        merge_sql = str(session.execute.call_args_list[2][0][0])
+        assert "ON CONFLICT (voter_registration_number) DO UPDATE" in merge_sql
+        assert "IS DISTINCT FROM" in merge_sql
+        assert stats == {"staged": 3, "inserted": 1, "updated": 1, "unchanged": 1}
+        session.commit.assert_not_called()
+
+    def test_bulk_upsert_reports_progress(self):
+        """Test that the progress callback receives every staged row."""
+        session, _cursor, _copy = self._mock_session([])
+        progress = Mock()
+        rows = [(str(i), "X") for i in range(5)]
+
+        bulk_upsert_voters(
+            session,
+            ["voter_registration_number", "last_name"],
+            rows,
+            progress_callback=progress,
+            progress_every=2,
+        )
+
+        assert [c.args[0] for c in progress.call_args_list] == [2, 2, 1]
+
+
+class TestSaveGeocodeResults:
+    """Tests for save_geocode_results function."""
+
+    def test_save_copies_results_and_commits(self):
+        """Test that results are written with one COPY and the session is committed."""
+        session = Mock(spec=Session)
+        copy = MagicMock()
+        cursor = MagicMock()
+        cursor.__enter__.return_value = cursor
+        cursor.copy.return_value.__enter__.return_value = copy
+        session.connection.return_value.connection.driver_connection.cursor.return_value = cursor
+        results = [
+            StandardGeocodeResult(
+                voter_id="123",
+                service_name="census",
+                status=GeocodeQuality.EXACT,
+                longitude=-83.6,
+                latitude=32.8,
+                matched_address="123 MAIN ST, MACON, GA, 31201",
+                match_confidence=1.0,
+                raw_response={"tigerline_id": "1"},
+                error_message=None,
+            ),
+            StandardGeocodeResult(
+                voter_id="456",
+                service_name="census",
+                status=GeocodeQuality.NO_MATCH,
+                longitude=None,
+                latitude=None,
+                matched_address=None,
+                match_confidence=None,
+                raw_response={},
+                error_message=None,
+            ),
+        ]
+
+        saved = save_geocode_results(session, results)
+
+        assert saved == 2
+        assert cursor.copy.call_args[0][0].startswith("COPY geocode_results (voter_id,")
+        rows = [c[0][0] for c in copy.write_row.call_args_list]
+        assert rows[0][:3] == ("123", "census", "exact")
+        assert rows[0][7] == '{"tigerline_id": "1"}'
+        assert rows[1][2] == "no_match"
+        assert rows[1][7] == "{}"
+        session.commit.assert_called_once()
+
+    def test_copy_leaves_geocoded_at_to_a_server_default(self):
+        """Test the model declares the now() default the COPY column list relies on."""
+        from sqlalchemy.dialects import postgresql
+        from sqlalchemy.schema import CreateTable
+
+        from vote_match.models import GeocodeResult
+        from vote_match.processing import _GEOCODE_RESULT_COPY
+
+        ddl = str(CreateTable(GeocodeResult.__table__).compile(dialect=postgresql.dialect()))
+
+        assert "geocoded_at" not in _GEOCODE_RESULT_COPY
+        assert "geocoded_at TIMESTAMP WITHOUT TIME ZONE DEFAULT now() NOT NULL" in ddl
+
+
+class TestVoterIndexRebuild:
+    """Tests for drop_voter_indexes and recreate_indexes."""
+
+    def test_drop_and_recreate_round_trip(self):
+        """Test that each secondary index is dropped and its definition replayed."""
+        session = Mock(spec=Session)
+        definitions = [
+            ("ix_voters_county", "CREATE INDEX ix_voters_county ON public.voters (county)"),
+            ("idx_voters_geom", "CREATE INDEX idx_voters_geom ON public.voters USING gist (geom)"),
+        ]
+        session.execute.side_effect = [definitions, Mock(), Mock()]
+
+        dropped = drop_voter_indexes(session)
+
+        assert dropped == definitions
+        executed = [str(c[0][0]) for c in session.execute.call_args_list]
+        assert "NOT i.indisprimary" in executed[0]
+        assert executed[1:] == ["DROP INDEX ix_voters_county", "DROP INDEX idx_voters_geom"]
+
+        session.execute.reset_mock(side_effect=True)
+        rebuilt = []
+        recreate_indexes(session, dropped, progress_callback=rebuilt.append)
+
+        replayed = [str(c[0][0]) for c in session.execute.call_args_list]
+        assert replayed == [definition for _name, definition in definitions]
+        assert rebuilt == ["ix_voters_county", "idx_voters_geom"]
+
+
+class TestSyncBestGeocodeToVoters:
+    """Tests for sync_best_geocode_to_voters function."""
+
+    def _mock_session(self, counts):
+        """Build a session whose single statement returns the given counts."""
+        session = Mock(spec=Session)
+        session.execute.return_value.mappings.return_value.one.return_value = counts
+        return session
+
+    def test_sync_runs_one_statement_and_returns_counts(self):
+        """Test that the sync is a single UPDATE ... FROM and counts come back from it."""
+        session = self._mock_session(
+            {
+                "total_processed": 10,
+                "updated": 7,
+                "cleared": 0,
+                "skipped_no_results": 2,
+                "skipped_no_coords": 1,
+            }
+        )
+
+        stats = sync_best_geocode_to_voters(session, limit=10)
+
+        assert session.execute.call_count == 1
+        sql = str(session.execute.call_args[0][0])
+        params = session.execute.call_args[0][1]
+        assert "DISTINCT ON (g.voter_id)" in sql
+        assert "UPDATE voters v" in sql
+        assert "geocode_status" in sql
+        assert params == {
+            "force_update": False,
+            "limit": 10,
+            "service_name": None,
+            "clear_missing": False,
+        }
+        assert stats == {
+            "total_processed": 10,
+            "updated": 7,
+            "cleared": 0,
+            "skipped_no_results": 2,
+            "skipped_no_coords": 1,
+            "skipped_already_set": 0,
+        }
+        session.commit.assert_called_once()
+
+    def test_sync_skips_legacy_fields_and_clears_for_service(self):
+        """Test that legacy fields are left alone and clearing is enabled per service."""
+        session = self._mock_session(
+            {
+                "total_processed": 0,
+                "updated": 0,
+                "cleared": 0,
+                "skipped_no_results": 0,
+                "skipped_no_coords": 0,
+            }
+        )
+
+        sync_best_geocode_to_voters(
+            session, force_update=True, update_legacy_fields=False, service_name="census"
+        )
+
+        sql = str(session.execute.call_args[0][0])
+        params = session.execute.call_args[0][1]
+        assert "geocode_status" not in sql
+        assert params["clear_missing"] is True
+        assert params["service_name"] == "census"
+        assert params["force_update"] is True
+
+
+class TestProcessGeocodingService:
+    """Tests for process_geocoding_service function."""
+
+    def _service(self, failing_ids=frozenset(), delay=0.0):
+        """Build a service whose requests echo back the prepared voter IDs.
+
+        Requests whose batch contains one of failing_ids raise. The service
+        records the peak number of requests in flight at once.
+        """
+        service = Mock()
+        service.service_name = "census"
+        service.in_flight = 0
+        service.peak_in_flight = 0
+        lock = threading.Lock()
+
+        def submit(prepared):
+            with lock:
+                service.in_flight += 1
+                service.peak_in_flight = max(service.peak_in_flight, service.in_flight)
+            try:
+                time.sleep(delay)
+                if failing_ids.intersection(prepared):
+                    raise RuntimeError("timeout")
+                return prepared
+            finally:
+                with lock:
+                    service.in_flight -= 1
+
+        service.prepare_addresses.side_effect = lambda voters: [
+            v.voter_registration_number for v in voters
+        ]
+        service.submit_request.side_effect = submit
+        service.parse_response.side_effect = lambda response, voters: [
+            StandardGeocodeResult(
+                voter_id=voter_id,
+                service_name="census",
+                status=GeocodeQuality.EXACT,
+                longitude=-84.0,
+                latitude=33.0,
+                matched_address=None,
+                match_confidence=1.0,
+                raw_response={},
+            )
+            for voter_id in response
+        ]
+        return service
+
+    def _voters(self, count):
+        """Build mock voters with registration numbers 0..count-1."""
+        voters = []
+        for i in range(count):
+            voter = Mock(spec=Voter)
+            voter.voter_registration_number = str(i)
+            voters.append(voter)
+        return voters
+
+    def _run(self, service, voters, **kwargs):
+        """Run process_geocoding_service and return (stats, saved results)."""
+        saved = []
+        with (
+            patch("vote_match.processing.get_voters_for_geocoding", return_value=voters),
+            patch(
+                "vote_match.processing.save_geocode_results",
+                side_effect=lambda session, results: saved.extend(results),
+            ),
+        ):
+            stats = process_geocoding_service(Mock(spec=Session), service, **kwargs)
+        return stats, saved
+
+    @pytest.mark.parametrize(
+        ("voter_count", "batch_size", "workers", "failing_ids", "expected"),
+        [
+            (5, 2, 1, frozenset(), {"exact": 5}),
+            (5, 2, 2, frozenset(), {"exact": 5}),
+            (7, 2, 3, frozenset(), {"exact": 7}),
+            (4, 2, 2, frozenset({"0"}), {"exact": 2, "failed": 2}),
+        ],
+    )
+    def test_every_voter_saved_exactly_once(
+        self, voter_count, batch_size, workers, failing_ids, expected
+    ):
+        """Test that results from overlapping batches are each saved exactly once."""
+        service = self._service(failing_ids, delay=0.05)
+
+        stats, saved = self._run(
+            service,
+            self._voters(voter_count),
+            batch_size=batch_size,
+            max_concurrent_batches=workers,
+        )
+
+        assert Counter(result.voter_id for result in saved) == Counter(
+            str(i) for i in range(voter_count)
+        )
+        assert Counter(result.status.value for result in saved) == expected
+        assert stats["total"] == voter_count
+        assert {key: stats[key] for key in expected} == expected
+        assert 1 <= service.peak_in_flight <= workers
+        if workers > 1:
+            assert service.peak_in_flight > 1
+
+    def test_progress_callback_reports_done_and_total(self):
+        """Test that progress is reported up front and after every batch."""
+        progress = Mock()
+
+        self._run(self._service(), self._voters(5), batch_size=2, progress_callback=progress)
+
+        assert [c.args for c in progress.call_args_list] == [(0, 5), (2, 5), (4, 5), (5, 5)]
+
+    def test_retry_failed_keeps_previous_failures(self):
+        """Test that --retry-failed selects failed voters without deleting their history."""
+        session = Mock(spec=Session)
+        service = self._service()
+
+        with patch("vote_match.processing.get_voters_for_geocoding", return_value=[]) as mock_get:
+            process_geocoding_service(session, service, retry_failed=True)
+
+        session.execute.assert_not_called()
+        session.commit.assert_not_called()
+        assert mock_get.call_args.kwargs["retry_failed"] is True
+
+
+class TestGetVotersForGeocoding:
+    """Tests for get_voters_for_geocoding function."""
+
+    def _sql(self, **kwargs):
+        """Return the SQL get_voters_for_geocoding would run."""
+        captured = []
+
+        def fake_all(query):
+            captured.append(query)
+            return []
+
+        with patch("sqlalchemy.orm.Query.all", fake_all):
+            get_voters_for_geocoding(Session(), service_name="census", **kwargs)
+
+        return str(captured[0].statement.compile(dialect=postgresql.dialect()))
+
+    def test_retry_failed_ignores_this_services_failures(self):
+        """Test that a failed attempt by the service no longer excludes the voter."""
+        plain = self._sql(only_unmatched=True)
+        retry = self._sql(only_unmatched=True, retry_failed=True)
+
+        assert "geocode_results.status !=" not in plain
+        assert "geocode_results.status !=" in retry
+
+    def test_retry_failed_census_mode_ignores_failures(self):
+        """Test that in Census mode, voters with only failed results are selected again."""
+        plain = self._sql(only_unmatched=False)
+        retry = self._sql(only_unmatched=False, retry_failed=True)
+
+        assert "geocode_results.status !=" not in plain
+        assert "geocode_results.status !=" in retry
+
+
+class TestDeleteGeocodeResultsInBatches:
+    """Tests for delete_geocode_results_in_batches function."""
+
+    def test_deletes_until_a_short_batch(self):
+        """Test that batches are committed one by one and their counts summed."""
+        session = Mock(spec=Session)
+        session.execute.side_effect = [Mock(rowcount=n) for n in (10, 10, 4)]
+        progress = Mock()
+
+        deleted = delete_geocode_results_in_batches(
+            session,
+            service_name="census",
+            status="failed",
+            batch_size=10,
+            progress_callback=progress,
+        )
+
+        assert deleted == 24
+        assert session.execute.call_count == 3
+        assert session.commit.call_count == 3
+        assert [c.args[0] for c in progress.call_args_list] == [10, 10, 4]
+        sql = str(session.execute.call_args[0][0])
+        assert sql.startswith("DELETE FROM geocode_results")
+        assert "LIMIT" in sql
+
+    def test_nothing_to_delete_runs_one_statement(self):
+        """Test that an empty first batch ends the loop without progress updates."""
+        session = Mock(spec=Session)
+        session.execute.return_value = Mock(rowcount=0)
+        progress = Mock()
+
+        deleted = delete_geocode_results_in_batches(
+            session, service_name="census", batch_size=10, progress_callback=progress
+        )
+
+        assert deleted == 0
+        assert session.execute.call_count == 1
+        progress.assert_not_called()
+
+
+class TestCompareVoterDistricts:
+    """Tests for compare_voter_districts function."""
+
+    @staticmethod
+    def _row(mismatched=0, **details):
+        row = MagicMock(total=3, matched=1, mismatched=mismatched, no_district=1)
+        row.voter_id = None
+        for key, value in details.items():
+            setattr(row, key, value)
+        return row
+
+    def test_counts_come_from_sql_without_mismatch_details(self):
+        """Test that the counts row alone yields stats and no mismatches."""
+        session = Mock(spec=Session)
+        session.execute.return_value = iter([self._row()])
+
+        result = compare_voter_districts(session, limit=10)
+
+        assert result["stats"] == CompareStats(
+            total=3, matched=1, mismatched=0, no_location=0, no_district=1
+        )
+        assert list(result["mismatches"]) == []
+        assert session.execute.call_count == 1
+        assert session.execute.call_args[0][1] == {"limit": 10}
+
+    def test_mismatch_rows_become_records(self):
+        """Test that mismatched voters are streamed with name and address built."""
+        session = Mock(spec=Session)
+        rows = [
+            self._row(
+                mismatched=1,
+                voter_id="V1",
+                first_name="Ann",
+                middle_name=None,
+                last_name="Lee",
+                suffix=None,
+                residence_street_number="12",
+                residence_pre_direction=None,
+                residence_street_name="Main",
+                residence_street_type="St",
+                residence_post_direction=None,
+                residence_apt_unit_number=None,
+                residence_city="Macon",
+                residence_zipcode="31201",
+                registered_district="District 2",
+                spatial_district="3",
+            )
+        ]
+        session.execute.return_value = iter(rows)
+
+        result = compare_voter_districts(session)
+
+        assert result["stats"].mismatched == 1
+        (mismatch,) = list(result["mismatches"])
+        assert mismatch["voter_id"] == "V1"
+        assert mismatch["full_name"] == "Ann Lee"
+        assert mismatch["residence_full_address"] == "12 Main St, Macon 31201"
+        assert mismatch["expected_district"] == "3"
+
+
+class TestExportDistrictComparison:
+    """Tests for export_district_comparison function."""
+
+    @staticmethod
+    def _record(voter_id, **values):
+        record = dict.fromkeys(MISMATCH_EXPORT_FIELDS)
+        record.update(voter_id=voter_id, **values)
+        return record
+
+    def test_parquet_round_trip_keeps_types_and_nulls(self, tmp_path):
+        """Test that Parquet output is typed and NULLs stay distinct from empty strings."""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        output = tmp_path / "mismatches.parquet"
+        records = [
+            self._record(
+                "V1", birth_year="1980", geocode_confidence=0.95, middle_name="", last_name="Lee"
+            ),
+            self._record("V2", birth_year=None, geocode_confidence=None, middle_name=None),
+            self._record("V3", birth_year="19XX"),
+        ]
+
+        written = export_district_comparison(iter(records), output)
+
+        table = pq.read_table(output)
+        assert written == 3
+        assert table.num_rows == 3
+        assert table.schema.field("birth_year").type == pa.int32()
+        assert table.schema.field("geocode_confidence").type == pa.float64()
+        rows = table.to_pylist()
+        assert rows[0]["voter_id"] == "V1"
+        assert rows[0]["birth_year"] == 1980
+        assert rows[0]["geocode_confidence"] == 0.95
+        assert rows[0]["middle_name"] == ""
+        assert rows[0]["last_name"] == "Lee"
+        assert rows[1]["birth_year"] is None
+        assert rows[1]["geocode_confidence"] is None
+        assert rows[1]["middle_name"] is None
+        assert rows[2]["birth_year"] is None
+
+    def test_csv_writes_none_as_empty_field(self, tmp_path):
+        """Test that the CSV export still renders missing values as empty fields."""
+        output = tmp_path / "mismatches.csv"
+
+        written = export_district_comparison(
+            iter(
+                [
+                    self._record("V1", birth_year="1980", middle_name=None),
+                    self._record("V2", birth_year="19XX"),
+                ]
+            ),
+            output,
+        )
+
+        header, *rows = output.read_text().splitlines()
+        assert written == 2
+        assert header.startswith("voter_id,full_name,first_name")
+        values = [dict(zip(header.split(","), row.split(","))) for row in rows]
+        assert values[0]["birth_year"] == "1980"
+        assert values[0]["middle_name"] == ""
+        # Non-numeric birth years keep their raw text in CSV
+        assert values[1]["birth_year"] == "19XX"
+
+
+class TestUpdateVoterDistrictComparison:
+    """Tests for update_voter_district_comparison function."""
+
+    def test_clear_update_and_counts_in_one_transaction(self):
+        """Test that clearing, updating and counting share one commit."""
+        session = Mock(spec=Session)
+        clear_result = Mock(rowcount=5)
+        update_result = Mock()
+        update_result.one.return_value = Mock(updated=7, matched=4, mismatched=2, no_district=1)
+        session.execute.side_effect = [Mock(), clear_result, update_result]
+
+        stats = update_voter_district_comparison(session, clear_existing=True, limit=100)
+
+        assert stats == {
+            "total_compared": 7,
+            "matched": 4,
+            "mismatched": 2,
+            "no_district": 1,
+            "records_updated": 7,
+            "records_cleared": 5,
+        }
+        assert "synchronous_commit" in str(session.execute.call_args_list[0][0][0])
+        update_sql = str(session.execute.call_args_list[2][0][0])
+        assert "RETURNING" in update_sql and "FILTER" in update_sql
+        assert session.execute.call_args_list[2][0][1]["limit"] == 100
+        session.commit.assert_called_once()